@@ -1,89 +1,71 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.alert_history import AlertHistory, AlertType
 from models.caree import Caree
-from models.user import User
-from models.safe_zone import SafeZone
-from datetime import datetime, timedelta
+from services.alert_state import alert_state
+from services.geofence import geofence_engine
 from typing import Optional
 
 
-def create_alert(
-    db: Session, 
-    caree_id: int, 
-    alert_type: AlertType, 
-    message: str
-) -> AlertHistory:
-    """알림 기록 생성"""
-    alert = AlertHistory(
-        caree_id=caree_id,
-        alert_type=alert_type,
-        message=message
-    )
-    db.add(alert)
-    db.commit()
-    db.refresh(alert)
-    return alert
-
-
-def has_recent_alert(
-    db: Session, 
-    caree_id: int, 
-    alert_type: AlertType, 
-    minutes: int = 5
-) -> bool:
-    """최근 N분 내에 동일한 타입의 알림이 있는지 확인"""
-    cutoff_time = datetime.now() - timedelta(minutes=minutes)
-    
-    recent_alert = db.query(AlertHistory).filter(
+async def acknowledge_alerts(db: AsyncSession, caree_id: int, alert_type: AlertType) -> int:
+    """보호자 알림 확인: 기록을 확인 처리하고 cooldown을 해제"""
+    # 아직 버퍼에 있는 알림 기록도 확인 처리되도록 먼저 저장
+    await alert_state.flush()
+    result = await db.execute(update(AlertHistory).where(
         AlertHistory.caree_id == caree_id,
         AlertHistory.alert_type == alert_type,
-        AlertHistory.is_acknowledged == False,
-        AlertHistory.created_at >= cutoff_time
-    ).first()
-    
-    return recent_alert is not None
+        AlertHistory.is_acknowledged == False
+    ).values(is_acknowledged=True))
+    await db.commit()
+    await alert_state.acknowledge(caree_id, alert_type)
+    return result.rowcount
 
 
+async def _get_caree_name(db: AsyncSession, caree_id: int, caree_name: Optional[str]) -> Optional[str]:
+    if caree_name is not None:
+        return caree_name
+    caree = await db.get(Caree, caree_id)
+    return caree.name if caree else None
 
 
-def create_geofence_breach_alert(db: Session, caree_id: int) -> Optional[AlertHistory]:
-    """이탈 알림 생성"""
-    
-    # 중복 알림 방지: 최근 5분 내에 동일한 알림이 있으면 스킵
-    if has_recent_alert(db, caree_id, AlertType.geofence_breach, 5):
-        return None
-    
-    # 피보호자 정보 조회
-    caree = db.query(Caree).filter(Caree.caree_id == caree_id).first()
-    if not caree:
-        return None
+async def create_geofence_breach_alert(db: AsyncSession, caree_id: int, caree_name: Optional[str] = None) -> bool:
+    """이탈 알림 발생 여부 판정 및 기록 (알림을 보내야 하면 True)
+
+    caree_name을 넘기면 피보호자 조회를 생략합니다. 활성 안전구역은 지오펜스 캐시로 확인하고,
+    중복 판정은 Redis 알림 상태로 하므로 일반적인 경우 DB 조회가 없습니다.
+    """
     
-    # 안전구역이 활성화되어 있는지 확인
-    safe_zone = db.query(SafeZone).filter(
-        SafeZone.caree_id == caree_id,
-        SafeZone.is_active == True
-    ).first()
+    # 안전구역이 비활성화된 경우 알림을 생성하지 않음
+    if not await geofence_engine.get_active_zones(db, caree_id):
+        return False
     
-    if not safe_zone:
-        # 안전구역이 비활성화된 경우 알림을 생성하지 않음
-        return None
+    caree_name = await _get_caree_name(db, caree_id, caree_name)
+    if caree_name is None:
+        return False
     
-    message = f"{caree.name}님이 안전구역을 벗어났습니다."
+    # 중복 알림 방지: cooldown(기본 5분) 내에 확인되지 않은 동일 알림이 있으면 스킵
+    if not await alert_state.try_fire(caree_id, AlertType.geofence_breach):
+        return False
     
-    return create_alert(db, caree_id, AlertType.geofence_breach, message)
+    alert_state.record(caree_id, AlertType.geofence_breach, f"{caree_name}님이 안전구역을 벗어났습니다.")
+    return True
 
 
-def create_low_battery_alert(db: Session, caree_id: int, battery_level: int) -> Optional[AlertHistory]:
-    """배터리 부족 알림 생성"""
-    
-    # 중복 알림 방지: 최근 30분 내에 배터리 알림이 있으면 스킵
-    if has_recent_alert(db, caree_id, AlertType.low_battery, 30):
-        return None
+async def create_low_battery_alert(
+    db: AsyncSession,
+    caree_id: int,
+    battery_level: int,
+    caree_name: Optional[str] = None
+) -> bool:
+    """배터리 부족 알림 발생 여부 판정 및 기록 (알림을 보내야 하면 True)"""
     
-    caree = db.query(Caree).filter(Caree.caree_id == caree_id).first()
-    if not caree:
-        return None
+    caree_name = await _get_caree_name(db, caree_id, caree_name)
+    if caree_name is None:
+        return False
     
-    message = f"{caree.name}님의 워치 배터리가 {battery_level}%입니다."
+    # 중복 알림 방지: cooldown(기본 30분) 내에 배터리 알림이 있으면 스킵
+    if not await alert_state.try_fire(caree_id, AlertType.low_battery):
+        return False
     
-    return create_alert(db, caree_id, AlertType.low_battery, message)
\ No newline at end of file
+    alert_state.record(caree_id, AlertType.low_battery, f"{caree_name}님의 워치 배터리가 {battery_level}%입니다.")
+    return True
@@ -1,10 +1,15 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.caree import Caree
 from models.user_relationship import UserRelationship, RelationshipType
 from schema.caree import CareeCreateRequest, CareeUpdateRequest
+from services.geofence import geofence_engine
+from services.watch_identity import watch_identity_cache
+from services.home_snapshot import home_snapshot_store
+from services.alert_state import alert_state
 
 
-def create_caree(db: Session, caree_data: CareeCreateRequest, creator_user_id: str) -> Caree:
+async def create_caree(db: AsyncSession, caree_data: CareeCreateRequest, creator_user_id: str) -> Caree:
     caree = Caree(
         name=caree_data.name,
         gender=caree_data.gender,
@@ -13,8 +18,8 @@ def create_caree(db: Session, caree_data: CareeCreateRequest, creator_user_id: s
         created_by_user_id=creator_user_id
     )
     db.add(caree)
-    db.commit()
-    db.refresh(caree)
+    await db.commit()
+    await db.refresh(caree)
     
     relationship = UserRelationship(
         protector_user_id=creator_user_id,
@@ -22,44 +27,54 @@ def create_caree(db: Session, caree_data: CareeCreateRequest, creator_user_id: s
         relationship_type=RelationshipType.primary
     )
     db.add(relationship)
-    db.commit()
+    await db.commit()
+    await home_snapshot_store.invalidate(creator_user_id)
     
     return caree
 
 
-def get_caree_by_id(db: Session, caree_id: int) -> Caree:
-    return db.query(Caree).filter(Caree.caree_id == caree_id).first()
+async def get_caree_by_id(db: AsyncSession, caree_id: int) -> Caree:
+    return await db.get(Caree, caree_id)
 
 
-def get_carees_by_user(db: Session, user_id: str) -> list[Caree]:
-    return db.query(Caree).filter(Caree.created_by_user_id == user_id).all()
+async def get_carees_by_user(db: AsyncSession, user_id: str) -> list[Caree]:
+    result = await db.execute(select(Caree).where(Caree.created_by_user_id == user_id))
+    return list(result.scalars().all())
 
 
-def delete_caree_by_user(db: Session, user_id: str) -> bool:
-    caree = db.query(Caree).filter(Caree.created_by_user_id == user_id).first()
+async def delete_caree_by_user(db: AsyncSession, user_id: str) -> bool:
+    result = await db.execute(select(Caree).where(Caree.created_by_user_id == user_id).limit(1))
+    caree = result.scalars().first()
     if caree:
         from models.registration_code import RegistrationCode
         from models.user_relationship import UserRelationship
         from models.safe_zone import SafeZone
         from models.care_settings import CareSettings
         from models.position_history import PositionHistory
+        from models.position_track import PositionTrack
         from models.alert_history import AlertHistory
         
-        db.query(RegistrationCode).filter(RegistrationCode.caree_id == caree.caree_id).delete()
-        db.query(UserRelationship).filter(UserRelationship.caree_id == caree.caree_id).delete()
-        db.query(SafeZone).filter(SafeZone.caree_id == caree.caree_id).delete()
-        db.query(CareSettings).filter(CareSettings.caree_id == caree.caree_id).delete()
-        db.query(PositionHistory).filter(PositionHistory.caree_id == caree.caree_id).delete()
-        db.query(AlertHistory).filter(AlertHistory.caree_id == caree.caree_id).delete()
+        await db.execute(delete(RegistrationCode).where(RegistrationCode.caree_id == caree.caree_id))
+        await db.execute(delete(UserRelationship).where(UserRelationship.caree_id == caree.caree_id))
+        await db.execute(delete(SafeZone).where(SafeZone.caree_id == caree.caree_id))
+        await db.execute(delete(CareSettings).where(CareSettings.caree_id == caree.caree_id))
+        await db.execute(delete(PositionHistory).where(PositionHistory.caree_id == caree.caree_id))
+        await db.execute(delete(PositionTrack).where(PositionTrack.caree_id == caree.caree_id))
+        await db.execute(delete(AlertHistory).where(AlertHistory.caree_id == caree.caree_id))
         
-        db.delete(caree)
-        db.commit()
+        await db.delete(caree)
+        await db.commit()
+        await geofence_engine.invalidate(caree.caree_id)
+        await watch_identity_cache.invalidate(caree.caree_id)
+        await home_snapshot_store.invalidate(user_id)
+        await alert_state.reset(caree.caree_id)
         return True
     return False
 
 
-def update_caree(db: Session, caree_id: int, caree_data: CareeUpdateRequest, user_id: str) -> Caree:
-    caree = db.query(Caree).filter(Caree.caree_id == caree_id, Caree.created_by_user_id == user_id).first()
+async def update_caree(db: AsyncSession, caree_id: int, caree_data: CareeUpdateRequest, user_id: str) -> Caree:
+    result = await db.execute(select(Caree).where(Caree.caree_id == caree_id, Caree.created_by_user_id == user_id))
+    caree = result.scalars().first()
     if not caree:
         return None
     
@@ -67,6 +82,9 @@ def update_caree(db: Session, caree_id: int, caree_data: CareeUpdateRequest, use
     for field, value in update_data.items():
         setattr(caree, field, value)
     
-    db.commit()
-    db.refresh(caree)
+    await db.commit()
+    await db.refresh(caree)
+    # 이름/돌봄 등급 변경이 워치 응답과 알림에 반영되도록
+    await watch_identity_cache.invalidate(caree.caree_id)
+    await home_snapshot_store.update_caree(user_id, caree.caree_id, caree.name)
     return caree
\ No newline at end of file
@@ -1,19 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.fcm_token import FCMToken
 from typing import List, Optional
 
 
-def create_fcm_token(
-    db: Session, 
+async def get_fcm_token(db: AsyncSession, fcm_token: str) -> Optional[FCMToken]:
+    result = await db.execute(select(FCMToken).where(FCMToken.fcm_token == fcm_token))
+    return result.scalars().first()
+
+
+async def create_fcm_token(
+    db: AsyncSession, 
     user_id: str, 
     fcm_token: str, 
     device_type: str = None
 ) -> FCMToken:
     """FCM 토큰 생성 또는 업데이트"""
     # 기존 토큰이 있는지 확인
-    existing_token = db.query(FCMToken).filter(
-        FCMToken.fcm_token == fcm_token
-    ).first()
+    existing_token = await get_fcm_token(db, fcm_token)
     
     if existing_token:
         # 기존 토큰이 다른 사용자에게 할당되어 있다면 업데이트
@@ -21,15 +25,15 @@ def create_fcm_token(
             existing_token.user_id = user_id
             existing_token.device_type = device_type
             existing_token.is_active = True
-            db.commit()
-            db.refresh(existing_token)
+            await db.commit()
+            await db.refresh(existing_token)
             return existing_token
         else:
             # 같은 사용자의 토큰이면 활성화만
             existing_token.is_active = True
             existing_token.device_type = device_type
-            db.commit()
-            db.refresh(existing_token)
+            await db.commit()
+            await db.refresh(existing_token)
             return existing_token
     
     # 새 토큰 생성
@@ -40,88 +44,100 @@ def create_fcm_token(
         is_active=True
     )
     db.add(new_token)
-    db.commit()
-    db.refresh(new_token)
+    await db.commit()
+    await db.refresh(new_token)
     return new_token
 
 
-def get_user_fcm_tokens(db: Session, user_id: str) -> List[FCMToken]:
+async def get_user_fcm_tokens(db: AsyncSession, user_id: str) -> List[FCMToken]:
     """사용자의 모든 활성 FCM 토큰 조회"""
-    return db.query(FCMToken).filter(
+    result = await db.execute(select(FCMToken).where(
         FCMToken.user_id == user_id,
         FCMToken.is_active == True
-    ).all()
+    ))
+    return list(result.scalars().all())
+
+
+async def get_user_fcm_token(db: AsyncSession, user_id: str, fcm_token: str) -> Optional[FCMToken]:
+    """사용자 소유의 FCM 토큰 조회"""
+    result = await db.execute(select(FCMToken).where(
+        FCMToken.fcm_token == fcm_token,
+        FCMToken.user_id == user_id
+    ))
+    return result.scalars().first()
 
 
-def deactivate_fcm_token(db: Session, fcm_token: str) -> bool:
+async def deactivate_fcm_token(db: AsyncSession, fcm_token: str) -> bool:
     """FCM 토큰 비활성화"""
-    token = db.query(FCMToken).filter(FCMToken.fcm_token == fcm_token).first()
+    token = await get_fcm_token(db, fcm_token)
     if token:
         token.is_active = False
-        db.commit()
+        await db.commit()
         return True
     return False
 
 
-def delete_fcm_token(db: Session, fcm_token: str) -> bool:
+async def delete_fcm_token(db: AsyncSession, fcm_token: str) -> bool:
     """FCM 토큰 삭제"""
-    token = db.query(FCMToken).filter(FCMToken.fcm_token == fcm_token).first()
+    token = await get_fcm_token(db, fcm_token)
     if token:
-        db.delete(token)
-        db.commit()
+        await db.delete(token)
+        await db.commit()
         return True
     return False
 
 
-def update_device_type(
-    db: Session, 
+async def update_device_type(
+    db: AsyncSession, 
     fcm_token: str, 
     device_type: str
 ) -> Optional[FCMToken]:
     """디바이스 타입 업데이트"""
-    token = db.query(FCMToken).filter(FCMToken.fcm_token == fcm_token).first()
+    token = await get_fcm_token(db, fcm_token)
     if token:
         token.device_type = device_type
-        db.commit()
-        db.refresh(token)
+        await db.commit()
+        await db.refresh(token)
         return token
     return None
 
 
-def update_user_fcm_token(
-    db: Session, 
+async def update_user_fcm_token(
+    db: AsyncSession, 
     user_id: str, 
     new_fcm_token: str, 
     device_type: str = None
 ) -> FCMToken:
     """사용자의 기존 FCM 토큰을 새 토큰으로 업데이트"""
-    existing_token = db.query(FCMToken).filter(
+    result = await db.execute(select(FCMToken).where(
         FCMToken.user_id == user_id,
         FCMToken.is_active == True
-    ).order_by(FCMToken.updated_at.desc()).first()
+    ).order_by(FCMToken.updated_at.desc()).limit(1))
+    existing_token = result.scalars().first()
     
     if existing_token:
         # 기존 토큰 업데이트
         existing_token.fcm_token = new_fcm_token
         existing_token.device_type = device_type
         existing_token.is_active = True
-        db.commit()
-        db.refresh(existing_token)
+        await db.commit()
+        await db.refresh(existing_token)
         return existing_token
     else:
         # 새 토큰 생성
-        return create_fcm_token(db, user_id, new_fcm_token, device_type)
+        return await create_fcm_token(db, user_id, new_fcm_token, device_type)
 
 
-def delete_all_user_fcm_tokens(db: Session, user_id: str) -> int:
+async def delete_all_user_fcm_tokens(db: AsyncSession, user_id: str) -> int:
     """사용자의 모든 FCM 토큰 삭제"""
-    tokens = db.query(FCMToken).filter(FCMToken.user_id == user_id).all()
+    result = await db.execute(select(FCMToken).where(FCMToken.user_id == user_id))
+    tokens = result.scalars().all()
     
     count = len(tokens)
     for token in tokens:
-        db.delete(token)
+        await db.delete(token)
     
     if count > 0:
-        db.commit()
+        await db.commit()
     
     return count
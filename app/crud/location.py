@@ -1,50 +1,31 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.position_history import PositionHistory, PositionType
-from models.safe_zone import SafeZone
+from models.position_track import PositionTrack
 from schema.location import LocationUpdateRequest
-from typing import Optional
-import math
+from services.position_store import position_store
+from services.geofence import geofence_engine
+from typing import Optional, List
 from datetime import datetime
 
 
-def is_inside_safe_zone(latitude: float, longitude: float, caree_id: int, db: Session) -> bool:
-    safe_zones = db.query(SafeZone).filter(
-        SafeZone.caree_id == caree_id,
-        SafeZone.is_active == True
-    ).all()
-    
-    for zone in safe_zones:
-        # 하버사인 공식
-        distance = calculate_distance(
-            latitude, longitude, 
-            float(zone.center_latitude), float(zone.center_longitude)
-        )
-        if distance <= zone.radius_meters:
-            return True
-    
-    return False
+async def is_inside_safe_zone(latitude: float, longitude: float, caree_id: int, db: AsyncSession) -> bool:
+    # 활성 안전구역은 지오펜스 엔진 캐시에서 조회 (변경 시 crud/safe_zone에서 무효화)
+    return await geofence_engine.is_inside(db, caree_id, latitude, longitude)
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    R = 6371000  
-    
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
-    
-    a = (math.sin(delta_lat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+async def update_protector_location(db: AsyncSession, user_id: str, location_data: LocationUpdateRequest) -> PositionHistory:
+    # 이동 경로는 append-only 저장소에 배치로 기록 (최신 위치는 PositionHistory 한 건으로 유지)
+    position_store.append(
+        PositionType.user,
+        location_data.latitude,
+        location_data.longitude,
+        user_id=user_id,
+        accuracy_meters=location_data.accuracy_meters,
+        battery_level=location_data.battery_level
+    )
     
-    return R * c
-
-
-def update_protector_location(db: Session, user_id: str, location_data: LocationUpdateRequest) -> PositionHistory:
-    existing_position = db.query(PositionHistory).filter(
-        PositionHistory.position_type == PositionType.user,
-        PositionHistory.user_id == user_id
-    ).first()
+    existing_position = await get_latest_protector_location(db, user_id)
     
     if existing_position:
         existing_position.latitude = location_data.latitude
@@ -52,8 +33,8 @@ def update_protector_location(db: Session, user_id: str, location_data: Location
         existing_position.accuracy_meters = location_data.accuracy_meters
         existing_position.battery_level = location_data.battery_level
         existing_position.recorded_at = datetime.now()
-        db.commit()
-        db.refresh(existing_position)
+        await db.commit()
+        await db.refresh(existing_position)
         return existing_position
     else:
         new_position = PositionHistory(
@@ -65,62 +46,75 @@ def update_protector_location(db: Session, user_id: str, location_data: Location
             battery_level=location_data.battery_level
         )
         db.add(new_position)
-        db.commit()
-        db.refresh(new_position)
+        await db.commit()
+        await db.refresh(new_position)
         return new_position
 
 
-def update_caree_location(db: Session, caree_id: int, location_data: LocationUpdateRequest) -> tuple[PositionHistory, bool]:
-    """피보호자 위치 업데이트 및 이탈 감지"""
-    current_inside_safe_zone = is_inside_safe_zone(location_data.latitude, location_data.longitude, caree_id, db)
-    geofence_breach = False
-    
-    existing_position = db.query(PositionHistory).filter(
-        PositionHistory.position_type == PositionType.caree,
-        PositionHistory.caree_id == caree_id
-    ).first()
-    
-    if existing_position:
-        #이탈 감지: 안전구역 내부 -> 외부
-        previous_inside_safe_zone = existing_position.is_inside_safe_zone
-        if previous_inside_safe_zone == True and current_inside_safe_zone == False:
-            geofence_breach = True
-        
-        # 위치 업데이트
-        existing_position.latitude = location_data.latitude
-        existing_position.longitude = location_data.longitude
-        existing_position.accuracy_meters = location_data.accuracy_meters
-        existing_position.battery_level = location_data.battery_level
-        existing_position.is_inside_safe_zone = current_inside_safe_zone
-        existing_position.recorded_at = datetime.now()
-        db.commit()
-        db.refresh(existing_position)
-        return existing_position, geofence_breach
-    else:
-        new_position = PositionHistory(
-            position_type=PositionType.caree,
-            caree_id=caree_id,
-            latitude=location_data.latitude,
-            longitude=location_data.longitude,
-            accuracy_meters=location_data.accuracy_meters,
-            battery_level=location_data.battery_level,
-            is_inside_safe_zone=current_inside_safe_zone
-        )
-        db.add(new_position)
-        db.commit()
-        db.refresh(new_position)
-        return new_position, False
+def to_local_naive(value: datetime) -> datetime:
+    """워치가 보낸 시각은 시간대가 붙어 올 수 있으므로 서버 기준(로컬, naive) 시각으로 변환
+
+    DateTime 컬럼은 naive 값을 저장하므로 비교와 저장 모두 이 값을 사용합니다.
+    """
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+
+def upsert_latest_caree_position(
+    db: AsyncSession,
+    caree_id: int,
+    location: LocationUpdateRequest,
+    is_inside_safe_zone: bool,
+    recorded_at: datetime,
+    existing_position: Optional[PositionHistory]
+) -> PositionHistory:
+    """피보호자 최신 위치 한 건을 갱신하거나 추가 (커밋은 호출 측에서 수행)
+
+    늦게 도착한 측정값(recorded_at이 저장된 최신 위치와 같거나 이전)은 최신 위치를 덮어쓰지 않고
+    기존 위치를 그대로 반환합니다. 이동 경로에는 호출 측에서 이미 기록됩니다.
+    """
+    recorded_at = to_local_naive(recorded_at)
+    if existing_position is not None and existing_position.recorded_at is not None \
+            and recorded_at <= to_local_naive(existing_position.recorded_at):
+        return existing_position
+    position = existing_position or PositionHistory(position_type=PositionType.caree, caree_id=caree_id)
+    position.latitude = location.latitude
+    position.longitude = location.longitude
+    position.accuracy_meters = location.accuracy_meters
+    position.battery_level = location.battery_level
+    position.is_inside_safe_zone = is_inside_safe_zone
+    position.recorded_at = recorded_at
+    if existing_position is None:
+        db.add(position)
+    return position
 
 
-def get_latest_protector_location(db: Session, user_id: str) -> Optional[PositionHistory]:
-    return db.query(PositionHistory).filter(
+async def get_latest_protector_location(db: AsyncSession, user_id: str) -> Optional[PositionHistory]:
+    result = await db.execute(select(PositionHistory).where(
         PositionHistory.position_type == PositionType.user,
         PositionHistory.user_id == user_id
-    ).first()
+    ).limit(1))
+    return result.scalars().first()
 
 
-def get_latest_caree_location(db: Session, caree_id: int) -> Optional[PositionHistory]:
-    return db.query(PositionHistory).filter(
+async def get_latest_caree_location(db: AsyncSession, caree_id: int) -> Optional[PositionHistory]:
+    result = await db.execute(select(PositionHistory).where(
         PositionHistory.position_type == PositionType.caree,
         PositionHistory.caree_id == caree_id
-    ).first()
\ No newline at end of file
+    ).limit(1))
+    return result.scalars().first()
+
+
+async def get_caree_track(
+    db: AsyncSession, 
+    caree_id: int, 
+    start_time: datetime, 
+    end_time: Optional[datetime] = None
+) -> List[PositionTrack]:
+    """피보호자 이동 경로 조회 (recorded_at 범위로 파티션 프루닝)"""
+    end_time = end_time or datetime.now()
+    result = await db.execute(select(PositionTrack).where(
+        PositionTrack.caree_id == caree_id,
+        PositionTrack.recorded_at >= start_time,
+        PositionTrack.recorded_at < end_time
+    ).order_by(PositionTrack.recorded_at))
+    return list(result.scalars().all())
\ No newline at end of file
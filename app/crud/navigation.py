@@ -1,19 +1,38 @@
+import logging
+import time
+
 import httpx
+import numpy as np
+from fastapi import HTTPException
 from typing import Optional, Dict, Any, List
 from schema.navigation import NavigationRequest, NavigationError
 from utils.config import settings
+from utils.http_client import get_kakao_client
+from utils.metrics import track_external
+from utils.route_geometry import vertexes_to_pairs
+from services.route_cache import route_cache
+from services.single_flight import route_single_flight
+
+logger = logging.getLogger(__name__)
 
 class NavigationService:
-    def __init__(self):
-        self.base_url = "https://apis-navi.kakaomobility.com/v1/directions"
-        self.walking_base_url = "https://apis-navi.kakaomobility.com/affiliate/walking/v1/directions"
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # 클라이언트의 base_url 기준 상대 경로
+        self.base_url = "/v1/directions"
+        self.walking_base_url = "/affiliate/walking/v1/directions"
         self.api_key = settings.KAKAO_MOBILITY_API_KEY
+        self._client = client
         
-        print(f"카카오 모빌리티 API 키 설정 상태: {'설정됨' if self.api_key else '설정되지 않음'}")  # 디버깅용 로그
+        logger.info(f"카카오 모빌리티 API 키 설정 상태: {'설정됨' if self.api_key else '설정되지 않음'}")
         
         if not self.api_key:
             raise ValueError("KAKAO_MOBILITY_API_KEY 환경변수가 설정되지 않았습니다.")
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 앱 전체에서 공유하는 커넥션 풀 (요청마다 TCP/TLS 핸드셰이크를 하지 않도록)
+        return self._client or get_kakao_client()
+    
     def process_vertexes(self, vertexes: List[float]) -> List[List[float]]:
         """
         vertexes 배열을 2개씩 묶어서 [경도, 위도] 형태로 변환합니다.
@@ -24,15 +43,7 @@ class NavigationService:
         Returns:
             [[경도1, 위도1], [경도2, 위도2], ...] 형태의 배열
         """
-        if not vertexes or len(vertexes) % 2 != 0:
-            return []
-        
-        processed_vertexes = []
-        for i in range(0, len(vertexes), 2):
-            if i + 1 < len(vertexes):
-                processed_vertexes.append([vertexes[i], vertexes[i + 1]])
-        
-        return processed_vertexes
+        return vertexes_to_pairs(vertexes).tolist()
     
     def process_sections(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -42,16 +53,34 @@ class NavigationService:
         if not sections:
             return sections
         
+        # vertexes를 가진 section/road를 모두 모아 한 번에 변환
+        containers = []
         for section in sections:
-            # 직접적인 vertexes 처리
             if 'vertexes' in section and isinstance(section['vertexes'], list):
-                section['vertexes'] = self.process_vertexes(section['vertexes'])
-            
-            # roads 안의 vertexes 처리
+                containers.append(section)
             if 'roads' in section and isinstance(section['roads'], list):
-                for road in section['roads']:
-                    if 'vertexes' in road and isinstance(road['vertexes'], list):
-                        road['vertexes'] = self.process_vertexes(road['vertexes'])
+                containers.extend(
+                    road for road in section['roads']
+                    if 'vertexes' in road and isinstance(road['vertexes'], list)
+                )
+        
+        # 형식이 맞지 않는(홀수 길이) 배열은 기존과 같이 빈 배열로 처리
+        valid = [container for container in containers if len(container['vertexes']) % 2 == 0]
+        for container in containers:
+            if len(container['vertexes']) % 2 != 0:
+                container['vertexes'] = []
+        if not valid:
+            return sections
+        
+        lengths = [len(container['vertexes']) // 2 for container in valid]
+        flat = []
+        for container in valid:
+            flat += container['vertexes']
+        pairs = np.asarray(flat, dtype=np.float64).reshape(-1, 2).tolist()
+        offset = 0
+        for container, length in zip(valid, lengths):
+            container['vertexes'] = pairs[offset:offset + length]
+            offset += length
         
         return sections
     
@@ -62,13 +91,50 @@ class NavigationService:
         if not routes:
             return routes
         
-        for route in routes:
-            if 'sections' in route and isinstance(route['sections'], list):
-                route['sections'] = self.process_sections(route['sections'])
+        # 모든 route의 sections를 한 번에 처리
+        sections = [
+            section
+            for route in routes
+            if 'sections' in route and isinstance(route['sections'], list)
+            for section in route['sections']
+        ]
+        self.process_sections(sections)
         
         return routes
 
     async def get_route(self, request: NavigationRequest) -> Dict[str, Any]:
+        """
+        자동차 경로를 검색합니다. 스냅한 좌표 기준으로 캐시된 결과가 있으면 API를 호출하지 않습니다.
+        """
+        return await self._cached_lookup("car", request, self._request_route)
+    
+    async def get_walking_route(self, request: NavigationRequest) -> Dict[str, Any]:
+        """
+        도보 경로를 검색합니다. 스냅한 좌표 기준으로 캐시된 결과가 있으면 API를 호출하지 않습니다.
+        """
+        return await self._cached_lookup("walking", request, self._request_walking_route)
+    
+    async def _cached_lookup(self, mode: str, request, fetch) -> Dict[str, Any]:
+        """
+        캐시 조회 후 미스이면 동일 요청을 하나로 합쳐(single-flight) API를 호출하고 결과를 캐시합니다.
+        """
+        cache_key = route_cache.make_key(mode, request)
+        if not cache_key:
+            return await fetch(request)
+        
+        cached = await route_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        async def fetch_and_store() -> Dict[str, Any]:
+            result = await fetch(request)
+            # 다른 워커의 대기자가 조회할 수 있도록 락 해제 전에 저장
+            await route_cache.set(cache_key, result)
+            return result
+        
+        return await route_single_flight.do(cache_key, fetch_and_store, lambda: route_cache.peek(cache_key))
+
+    async def _request_route(self, request: NavigationRequest) -> Dict[str, Any]:
         """
         카카오 모빌리티 API를 사용하여 경로를 검색합니다.
         """
@@ -93,68 +159,65 @@ class NavigationService:
             params["waypoints"] = request.waypoints
         
         try:
-            print(f"카카오 API 요청 URL: {self.base_url}")  # 디버깅용 로그
-            print(f"카카오 API 요청 헤더: {headers}")  # 디버깅용 로그
-            print(f"카카오 API 요청 파라미터: {params}")  # 디버깅용 로그
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
+            started = time.perf_counter()
+            with track_external("kakao", "directions"):
+                response = await self.client.get(
                     self.base_url,
                     headers=headers,
                     params=params
                 )
+            
+            logger.debug(
+                f"카카오 API 응답 {response.status_code} ({(time.perf_counter() - started) * 1000:.0f}ms) "
+                f"{self.base_url} params={params}"
+            )
+            
+            if response.status_code == 200:
+                response_data = response.json()
                 
-                print(f"카카오 API 응답 상태 코드: {response.status_code}")  # 디버깅용 로그
-                print(f"카카오 API 응답 헤더: {response.headers}")  # 디버깅용 로그
-                
-                if response.status_code == 200:
-                    response_data = response.json()
-                    print(f"카카오 API 응답 데이터: {response_data}")  # 디버깅용 로그
-                    
-                    # 응답 데이터 구조 검증 및 변환
-                    try:
-                        # 카카오 API 응답 구조에 맞게 데이터 변환
-                        if 'routes' in response_data and response_data['routes']:
-                            # routes가 비어있지 않은 경우
-                            for route in response_data['routes']:
-                                if 'sections' in route and route['sections']:
-                                    # sections 정보가 있는 경우 distance, duration 계산
-                                    total_distance = 0
-                                    total_duration = 0
-                                    for section in route['sections']:
-                                        if 'distance' in section:
-                                            total_distance += section.get('distance', 0)
-                                        if 'duration' in section:
-                                            total_duration += section.get('duration', 0)
-                                    
-                                    route['distance'] = total_distance
-                                    route['duration'] = total_duration
-                            
-                            # vertexes 전처리만 적용 (응답 구조 변환 제거)
-                            if 'routes' in response_data:
-                                response_data['routes'] = self.process_routes(response_data['routes'])
+                # 응답 데이터 구조 검증 및 변환
+                try:
+                    # 카카오 API 응답 구조에 맞게 데이터 변환
+                    if 'routes' in response_data and response_data['routes']:
+                        # routes가 비어있지 않은 경우
+                        for route in response_data['routes']:
+                            if 'sections' in route and route['sections']:
+                                # sections 정보가 있는 경우 distance, duration 계산
+                                total_distance = 0
+                                total_duration = 0
+                                for section in route['sections']:
+                                    if 'distance' in section:
+                                        total_distance += section.get('distance', 0)
+                                    if 'duration' in section:
+                                        total_duration += section.get('duration', 0)
+                                
+                                route['distance'] = total_distance
+                                route['duration'] = total_duration
                         
-                        # 카카오 API 응답을 그대로 반환 (vertexes 전처리만 적용)
-                        return response_data
-                    except Exception as parse_error:
-                        print(f"응답 파싱 오류: {parse_error}")  # 디버깅용 로그
-                        print(f"원본 응답 데이터: {response_data}")  # 디버깅용 로그
-                        # 파싱 실패 시 원본 데이터로 응답 생성
-                        return response_data
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('message', '알 수 없는 오류')
-                        print(f"카카오 API 오류 응답: {error_data}")  # 디버깅용 로그
-                    except:
-                        error_msg = f"HTTP {response.status_code}: {response.text}"
-                        print(f"카카오 API 오류 응답 (JSON 파싱 실패): {response.text}")  # 디버깅용 로그
-                    
-                    raise NavigationError(
-                        error_code=response.status_code,
-                        error_msg=f"API 요청 실패: {error_msg}"
-                    )
+                        # vertexes 전처리만 적용 (응답 구조 변환 제거)
+                        if 'routes' in response_data:
+                            response_data['routes'] = self.process_routes(response_data['routes'])
                     
+                    # 카카오 API 응답을 그대로 반환 (vertexes 전처리만 적용)
+                    return response_data
+                except Exception as parse_error:
+                    logger.warning(f"응답 파싱 오류: {parse_error}")
+                    # 파싱 실패 시 원본 데이터로 응답 생성
+                    return response_data
+            else:
+                try:
+                    error_data = response.json()
+                    error_msg = error_data.get('message', '알 수 없는 오류')
+                    logger.warning(f"카카오 API 오류 응답 {response.status_code}: {error_data}")
+                except:
+                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                    logger.warning(f"카카오 API 오류 응답 {response.status_code} (JSON 파싱 실패): {response.text[:500]}")
+                
+                raise NavigationError(
+                    error_code=response.status_code,
+                    error_msg=f"API 요청 실패: {error_msg}"
+                )
+                
         except httpx.TimeoutException:
             raise NavigationError(
                 error_code=408,
@@ -171,7 +234,7 @@ class NavigationService:
                 error_msg=f"예상치 못한 오류: {str(e)}"
             )
     
-    async def get_walking_route(self, request: NavigationRequest) -> Dict[str, Any]:
+    async def _request_walking_route(self, request: NavigationRequest) -> Dict[str, Any]:
         """
         카카오 모빌리티 도보 길찾기 API를 사용하여 보행자 경로를 검색합니다.
         """
@@ -197,68 +260,65 @@ class NavigationService:
             params["default_speed"] = request.default_speed
         
         try:
-            print(f"카카오 도보 API 요청 URL: {self.walking_base_url}")  # 디버깅용 로그
-            print(f"카카오 도보 API 요청 헤더: {headers}")  # 디버깅용 로그
-            print(f"카카오 도보 API 요청 파라미터: {params}")  # 디버깅용 로그
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
+            started = time.perf_counter()
+            with track_external("kakao", "walking_directions"):
+                response = await self.client.get(
                     self.walking_base_url,
                     headers=headers,
                     params=params
                 )
+            
+            logger.debug(
+                f"카카오 도보 API 응답 {response.status_code} ({(time.perf_counter() - started) * 1000:.0f}ms) "
+                f"{self.walking_base_url} params={params}"
+            )
+            
+            if response.status_code == 200:
+                response_data = response.json()
                 
-                print(f"카카오 도보 API 응답 상태 코드: {response.status_code}")  # 디버깅용 로그
-                print(f"카카오 도보 API 응답 헤더: {response.headers}")  # 디버깅용 로그
-                
-                if response.status_code == 200:
-                    response_data = response.json()
-                    print(f"카카오 도보 API 응답 데이터: {response_data}")  # 디버깅용 로그
-                    
-                    # 응답 데이터 구조 검증 및 변환
-                    try:
-                        # 카카오 도보 API 응답 구조에 맞게 데이터 변환
-                        if 'routes' in response_data and response_data['routes']:
-                            # routes가 비어있지 않은 경우
-                            for route in response_data['routes']:
-                                if 'sections' in route and route['sections']:
-                                    # sections 정보가 있는 경우 distance, duration 계산
-                                    total_distance = 0
-                                    total_duration = 0
-                                    for section in route['sections']:
-                                        if 'distance' in section:
-                                            total_distance += section.get('distance', 0)
-                                        if 'duration' in section:
-                                            total_duration += section.get('duration', 0)
-                                    
-                                    route['distance'] = total_distance
-                                    route['duration'] = total_duration
-                            
-                            # vertexes 전처리만 적용 (응답 구조 변환 제거)
-                            if 'routes' in response_data:
-                                response_data['routes'] = self.process_routes(response_data['routes'])
+                # 응답 데이터 구조 검증 및 변환
+                try:
+                    # 카카오 도보 API 응답 구조에 맞게 데이터 변환
+                    if 'routes' in response_data and response_data['routes']:
+                        # routes가 비어있지 않은 경우
+                        for route in response_data['routes']:
+                            if 'sections' in route and route['sections']:
+                                # sections 정보가 있는 경우 distance, duration 계산
+                                total_distance = 0
+                                total_duration = 0
+                                for section in route['sections']:
+                                    if 'distance' in section:
+                                        total_distance += section.get('distance', 0)
+                                    if 'duration' in section:
+                                        total_duration += section.get('duration', 0)
+                                
+                                route['distance'] = total_distance
+                                route['duration'] = total_duration
                         
-                        # 카카오 API 응답을 그대로 반환 (vertexes 전처리만 적용)
-                        return response_data
-                    except Exception as parse_error:
-                        print(f"응답 파싱 오류: {parse_error}")  # 디버깅용 로그
-                        print(f"원본 응답 데이터: {response_data}")  # 디버깅용 로그
-                        # 파싱 실패 시 원본 데이터로 응답 생성
-                        return response_data
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('message', '알 수 없는 오류')
-                        print(f"카카오 도보 API 오류 응답: {error_data}")  # 디버깅용 로그
-                    except:
-                        error_msg = f"HTTP {response.status_code}: {response.text}"
-                        print(f"카카오 도보 API 오류 응답 (JSON 파싱 실패): {response.text}")  # 디버깅용 로그
-                    
-                    raise NavigationError(
-                        error_code=response.status_code,
-                        error_msg=f"도보 API 요청 실패: {error_msg}"
-                    )
+                        # vertexes 전처리만 적용 (응답 구조 변환 제거)
+                        if 'routes' in response_data:
+                            response_data['routes'] = self.process_routes(response_data['routes'])
                     
+                    # 카카오 API 응답을 그대로 반환 (vertexes 전처리만 적용)
+                    return response_data
+                except Exception as parse_error:
+                    logger.warning(f"응답 파싱 오류: {parse_error}")
+                    # 파싱 실패 시 원본 데이터로 응답 생성
+                    return response_data
+            else:
+                try:
+                    error_data = response.json()
+                    error_msg = error_data.get('message', '알 수 없는 오류')
+                    logger.warning(f"카카오 도보 API 오류 응답 {response.status_code}: {error_data}")
+                except:
+                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                    logger.warning(f"카카오 도보 API 오류 응답 {response.status_code} (JSON 파싱 실패): {response.text[:500]}")
+                
+                raise NavigationError(
+                    error_code=response.status_code,
+                    error_msg=f"도보 API 요청 실패: {error_msg}"
+                )
+                
         except httpx.TimeoutException:
             raise NavigationError(
                 error_code=408,
@@ -304,3 +364,17 @@ class NavigationService:
                     result[key.strip()] = value.strip()
         
         return result
+
+
+_navigation_service: Optional[NavigationService] = None
+
+
+def get_navigation_service() -> NavigationService:
+    """앱 전체에서 공유하는 NavigationService (라우트 의존성)"""
+    global _navigation_service
+    if _navigation_service is None:
+        try:
+            _navigation_service = NavigationService()
+        except ValueError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    return _navigation_service
@@ -1,22 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.caree import Caree, PairingStatus
 from models.registration_code import RegistrationCode
 from crud.registration_code import get_registration_code_by_code, mark_code_as_used
 from schema.pairing import WatchPairingRequest
+from services.watch_identity import watch_identity_cache
 from typing import Optional
 
 
-def pair_watch_with_caree(db: Session, pairing_data: WatchPairingRequest) -> Optional[Caree]:
+async def pair_watch_with_caree(db: AsyncSession, pairing_data: WatchPairingRequest) -> Optional[Caree]:
     """워치와 피보호자 페어링"""
     
-    code_record = get_registration_code_by_code(db, pairing_data.registration_code)
+    code_record = await get_registration_code_by_code(db, pairing_data.registration_code)
     if not code_record:
         return None
     
     if code_record.is_used:
         return None
 
-    caree = db.query(Caree).filter(Caree.caree_id == code_record.caree_id).first()
+    caree = await db.get(Caree, code_record.caree_id)
     if not caree:
         return None
     
@@ -27,22 +28,22 @@ def pair_watch_with_caree(db: Session, pairing_data: WatchPairingRequest) -> Opt
     caree.watch_device_token = pairing_data.watch_device_token
     caree.pairing_status = PairingStatus.paired
     
-    mark_code_as_used(db, pairing_data.registration_code)
+    await mark_code_as_used(db, pairing_data.registration_code)
     
-    db.commit()
-    db.refresh(caree)
+    await db.commit()
+    await db.refresh(caree)
     
     return caree
 
 
-def get_pairing_info_by_code(db: Session, registration_code: str) -> Optional[dict]:
+async def get_pairing_info_by_code(db: AsyncSession, registration_code: str) -> Optional[dict]:
     """등록코드로 페어링 정보 조회"""
     
-    code_record = get_registration_code_by_code(db, registration_code)
+    code_record = await get_registration_code_by_code(db, registration_code)
     if not code_record or code_record.is_used:
         return None
     
-    caree = db.query(Caree).filter(Caree.caree_id == code_record.caree_id).first()
+    caree = await db.get(Caree, code_record.caree_id)
     if not caree:
         return None
     
@@ -59,10 +60,10 @@ def get_pairing_info_by_code(db: Session, registration_code: str) -> Optional[di
     }
 
 
-def unpair_watch(db: Session, caree_id: int) -> bool:
+async def unpair_watch(db: AsyncSession, caree_id: int) -> bool:
     """워치 페어링 해제"""
     
-    caree = db.query(Caree).filter(Caree.caree_id == caree_id).first()
+    caree = await db.get(Caree, caree_id)
     if not caree:
         return False
     
@@ -70,5 +71,6 @@ def unpair_watch(db: Session, caree_id: int) -> bool:
     caree.watch_device_token = None
     caree.pairing_status = PairingStatus.pending
     
-    db.commit()
+    await db.commit()
+    await watch_identity_cache.invalidate(caree_id)
     return True
\ No newline at end of file
@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.registration_code import RegistrationCode
+from services.watch_identity import watch_identity_cache
 import secrets
 import string
 
@@ -8,13 +10,13 @@ def generate_registration_code() -> str:
     return ''.join(secrets.choice(string.digits) for _ in range(6))
 
 
-def create_registration_code(db: Session, caree_id: int) -> str:
-    existing_code = db.query(RegistrationCode).filter(RegistrationCode.caree_id == caree_id).first()
+async def create_registration_code(db: AsyncSession, caree_id: int) -> str:
+    existing_code = await get_registration_code_by_caree_id(db, caree_id)
     if existing_code:
-        db.delete(existing_code)
+        await db.delete(existing_code)
     registration_code = generate_registration_code()
 
-    while db.query(RegistrationCode).filter(RegistrationCode.registration_code == registration_code).first():
+    while await get_registration_code_by_code(db, registration_code):
         registration_code = generate_registration_code()
     
     code_record = RegistrationCode(
@@ -22,23 +24,27 @@ def create_registration_code(db: Session, caree_id: int) -> str:
         registration_code=registration_code
     )
     db.add(code_record)
-    db.commit()
+    await db.commit()
+    # 이전 등록코드로 캐시된 인증 정보 제거
+    await watch_identity_cache.invalidate(caree_id)
     
     return registration_code
 
 
-def get_registration_code_by_code(db: Session, code: str) -> RegistrationCode:
-    return db.query(RegistrationCode).filter(RegistrationCode.registration_code == code).first()
+async def get_registration_code_by_code(db: AsyncSession, code: str) -> RegistrationCode:
+    result = await db.execute(select(RegistrationCode).where(RegistrationCode.registration_code == code))
+    return result.scalars().first()
 
 
-def get_registration_code_by_caree_id(db: Session, caree_id: int) -> RegistrationCode:
-    return db.query(RegistrationCode).filter(RegistrationCode.caree_id == caree_id).first()
+async def get_registration_code_by_caree_id(db: AsyncSession, caree_id: int) -> RegistrationCode:
+    result = await db.execute(select(RegistrationCode).where(RegistrationCode.caree_id == caree_id).limit(1))
+    return result.scalars().first()
 
 
-def mark_code_as_used(db: Session, code: str) -> bool:
-    code_record = get_registration_code_by_code(db, code)
+async def mark_code_as_used(db: AsyncSession, code: str) -> bool:
+    code_record = await get_registration_code_by_code(db, code)
     if code_record and not code_record.is_used:
         code_record.is_used = True
-        db.commit()
+        await db.commit()
         return True
     return False
\ No newline at end of file
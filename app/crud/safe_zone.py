@@ -1,22 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.safe_zone import SafeZone
 from models.caree import Caree
 from schema.safe_zone import SafeZoneCreateRequest, SafeZoneUpdateRequest
-from typing import Optional
+from services.geofence import geofence_engine
+from services.home_snapshot import home_snapshot_store
+from typing import Optional, List
 
 
-def get_caree_by_user(db: Session, user_id: str) -> Optional[Caree]:
+async def get_caree_by_user(db: AsyncSession, user_id: str) -> Optional[Caree]:
     """보호자의 피보호자 조회"""
-    return db.query(Caree).filter(Caree.created_by_user_id == user_id).first()
+    result = await db.execute(select(Caree).where(Caree.created_by_user_id == user_id).limit(1))
+    return result.scalars().first()
 
 
-def create_safe_zone(db: Session, user_id: str, safe_zone_data: SafeZoneCreateRequest) -> Optional[SafeZone]:
-    """안전구역 생성 및 업데이트"""
-    caree = get_caree_by_user(db, user_id)
+async def create_safe_zone(db: AsyncSession, user_id: str, safe_zone_data: SafeZoneCreateRequest) -> Optional[SafeZone]:
+    """안전구역 생성 및 업데이트 (구역이 있으면 홈 화면에 표시되는 구역을 덮어씀)"""
+    caree = await get_caree_by_user(db, user_id)
     if not caree:
         return None
     
-    existing_zone = db.query(SafeZone).filter(SafeZone.caree_id == caree.caree_id).first()
+    existing_zone = await get_home_safe_zone(db, caree.caree_id)
     
     if existing_zone:
         existing_zone.zone_name = safe_zone_data.zone_name
@@ -24,8 +28,10 @@ def create_safe_zone(db: Session, user_id: str, safe_zone_data: SafeZoneCreateRe
         existing_zone.center_longitude = safe_zone_data.center_longitude
         existing_zone.radius_meters = safe_zone_data.radius_meters
         existing_zone.is_active = True
-        db.commit()
-        db.refresh(existing_zone)
+        await db.commit()
+        await db.refresh(existing_zone)
+        await geofence_engine.invalidate(caree.caree_id)
+        await _refresh_home_snapshot(db, user_id, caree.caree_id)
         return existing_zone
     else:
         new_zone = SafeZone(
@@ -37,23 +43,49 @@ def create_safe_zone(db: Session, user_id: str, safe_zone_data: SafeZoneCreateRe
             is_active=True
         )
         db.add(new_zone)
-        db.commit()
-        db.refresh(new_zone)
+        await db.commit()
+        await db.refresh(new_zone)
+        await geofence_engine.invalidate(caree.caree_id)
+        await _refresh_home_snapshot(db, user_id, caree.caree_id)
         return new_zone
 
 
-def get_safe_zone_by_user(db: Session, user_id: str) -> Optional[SafeZone]:
-    """보호자의 안전구역 조회"""
-    caree = get_caree_by_user(db, user_id)
+async def get_home_safe_zone(db: AsyncSession, caree_id: int) -> Optional[SafeZone]:
+    """홈 화면에 표시할 안전구역 (활성화된 것 우선, 없으면 가장 최근 것)"""
+    result = await db.execute(select(SafeZone).where(
+        SafeZone.caree_id == caree_id
+    ).order_by(desc(SafeZone.is_active), desc(SafeZone.safe_zone_id)).limit(1))
+    return result.scalars().first()
+
+
+async def _refresh_home_snapshot(db: AsyncSession, user_id: str, caree_id: int) -> None:
+    await home_snapshot_store.update_safe_zone(user_id, caree_id, await get_home_safe_zone(db, caree_id))
+
+
+async def get_safe_zone_by_user(db: AsyncSession, user_id: str, safe_zone_id: Optional[int] = None) -> Optional[SafeZone]:
+    """보호자의 안전구역 조회 (safe_zone_id가 없으면 홈 화면에 표시되는 구역)"""
+    caree = await get_caree_by_user(db, user_id)
     if not caree:
         return None
     
-    return db.query(SafeZone).filter(SafeZone.caree_id == caree.caree_id).first()
+    if safe_zone_id is None:
+        return await get_home_safe_zone(db, caree.caree_id)
+    
+    result = await db.execute(select(SafeZone).where(
+        SafeZone.safe_zone_id == safe_zone_id,
+        SafeZone.caree_id == caree.caree_id
+    ))
+    return result.scalars().first()
 
 
-def update_safe_zone(db: Session, user_id: str, safe_zone_data: SafeZoneUpdateRequest) -> Optional[SafeZone]:
+async def update_safe_zone(
+    db: AsyncSession,
+    user_id: str,
+    safe_zone_data: SafeZoneUpdateRequest,
+    safe_zone_id: Optional[int] = None
+) -> Optional[SafeZone]:
     """안전구역 업데이트"""
-    safe_zone = get_safe_zone_by_user(db, user_id)
+    safe_zone = await get_safe_zone_by_user(db, user_id, safe_zone_id)
     if not safe_zone:
         return None
     
@@ -68,29 +100,89 @@ def update_safe_zone(db: Session, user_id: str, safe_zone_data: SafeZoneUpdateRe
     if safe_zone_data.is_active is not None:
         safe_zone.is_active = safe_zone_data.is_active
     
-    db.commit()
-    db.refresh(safe_zone)
+    await db.commit()
+    await db.refresh(safe_zone)
+    await geofence_engine.invalidate(safe_zone.caree_id)
+    await _refresh_home_snapshot(db, user_id, safe_zone.caree_id)
     return safe_zone
 
 
-def delete_safe_zone(db: Session, user_id: str) -> bool:
-    """안전구역 삭제"""
-    safe_zone = get_safe_zone_by_user(db, user_id)
+async def delete_safe_zone(db: AsyncSession, user_id: str) -> bool:
+    """홈 화면에 표시되는 안전구역 삭제 (특정 구역은 delete_safe_zone_by_id)"""
+    safe_zone = await get_safe_zone_by_user(db, user_id)
     if not safe_zone:
         return False
     
-    db.delete(safe_zone)
-    db.commit()
+    caree_id = safe_zone.caree_id
+    await db.delete(safe_zone)
+    await db.commit()
+    await geofence_engine.invalidate(caree_id)
+    await _refresh_home_snapshot(db, user_id, caree_id)
     return True
 
 
-def toggle_safe_zone_active(db: Session, user_id: str) -> Optional[SafeZone]:
+async def toggle_safe_zone_active(db: AsyncSession, user_id: str, safe_zone_id: Optional[int] = None) -> Optional[SafeZone]:
     """안전구역 활성화/비활성화 토글"""
-    safe_zone = get_safe_zone_by_user(db, user_id)
+    safe_zone = await get_safe_zone_by_user(db, user_id, safe_zone_id)
     if not safe_zone:
         return None
     
     safe_zone.is_active = not safe_zone.is_active
-    db.commit()
-    db.refresh(safe_zone)
-    return safe_zone
\ No newline at end of file
+    await db.commit()
+    await db.refresh(safe_zone)
+    await geofence_engine.invalidate(safe_zone.caree_id)
+    await _refresh_home_snapshot(db, user_id, safe_zone.caree_id)
+    return safe_zone
+
+
+async def add_safe_zone(db: AsyncSession, user_id: str, safe_zone_data: SafeZoneCreateRequest) -> Optional[SafeZone]:
+    """안전구역 추가 (기존 구역을 덮어쓰지 않음)"""
+    caree = await get_caree_by_user(db, user_id)
+    if not caree:
+        return None
+    
+    new_zone = SafeZone(
+        caree_id=caree.caree_id,
+        zone_name=safe_zone_data.zone_name,
+        center_latitude=safe_zone_data.center_latitude,
+        center_longitude=safe_zone_data.center_longitude,
+        radius_meters=safe_zone_data.radius_meters,
+        is_active=True
+    )
+    db.add(new_zone)
+    await db.commit()
+    await db.refresh(new_zone)
+    await geofence_engine.invalidate(caree.caree_id)
+    await _refresh_home_snapshot(db, user_id, caree.caree_id)
+    return new_zone
+
+
+async def get_safe_zones_by_user(db: AsyncSession, user_id: str) -> List[SafeZone]:
+    """보호자의 피보호자에 등록된 모든 안전구역 조회"""
+    caree = await get_caree_by_user(db, user_id)
+    if not caree:
+        return []
+    
+    result = await db.execute(select(SafeZone).where(SafeZone.caree_id == caree.caree_id).order_by(SafeZone.safe_zone_id))
+    return list(result.scalars().all())
+
+
+async def delete_safe_zone_by_id(db: AsyncSession, user_id: str, safe_zone_id: int) -> bool:
+    """보호자 소유의 특정 안전구역 삭제"""
+    caree = await get_caree_by_user(db, user_id)
+    if not caree:
+        return False
+    
+    result = await db.execute(select(SafeZone).where(
+        SafeZone.safe_zone_id == safe_zone_id,
+        SafeZone.caree_id == caree.caree_id
+    ))
+    safe_zone = result.scalars().first()
+    if not safe_zone:
+        return False
+    
+    await db.delete(safe_zone)
+    await db.commit()
+    await geofence_engine.invalidate(caree.caree_id)
+    await _refresh_home_snapshot(db, user_id, caree.caree_id)
+    return True
\ No newline at end of file
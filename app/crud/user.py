@@ -1,30 +1,35 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import User
 from models.user_relationship import UserRelationship
-from passlib.context import CryptContext
 from schema.user import UserRegisterRequest
+from services.password_hasher import password_hasher
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
 
+async def verify_password(db: AsyncSession, user: User, plain_password: str) -> bool:
+    """비밀번호 검증, bcrypt 비용 설정이 바뀐 해시는 로그인 성공 시 다시 해시해서 저장"""
+    verified, new_hash = await password_hasher.verify_and_update(plain_password, user.password_hash)
+    if verified and new_hash is not None:
+        user.password_hash = new_hash
+        await db.commit()
+    return verified
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
 
+async def get_user_by_id(db: AsyncSession, user_id: str) -> User:
+    return await db.get(User, user_id)
 
-def get_user_by_id(db: Session, user_id: str) -> User:
-    return db.query(User).filter(User.user_id == user_id).first()
 
+async def get_user_by_phone(db: AsyncSession, phone_number: str) -> User:
+    result = await db.execute(select(User).where(User.phone_number == phone_number))
+    return result.scalars().first()
 
-def get_user_by_phone(db: Session, phone_number: str) -> User:
-    return db.query(User).filter(User.phone_number == phone_number).first()
 
-
-def create_user(db: Session, user_data: UserRegisterRequest) -> User:
-    hashed_password = get_password_hash(user_data.password)
+async def create_user(db: AsyncSession, user_data: UserRegisterRequest) -> User:
+    hashed_password = await get_password_hash(user_data.password)
     user = User(
         user_id=user_data.user_id,
         name=user_data.name,
@@ -32,13 +37,14 @@ def create_user(db: Session, user_data: UserRegisterRequest) -> User:
         password_hash=hashed_password
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
-def has_registered_caree(db: Session, user_id: str) -> bool:
-    relationship = db.query(UserRelationship).filter(
+async def has_registered_caree(db: AsyncSession, user_id: str) -> bool:
+    result = await db.execute(select(UserRelationship).where(
         UserRelationship.protector_user_id == user_id
-    ).first()
+    ).limit(1))
+    relationship = result.scalars().first()
     return relationship is not None
\ No newline at end of file
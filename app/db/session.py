@@ -1,16 +1,60 @@
+from typing import Tuple
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from utils.config import settings
 from utils.variable import *
 
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL_USER, pool_recycle=3600, pool_pre_ping=True)
+# 스키마 생성 등 동기 작업 전용 엔진 (가끔만 쓰므로 연결을 풀에 남기지 않음)
+engine = create_engine(SQLALCHEMY_DATABASE_URL_USER, poolclass=NullPool)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
+
+def get_async_database_url(url: str) -> str:
+    """동기 DB URL(mysql+mysqldb 등)을 비동기 드라이버 URL로 변환 (sqlite는 테스트용)"""
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()]).render_as_string(hide_password=False)
+
+
+def pool_limits(workers: int, max_connections: int) -> Tuple[int, int]:
+    """워커 하나가 쓸 수 있는 연결 수를 상시 유지분(pool_size)과 순간 증가분(max_overflow)으로 나눔"""
+    per_worker = max(max_connections // max(workers, 1), 2)
+    pool_size = per_worker // 2
+    return pool_size, per_worker - pool_size
+
+
+POOL_SIZE, MAX_OVERFLOW = pool_limits(settings.WEB_CONCURRENCY, settings.DB_MAX_CONNECTIONS)
+if settings.DB_POOL_SIZE:
+    POOL_SIZE = int(settings.DB_POOL_SIZE)
+if settings.DB_MAX_OVERFLOW:
+    MAX_OVERFLOW = int(settings.DB_MAX_OVERFLOW)
+
+# 요청 처리용 비동기 엔진 (이벤트 루프를 블로킹하지 않음)
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL_USER),
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=3600,
+    pool_pre_ping=True
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
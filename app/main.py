@@ -1,11 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import os
 from fastapi_limiter import FastAPILimiter
-from redis.asyncio import Redis
 from contextlib import asynccontextmanager
-from db.session import engine
-from db.base import Base
+from db.session import async_engine
 from routes.user import router as user_router
 from routes.caree import router as caree_router
 from routes.location import router as location_router
@@ -14,16 +11,56 @@ from routes.navigation import router as navigation_router
 from routes.pairing import router as pairing_router
 from routes.fcm_token import router as fcm_token_router
 from routes.home import router as home_router
+from routes.alert import router as alert_router
+from routes.metrics import router as metrics_router
+from routes.health import router as health_router
+from routes.ops import router as ops_router
+from services.position_store import position_store
+from services.geofence import geofence_engine
+from services.watch_identity import watch_identity_cache
+from services.password_hasher import password_hasher
+from services.location_stream import location_stream
+from services.alert_state import alert_state
+from services.notification_queue import notification_dispatcher
+from services.startup import readiness, warm_up
+from utils.redis_client import get_redis
+from utils.http_client import close_kakao_client
+from utils.logging_config import setup_logging, LogContextMiddleware
+from utils.metrics import instrument_engine, MetricsMiddleware
+
+# 큐 기반 구조화 로깅 (종료 시 atexit에서 남은 로그 출력)
+setup_logging()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6378")
-    redis = Redis.from_url(redis_url, encoding="utf-8", decode_responses=True)
-    await FastAPILimiter.init(redis)
+    # 스키마 생성/마이그레이션은 배포 시 migrate.py로 한 번만 실행 (워커 기동 시 DB 스키마를 확인하지 않음)
+    redis = get_redis()
+    await warm_up()
+    async with readiness.phase("services"):
+        await FastAPILimiter.init(redis)
+        await position_store.start()
+        await alert_state.start()
+        await geofence_engine.start(redis)
+        await watch_identity_cache.start(redis)
+        await location_stream.start(redis)
+        await notification_dispatcher.start(redis)
+    readiness.mark_ready()
     yield
+    readiness.mark_stopping()
+    await notification_dispatcher.stop()
+    await location_stream.stop()
+    await watch_identity_cache.stop()
+    await geofence_engine.stop()
+    await alert_state.stop()
+    await position_store.stop()
+    await close_kakao_client()
+    password_hasher.stop()
 
 app = FastAPI(lifespan=lifespan)
-Base.metadata.create_all(bind=engine)
+# 요청별 SQL 문 수/시간 집계 (로그 컨텍스트 안쪽에서 실행되어 경고 로그에 request_id가 남음)
+instrument_engine(async_engine.sync_engine)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(LogContextMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -40,7 +77,12 @@ app.include_router(navigation_router)
 app.include_router(pairing_router)
 app.include_router(fcm_token_router)
 app.include_router(home_router)
+app.include_router(alert_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
+app.include_router(ops_router)
 
 if __name__ == "__main__":
+    # 개발용 단일 프로세스 (코드 변경 시 자동 재시작). 운영은 server.py로 멀티 워커 실행
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=7777, reload=True)
\ No newline at end of file
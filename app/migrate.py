@@ -0,0 +1,59 @@
+"""
+DB 스키마 준비 (배포 시 앱 워커보다 먼저 한 번 실행)
+
+    cd app && python migrate.py
+    cd app && python migrate.py --partitions   # 3)만 실행 (매일 cron 등으로 예약 실행)
+
+1) 모델 기준으로 없는 테이블 생성 (create_all, 기존 테이블은 변경하지 않음)
+2) alembic upgrade head (인덱스 등 변경 이력 적용)
+3) PositionTrack 월 파티션 생성/만료 파티션 삭제 (Redis 락으로 한 곳에서만 실행)
+앱 워커는 스키마를 확인하지 않고 바로 기동하므로, 모델을 바꾸면 이 단계를 다시 실행합니다.
+워커는 파티션을 관리하지 않으므로 배포가 없어도 다음 달 파티션이 생기도록 3)을 주기적으로 실행합니다.
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+import models  # noqa: F401  모델 메타데이터 등록
+from db.base import Base
+from db.session import engine, async_engine
+from services.position_store import position_store
+from utils.redis_client import get_redis
+
+APP_DIR = Path(__file__).resolve().parent
+
+
+def alembic_config() -> Config:
+    config = Config(str(APP_DIR / "alembic.ini"))
+    # 실행 위치와 관계없이 app/migrations 사용
+    config.set_main_option("script_location", str(APP_DIR / "migrations"))
+    return config
+
+
+async def prepare_partitions() -> None:
+    try:
+        await position_store.maintain_partitions()
+    finally:
+        await async_engine.dispose()
+        await get_redis().aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--partitions", action="store_true", help="PositionTrack 파티션 관리만 실행")
+    args = parser.parse_args()
+
+    if not args.partitions:
+        Base.metadata.create_all(bind=engine)
+        print("테이블 생성 확인 완료")
+        command.upgrade(alembic_config(), "head")
+        print("마이그레이션 적용 완료")
+    asyncio.run(prepare_partitions())
+    print("PositionTrack 파티션 확인 완료")
+
+
+if __name__ == "__main__":
+    main()
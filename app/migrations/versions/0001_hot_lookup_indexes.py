@@ -0,0 +1,58 @@
+"""조회 빈도가 높은 쿼리용 복합 인덱스 추가
+
+Revision ID: 0001_hot_lookup_indexes
+Revises:
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001_hot_lookup_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ("idx_position_type_caree", "PositionHistory", ["position_type", "caree_id"]),
+    ("idx_position_type_user", "PositionHistory", ["position_type", "user_id"]),
+    ("idx_safe_zone_caree_active", "SafeZone", ["caree_id", "is_active"]),
+    ("idx_alert_caree_type_ack_created", "AlertHistory", ["caree_id", "alert_type", "is_acknowledged", "created_at"]),
+    ("idx_caree_created_by_user", "Caree", ["created_by_user_id"]),
+    ("idx_fcm_token_user_active", "fcm_tokens", ["user_id", "is_active"]),
+]
+
+
+def _index_names(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def _foreign_key_columns(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {column for fk in inspector.get_foreign_keys(table) for column in fk["constrained_columns"]}
+
+
+def upgrade() -> None:
+    # create_all로 이미 인덱스가 만들어진 DB에서도 안전하게 실행되도록 존재 여부 확인
+    for name, table, columns in INDEXES:
+        if name not in _index_names(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(INDEXES):
+        if name not in _index_names(table):
+            continue
+        # MySQL은 FK 컬럼을 선두로 하는 인덱스가 하나도 없으면 삭제를 거부하므로 단일 인덱스를 먼저 복구
+        leading_column = columns[0]
+        if leading_column in _foreign_key_columns(table):
+            fallback = f"idx_{table.lower()}_{leading_column}"
+            if fallback not in _index_names(table):
+                op.create_index(fallback, table, [leading_column])
+        op.drop_index(name, table_name=table)
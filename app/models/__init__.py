@@ -5,6 +5,7 @@ from .user_relationship import UserRelationship
 from .safe_zone import SafeZone
 from .care_settings import CareSettings
 from .position_history import PositionHistory
+from .position_track import PositionTrack
 from .alert_history import AlertHistory
 from .fcm_token import FCMToken
 
@@ -16,6 +17,7 @@ __all__ = [
     "SafeZone",
     "CareSettings",
     "PositionHistory",
+    "PositionTrack",
     "AlertHistory",
     "FCMToken"
 ]
\ No newline at end of file
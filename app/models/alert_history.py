@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Enum, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.base import Base
@@ -23,4 +23,9 @@ class AlertHistory(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계 설정
-    caree = relationship("Caree", back_populates="alert_histories")
\ No newline at end of file
+    caree = relationship("Caree", back_populates="alert_histories")
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_alert_caree_type_ack_created', 'caree_id', 'alert_type', 'is_acknowledged', 'created_at'),
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Date, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Enum, Date, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.base import Base
@@ -38,4 +38,9 @@ class Caree(Base):
     safe_zones = relationship("SafeZone", back_populates="caree")
     care_settings = relationship("CareSettings", back_populates="caree", uselist=False)
     position_histories = relationship("PositionHistory", back_populates="caree")
-    alert_histories = relationship("AlertHistory", back_populates="caree")
\ No newline at end of file
+    alert_histories = relationship("AlertHistory", back_populates="caree")
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_caree_created_by_user', 'created_by_user_id'),
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.base import Base
@@ -17,3 +17,8 @@ class FCMToken(Base):
     
     # 관계 설정
     user = relationship("User", back_populates="fcm_tokens")
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_fcm_token_user_active', 'user_id', 'is_active'),
+    )
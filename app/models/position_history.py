@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DECIMAL, DateTime, Float, Boolean, ForeignKey, String, Enum
+from sqlalchemy import Column, Integer, DECIMAL, DateTime, Float, Boolean, ForeignKey, String, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.base import Base
@@ -26,4 +26,10 @@ class PositionHistory(Base):
     
     # 관계 설정
     user = relationship("User", back_populates="position_histories")
-    caree = relationship("Caree", back_populates="position_histories")
\ No newline at end of file
+    caree = relationship("Caree", back_populates="position_histories")
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_position_type_caree', 'position_type', 'caree_id'),
+        Index('idx_position_type_user', 'position_type', 'user_id'),
+    )
\ No newline at end of file
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, BigInteger, DECIMAL, DateTime, Float, Boolean, String, Enum, Index
+from db.base import Base
+from models.position_history import PositionType
+
+
+class PositionTrack(Base):
+    """위치 이동 경로 (append-only)
+
+    PositionHistory는 사용자별 최신 위치 한 건만 유지하고, 모든 위치 기록은 이 테이블에 누적됩니다.
+    recorded_at 기준 월별 RANGE 파티션으로 관리되므로 파티션 키가 기본키에 포함되며,
+    MySQL 파티션 테이블은 외래키를 지원하지 않아 caree_id/user_id에 FK를 두지 않습니다.
+    """
+    __tablename__ = "PositionTrack"
+    
+    track_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    recorded_at = Column(DateTime, primary_key=True, nullable=False)
+    position_type = Column(Enum(PositionType), nullable=False)
+    user_id = Column(String(50), nullable=True)
+    caree_id = Column(Integer, nullable=True)
+    latitude = Column(DECIMAL(10, 7), nullable=False)
+    longitude = Column(DECIMAL(10, 7), nullable=False)
+    accuracy_meters = Column(Float, nullable=True)
+    battery_level = Column(Integer, nullable=True)
+    is_inside_safe_zone = Column(Boolean, nullable=True)
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_track_caree_recorded', 'caree_id', 'recorded_at'),
+        Index('idx_track_user_recorded', 'user_id', 'recorded_at'),
+    )
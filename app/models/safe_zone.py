@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DECIMAL, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from db.base import Base
 
@@ -15,4 +15,9 @@ class SafeZone(Base):
     is_active = Column(Boolean, default=True)
     
     # 관계 설정
-    caree = relationship("Caree", back_populates="safe_zones")
\ No newline at end of file
+    caree = relationship("Caree", back_populates="safe_zones")
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_safe_zone_caree_active', 'caree_id', 'is_active'),
+    )
\ No newline at end of file
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_db
+from crud.alert import acknowledge_alerts
+from crud.caree import get_carees_by_user
+from schema.alert import AlertAcknowledgeRequest, AlertAcknowledgeResponse
+from utils.auth import get_current_user_id
+
+router = APIRouter(prefix="/api/alert", tags=["alert"])
+
+
+@router.post("/acknowledge", response_model=AlertAcknowledgeResponse)
+async def acknowledge_alert(
+    request: AlertAcknowledgeRequest,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """보호자 알림 확인 (확인하지 않은 알림을 확인 처리하고, 다음 이벤트부터 cooldown 없이 다시 알림)"""
+    try:
+        carees = await get_carees_by_user(db, current_user_id)
+        if not carees:
+            return AlertAcknowledgeResponse(
+                success=False,
+                message="등록된 피보호자가 없습니다."
+            )
+        
+        acknowledged_count = 0
+        for caree in carees:
+            acknowledged_count += await acknowledge_alerts(db, caree.caree_id, request.alert_type)
+        
+        return AlertAcknowledgeResponse(
+            success=True,
+            message="알림을 확인했습니다.",
+            acknowledged_count=acknowledged_count
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"알림 확인 실패: {str(e)}"
+        )
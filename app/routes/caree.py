@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.caree import create_caree, get_carees_by_user, delete_caree_by_user, update_caree
 from crud.registration_code import create_registration_code, get_registration_code_by_caree_id
@@ -13,9 +13,9 @@ router = APIRouter(prefix="/api/caree", tags=["caree"])
 async def register_caree(
     caree_data: CareeCreateRequest,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    existing_carees = get_carees_by_user(db, current_user_id)
+    existing_carees = await get_carees_by_user(db, current_user_id)
     if existing_carees:
         return CareeCreateResponse(
             success=False,
@@ -23,9 +23,9 @@ async def register_caree(
         )
     
     try:
-        new_caree = create_caree(db, caree_data, current_user_id)
+        new_caree = await create_caree(db, caree_data, current_user_id)
         
-        registration_code = create_registration_code(db, new_caree.caree_id)
+        registration_code = await create_registration_code(db, new_caree.caree_id)
         
         return CareeCreateResponse(
             success=True,
@@ -44,10 +44,10 @@ async def register_caree(
 @router.get("/info", response_model=CareeResponse)
 async def get_my_caree(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        carees = get_carees_by_user(db, current_user_id)
+        carees = await get_carees_by_user(db, current_user_id)
         if not carees:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -55,7 +55,7 @@ async def get_my_caree(
             )
         
         caree = carees[0]
-        registration_code_record = get_registration_code_by_caree_id(db, caree.caree_id)
+        registration_code_record = await get_registration_code_by_caree_id(db, caree.caree_id)
         registration_code = registration_code_record.registration_code if registration_code_record else ""
         
         caree_dict = caree.__dict__.copy()
@@ -75,10 +75,10 @@ async def get_my_caree(
 @router.delete("/delete", response_model=CareeDeleteResponse)
 async def delete_my_caree(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        success = delete_caree_by_user(db, current_user_id)
+        success = await delete_caree_by_user(db, current_user_id)
         
         if success:
             return CareeDeleteResponse(
@@ -103,10 +103,10 @@ async def update_my_caree(
     caree_id: int,
     caree_data: CareeUpdateRequest,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        updated_caree = update_caree(db, caree_id, caree_data, current_user_id)
+        updated_caree = await update_caree(db, caree_id, caree_data, current_user_id)
         
         if not updated_caree:
             raise HTTPException(
@@ -114,7 +114,7 @@ async def update_my_caree(
                 detail="수정할 피보호자를 찾을 수 없습니다."
             )
         
-        registration_code_record = get_registration_code_by_caree_id(db, updated_caree.caree_id)
+        registration_code_record = await get_registration_code_by_caree_id(db, updated_caree.caree_id)
         registration_code = registration_code_record.registration_code if registration_code_record else ""
         
         caree_dict = updated_caree.__dict__.copy()
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.fcm_token import (
     create_fcm_token,
     get_user_fcm_tokens,
+    get_user_fcm_token,
     deactivate_fcm_token,
     delete_fcm_token,
     update_device_type
@@ -15,7 +16,6 @@ from schema.fcm_token import (
     FCMTokenListResponse
 )
 from utils.auth import get_current_user_id
-from models.fcm_token import FCMToken
 
 router = APIRouter(prefix="/api/fcm-token", tags=["fcm-token"])
 
@@ -24,11 +24,11 @@ router = APIRouter(prefix="/api/fcm-token", tags=["fcm-token"])
 async def register_fcm_token(
     token_data: FCMTokenCreate,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """FCM 토큰 등록"""
     try:
-        fcm_token = create_fcm_token(
+        fcm_token = await create_fcm_token(
             db=db,
             user_id=current_user_id,
             fcm_token=token_data.fcm_token,
@@ -47,11 +47,11 @@ async def register_fcm_token(
 @router.get("/my-tokens", response_model=FCMTokenListResponse)
 async def get_my_fcm_tokens(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """내 FCM 토큰 목록 조회"""
     try:
-        tokens = get_user_fcm_tokens(db, current_user_id)
+        tokens = await get_user_fcm_tokens(db, current_user_id)
         
         return FCMTokenListResponse(
             tokens=[FCMTokenResponse.from_orm(token) for token in tokens],
@@ -70,15 +70,12 @@ async def update_fcm_token(
     fcm_token: str,
     token_update: FCMTokenUpdate,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """FCM 토큰 업데이트"""
     try:
         # 토큰 소유자 확인
-        existing_token = db.query(FCMToken).filter(
-            FCMToken.fcm_token == fcm_token,
-            FCMToken.user_id == current_user_id
-        ).first()
+        existing_token = await get_user_fcm_token(db, current_user_id, fcm_token)
         
         if not existing_token:
             raise HTTPException(
@@ -87,7 +84,7 @@ async def update_fcm_token(
             )
         
         if token_update.device_type is not None:
-            updated_token = update_device_type(db, fcm_token, token_update.device_type)
+            updated_token = await update_device_type(db, fcm_token, token_update.device_type)
             return FCMTokenResponse.from_orm(updated_token)
         
         return FCMTokenResponse.from_orm(existing_token)
@@ -105,15 +102,12 @@ async def update_fcm_token(
 async def remove_fcm_token(
     fcm_token: str,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """FCM 토큰 삭제"""
     try:
         # 토큰 소유자 확인
-        existing_token = db.query(FCMToken).filter(
-            FCMToken.fcm_token == fcm_token,
-            FCMToken.user_id == current_user_id
-        ).first()
+        existing_token = await get_user_fcm_token(db, current_user_id, fcm_token)
         
         if not existing_token:
             raise HTTPException(
@@ -121,7 +115,7 @@ async def remove_fcm_token(
                 detail="FCM 토큰을 찾을 수 없습니다."
             )
         
-        success = delete_fcm_token(db, fcm_token)
+        success = await delete_fcm_token(db, fcm_token)
         
         if success:
             return {"message": "FCM 토큰이 성공적으로 삭제되었습니다."}
@@ -144,15 +138,12 @@ async def remove_fcm_token(
 async def deactivate_token(
     fcm_token: str,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """FCM 토큰 비활성화"""
     try:
         # 토큰 소유자 확인
-        existing_token = db.query(FCMToken).filter(
-            FCMToken.fcm_token == fcm_token,
-            FCMToken.user_id == current_user_id
-        ).first()
+        existing_token = await get_user_fcm_token(db, current_user_id, fcm_token)
         
         if not existing_token:
             raise HTTPException(
@@ -160,7 +151,7 @@ async def deactivate_token(
                 detail="FCM 토큰을 찾을 수 없습니다."
             )
         
-        success = deactivate_fcm_token(db, fcm_token)
+        success = await deactivate_fcm_token(db, fcm_token)
         
         if success:
             return {"message": "FCM 토큰이 비활성화되었습니다."}
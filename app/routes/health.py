@@ -0,0 +1,29 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from services.startup import readiness, check_dependencies
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz", include_in_schema=False)
+async def healthz():
+    """프로세스 생존 확인 (의존성은 확인하지 않으므로 DB 장애로 워커가 재시작되지 않음)"""
+    return {"status": "ok"}
+
+
+@router.get("/readyz", include_in_schema=False)
+async def readyz():
+    """기동이 끝났고 DB/Redis가 응답하면 200, 아니면 503 (로드밸런서 트래픽 수신 여부)"""
+    if not readiness.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting" if readiness.startup_seconds is None else "stopping", **readiness.stats()}
+        )
+
+    checks = await check_dependencies()
+    healthy = all(checks.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if healthy else "degraded", "checks": checks, **readiness.stats()}
+    )
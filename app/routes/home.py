@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select
 from db.session import get_db
 from crud.caree import get_carees_by_user
+from crud.safe_zone import get_home_safe_zone
 from models.user import User
-from models.safe_zone import SafeZone
 from models.position_history import PositionHistory, PositionType
 from schema.home import HomeInfoResponse
+from services.home_snapshot import home_snapshot_store
 from utils.auth import get_current_user_id
 
 router = APIRouter(prefix="/api/home", tags=["home"])
@@ -15,11 +16,19 @@ router = APIRouter(prefix="/api/home", tags=["home"])
 @router.get("/info", response_model=HomeInfoResponse)
 async def get_home_info(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
+        # 쓰기 경로에서 갱신되는 스냅샷이 있으면 DB 조회 없이 응답
+        snapshot = await home_snapshot_store.get(current_user_id)
+        if snapshot is not None:
+            return HomeInfoResponse(**snapshot)
+
+        # 조회 중 쓰기 경로에서 갱신되면 재구성한 스냅샷은 저장하지 않음
+        version = await home_snapshot_store.version(current_user_id)
+
         # 보호자 정보 조회
-        protector = db.query(User).filter(User.user_id == current_user_id).first()
+        protector = await db.get(User, current_user_id)
         if not protector:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -27,7 +36,7 @@ async def get_home_info(
             )
 
         # 피보호자 정보 조회
-        carees = get_carees_by_user(db, current_user_id)
+        carees = await get_carees_by_user(db, current_user_id)
         if not carees:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -37,31 +46,26 @@ async def get_home_info(
         caree = carees[0]
         
         # SafeZone 정보 조회 (활성화된 것 우선)
-        safe_zone = db.query(SafeZone).filter(
-            SafeZone.caree_id == caree.caree_id,
-            SafeZone.is_active == True
-        ).first()
-        
-        if not safe_zone:
-            # 활성화된 SafeZone이 없으면 가장 최근 것 조회
-            safe_zone = db.query(SafeZone).filter(
-                SafeZone.caree_id == caree.caree_id
-            ).order_by(desc(SafeZone.safe_zone_id)).first()
+        safe_zone = await get_home_safe_zone(db, caree.caree_id)
         
         # 피보호자의 최신 위치 정보 조회
-        latest_position = db.query(PositionHistory).filter(
+        result = await db.execute(select(PositionHistory).where(
             PositionHistory.caree_id == caree.caree_id,
             PositionHistory.position_type == PositionType.caree
-        ).order_by(desc(PositionHistory.recorded_at)).first()
+        ).order_by(desc(PositionHistory.recorded_at)).limit(1))
+        latest_position = result.scalars().first()
         
-        # 응답 데이터 구성
-        return HomeInfoResponse(
-            protector_name=protector.name,
-            caree_name=caree.name,
-            safe_zone_active=safe_zone.is_active if safe_zone else False,
-            caree_in_safe_zone=latest_position.is_inside_safe_zone if latest_position else None,
-            safe_zone_radius_meters=safe_zone.radius_meters if safe_zone else None
-        )
+        # 응답 데이터 구성 후 스냅샷 저장
+        snapshot = {
+            "protector_name": protector.name,
+            "caree_id": caree.caree_id,
+            "caree_name": caree.name,
+            "safe_zone_active": safe_zone.is_active if safe_zone else False,
+            "caree_in_safe_zone": latest_position.is_inside_safe_zone if latest_position else None,
+            "safe_zone_radius_meters": safe_zone.radius_meters if safe_zone else None
+        }
+        await home_snapshot_store.set(current_user_id, snapshot, version)
+        return HomeInfoResponse(**snapshot)
     
     except HTTPException:
         raise
@@ -69,4 +73,4 @@ async def get_home_info(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"홈 정보 조회 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
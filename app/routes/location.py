@@ -1,20 +1,35 @@
+import asyncio
+import json
+import logging
+import time
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_db, AsyncSessionLocal
 from crud.location import (
     update_protector_location, 
-    update_caree_location,
     get_latest_protector_location,
     get_latest_caree_location
 )
 from crud.caree import get_carees_by_user
-from crud.alert import create_geofence_breach_alert, create_low_battery_alert
-from services.fcm_service import FCMService
-from schema.location import LocationUpdateRequest, LocationUpdateResponse, LocationResponse, BothLocationResponse
-from utils.auth import get_current_user_id
+from services.location_ingest import ingest_caree_locations
+from schema.location import (
+    LocationUpdateRequest,
+    LocationUpdateResponse,
+    LocationResponse,
+    BothLocationResponse,
+    LocationBatchUpdateRequest,
+    LocationBatchUpdateResponse
+)
+from utils.auth import get_current_user_id, get_current_principal
+from services.token_verifier import Principal, token_verifier
+from utils.config import settings
 from utils.watch_auth import get_caree_from_registration_code
+from services.watch_identity import WatchIdentity
+from services.location_stream import location_stream, location_event
 from models.caree import Caree
-from models.safe_zone import SafeZone
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/location", tags=["location"])
 
@@ -23,11 +38,11 @@ router = APIRouter(prefix="/api/location", tags=["location"])
 async def update_protector_location_endpoint(
     location_data: LocationUpdateRequest,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """보호자 위치 업데이트"""
     try:
-        updated_location = update_protector_location(db, current_user_id, location_data)
+        updated_location = await update_protector_location(db, current_user_id, location_data)
         
         return LocationUpdateResponse(
             success=True,
@@ -36,6 +51,7 @@ async def update_protector_location_endpoint(
         )
     
     except Exception as e:
+        logger.exception(f"보호자 위치 업데이트 실패: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"보호자 위치 업데이트 실패: {str(e)}"
@@ -45,77 +61,77 @@ async def update_protector_location_endpoint(
 @router.post("/caree", response_model=LocationUpdateResponse)
 async def update_caree_location_endpoint(
     location_data: LocationUpdateRequest,
-    caree: Caree = Depends(get_caree_from_registration_code),
-    db: Session = Depends(get_db)
+    caree: WatchIdentity = Depends(get_caree_from_registration_code),
+    db: AsyncSession = Depends(get_db)
 ):
     """피보호자 위치 업데이트 및 알림 처리"""
     try:
-        updated_location, geofence_breach = update_caree_location(db, caree.caree_id, location_data)
+        result = await ingest_caree_locations(db, caree, [location_data])
+        logger.debug(
+            f"피보호자 {caree.caree_id} 위치 수신: {location_data.latitude}, {location_data.longitude} "
+            f"(배터리 {location_data.battery_level})"
+        )
         
-        # FCM 서비스 초기화 (파일이 없으면 스킵)
-        try:
-            fcm_service = FCMService()
-            
-            if geofence_breach:
-                # 안전구역이 활성화되어 있는지 확인
-                safe_zone = db.query(SafeZone).filter(
-                    SafeZone.caree_id == caree.caree_id,
-                    SafeZone.is_active == True
-                ).first()
-                
-                if safe_zone:
-                    # DB에 알림 기록 생성
-                    create_geofence_breach_alert(db, caree.caree_id)
-                    # FCM 푸시 알림 전송
-                    fcm_service.send_geofence_breach_notification(db, caree.caree_id, caree.name)
-                else:
-                    # 안전구역이 비활성화된 경우 알림 기록만 생성 (푸시 알림은 전송하지 않음)
-                    create_geofence_breach_alert(db, caree.caree_id)
-                    print(f"피보호자 {caree.caree_id}의 안전구역이 비활성화되어 있어 푸시 알림을 전송하지 않습니다.")
-            
-            if location_data.battery_level and location_data.battery_level <= 20:
-                # DB에 알림 기록 생성
-                create_low_battery_alert(db, caree.caree_id, location_data.battery_level)
-                # FCM 푸시 알림 전송
-                fcm_service.send_low_battery_notification(db, caree.caree_id, caree.name, location_data.battery_level)
-                
-        except Exception as e:
-            # FCM 서비스 초기화 실패 시 로그만 남기고 계속 진행
-            print(f"FCM 서비스 초기화 실패 (알림 기능 비활성화): {str(e)}")
-            # DB 알림은 정상적으로 생성
-            if geofence_breach:
-                create_geofence_breach_alert(db, caree.caree_id)
-            if location_data.battery_level and location_data.battery_level <= 20:
-                create_low_battery_alert(db, caree.caree_id, location_data.battery_level)
         return LocationUpdateResponse(
             success=True,
             message="피보호자 위치가 업데이트되었습니다.",
-            location=LocationResponse.from_orm(updated_location),
+            location=LocationResponse.from_orm(result.position),
             care_level=caree.care_level
         )
     
     except Exception as e:
+        logger.exception(f"피보호자 {caree.caree_id} 위치 업데이트 실패: {str(e)}")
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"피보호자 위치 업데이트 실패: {str(e)}"
         )
 
 
+@router.post("/caree/batch", response_model=LocationBatchUpdateResponse)
+async def update_caree_locations_batch_endpoint(
+    batch_data: LocationBatchUpdateRequest,
+    caree: WatchIdentity = Depends(get_caree_from_registration_code),
+    db: AsyncSession = Depends(get_db)
+):
+    """피보호자 위치 일괄 업데이트 (워치 오프라인 버퍼 업로드)"""
+    try:
+        locations = batch_data.locations
+        result = await ingest_caree_locations(db, caree, locations)
+        
+        return LocationBatchUpdateResponse(
+            success=True,
+            message=f"피보호자 위치 {len(locations)}건이 업데이트되었습니다.",
+            accepted_count=len(locations),
+            geofence_breach=result.geofence_breach,
+            location=LocationResponse.from_orm(result.position),
+            care_level=caree.care_level
+        )
+    
+    except Exception as e:
+        logger.exception(f"피보호자 {caree.caree_id} 위치 일괄 업데이트 실패: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"피보호자 위치 일괄 업데이트 실패: {str(e)}"
+        )
+
+
 @router.get("/both", response_model=BothLocationResponse)
 async def get_both_locations(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """보호자와 피보호자의 최신 위치 조회"""
     try:
         # 보호자 위치
-        protector_location = get_latest_protector_location(db, current_user_id)
+        protector_location = await get_latest_protector_location(db, current_user_id)
         
         # 피보호자 위치
-        carees = get_carees_by_user(db, current_user_id)
+        carees = await get_carees_by_user(db, current_user_id)
         caree_location = None
         if carees:
-            caree_location = get_latest_caree_location(db, carees[0].caree_id)
+            caree_location = await get_latest_caree_location(db, carees[0].caree_id)
         
         return BothLocationResponse(
             protector_location=LocationResponse.from_orm(protector_location) if protector_location else None,
@@ -126,4 +142,76 @@ async def get_both_locations(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"위치 조회 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+def _next_revocation_check(principal: Principal) -> float:
+    """다음 토큰 확인 시각 (time.monotonic 기준, 토큰 만료가 더 이르면 만료 시각)"""
+    delay = settings.LOCATION_STREAM_HEARTBEAT_SECONDS
+    if principal.expires_at is not None:
+        delay = min(delay, max(principal.expires_at - time.time(), 0))
+    return time.monotonic() + delay
+
+
+@router.get("/stream")
+async def stream_caree_locations(
+    principal: Principal = Depends(get_current_principal)
+):
+    """피보호자 위치 실시간 스트림 (Server-Sent Events)
+
+    연결 직후 피보호자별 최신 위치를 한 번 보내고, 이후에는 워치가 위치를 보낼 때마다
+    location 이벤트(안전구역 진입/이탈 시 transition 포함)를 보냅니다.
+    DB 세션은 연결을 여는 동안에만 사용하고 스트리밍 중에는 잡고 있지 않습니다.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            carees = await get_carees_by_user(db, principal.user_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"위치 스트림 연결 실패: {str(e)}"
+        )
+    
+    if not carees:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="등록된 피보호자가 없습니다."
+        )
+    caree_ids = [caree.caree_id for caree in carees]
+    
+    async def events():
+        # 구독을 먼저 등록한 뒤 최신 위치를 읽어서 그 사이의 위치 변경을 놓치지 않음
+        async with location_stream.subscribe(caree_ids) as queue:
+            async with AsyncSessionLocal() as db:
+                latest_positions = [await get_latest_caree_location(db, caree_id) for caree_id in caree_ids]
+            for position in latest_positions:
+                if position is not None:
+                    yield f"event: location\ndata: {json.dumps(location_event(position), ensure_ascii=False)}\n\n"
+            
+            # 위치 이벤트가 계속 들어와도 heartbeat 간격(또는 토큰 만료 시각)마다 폐기/만료 여부 확인
+            next_check = _next_revocation_check(principal)
+            while True:
+                data = None
+                timeout = next_check - time.monotonic()
+                if timeout > 0:
+                    try:
+                        data = await asyncio.wait_for(queue.get(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                
+                if time.monotonic() >= next_check:
+                    if await token_verifier.is_revoked(principal):
+                        yield "event: close\ndata: {\"reason\": \"token_expired\"}\n\n"
+                        return
+                    next_check = _next_revocation_check(principal)
+                    if data is None:
+                        yield ": ping\n\n"
+                
+                if data is not None:
+                    yield f"event: location\ndata: {data}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,107 @@
+import os
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from services.home_snapshot import home_snapshot_store
+from services.location_stream import location_stream
+from services.password_hasher import password_hasher
+from services.route_cache import route_cache
+from services.single_flight import route_single_flight
+from services.watch_identity import watch_identity_cache
+
+router = APIRouter(tags=["metrics"])
+
+
+class ServiceStatsCollector:
+    """서비스 싱글턴들이 이미 세고 있는 값을 스크레이프 시점에 읽어 내보냄
+
+    값은 스크레이프를 처리한 워커 기준이므로, 멀티 워커에서는 worker 라벨(pid)을 붙여 구분합니다.
+    """
+
+    def __init__(self, worker: Optional[str] = None):
+        self.worker = worker
+
+    def _labels(self, labels: List[str]) -> List[str]:
+        return labels + ["worker"] if self.worker else labels
+
+    def _values(self, values: List[str]) -> List[str]:
+        return values + [self.worker] if self.worker else values
+
+    def _gauge(self, name: str, documentation: str, value: float) -> GaugeMetricFamily:
+        gauge = GaugeMetricFamily(name, documentation, labels=self._labels([]))
+        gauge.add_metric(self._values([]), value)
+        return gauge
+
+    def _results(self, name: str, documentation: str, results: Dict[str, float]) -> CounterMetricFamily:
+        counter = CounterMetricFamily(name, documentation, labels=self._labels(["result"]))
+        for result, value in results.items():
+            counter.add_metric(self._values([result]), value)
+        return counter
+
+    def collect(self):
+        lookups = CounterMetricFamily("cache_lookups", "캐시 조회 결과", labels=self._labels(["cache", "result"]))
+        for cache, results in (
+            ("route", (("local_hit", route_cache.local_hits), ("redis_hit", route_cache.redis_hits), ("miss", route_cache.misses))),
+            ("watch_identity", (
+                ("local_hit", watch_identity_cache.local_hits),
+                ("redis_hit", watch_identity_cache.redis_hits),
+                ("miss", watch_identity_cache.misses)
+            )),
+            ("home_snapshot", (("redis_hit", home_snapshot_store.hits), ("miss", home_snapshot_store.misses))),
+        ):
+            for result, value in results:
+                lookups.add_metric(self._values([cache, result]), value)
+        yield lookups
+
+        route_stats = route_cache.stats()
+        yield self._gauge("route_cache_entries", "길찾기 로컬 캐시 항목 수", route_stats["size"])
+        evictions = CounterMetricFamily("route_cache_evictions", "길찾기 로컬 캐시 제거 수", labels=self._labels([]))
+        evictions.add_metric(self._values([]), route_stats["evictions"])
+        yield evictions
+
+        flight_stats = route_single_flight.stats()
+        yield self._gauge("route_single_flight_in_flight", "진행 중인 카카오 길찾기 요청 수", flight_stats["in_flight"])
+        yield self._results(
+            "route_single_flight_calls",
+            "길찾기 요청 합치기 결과",
+            {result: flight_stats[result] for result in ("leader_calls", "local_coalesced", "remote_coalesced", "wait_timeouts")}
+        )
+
+        hasher_stats = password_hasher.stats()
+        yield self._gauge("password_hash_pending", "비밀번호 해시 대기 작업 수", hasher_stats["pending"])
+        yield self._results(
+            "password_hash_jobs",
+            "비밀번호 해시 작업 결과",
+            {result: hasher_stats[result] for result in ("completed", "rejected", "rehashed")}
+        )
+
+        stream_stats = location_stream.stats()
+        yield self._gauge("location_stream_subscribers", "위치 스트림 연결 수", stream_stats["subscribers"])
+        yield self._results(
+            "location_stream_events",
+            "위치 스트림 이벤트 수",
+            {result: stream_stats[result] for result in ("published", "delivered", "dropped")}
+        )
+
+
+def _build_registry():
+    # server.py가 멀티 워커로 띄우면 워커별 지표 파일을 합산
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        REGISTRY.register(ServiceStatsCollector())
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(ServiceStatsCollector(worker=str(os.getpid())))
+    return registry
+
+
+metrics_registry = _build_registry()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return Response(generate_latest(metrics_registry), media_type=CONTENT_TYPE_LATEST)
@@ -1,19 +1,43 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
-from schema.navigation import NavigationRequest, NavigationResponse, NavigationError, PriorityEnum, CarFuelEnum, WalkingNavigationRequest, WalkingPriorityEnum
-from crud.navigation import NavigationService
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import JSONResponse, ORJSONResponse
+from schema.navigation import NavigationRequest, NavigationResponse, NavigationError, PriorityEnum, CarFuelEnum, WalkingNavigationRequest, WalkingPriorityEnum, GeometryFormatEnum, RouteProjectionResponse
+from crud.navigation import NavigationService, get_navigation_service
+from services.route_cache import route_cache
+from services.single_flight import route_single_flight
+from utils.route_geometry import encode_route_geometry
+from services.route_projection import parse_route_fields, project_route_response
 from crud.location import get_latest_protector_location, get_latest_caree_location
 from crud.caree import get_carees_by_user
-from utils.auth import get_current_user
-from models.user import User
+from utils.auth import get_current_principal
+from services.token_verifier import Principal
 from models.position_history import PositionHistory
 from db.session import get_db
-from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Dict, Any, FrozenSet
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/navigation", tags=["navigation"])
 
-@router.get("/route")
+def get_route_fields(
+    fields: Optional[str] = Query(default=None, description="응답 필드 선택 (summary,distance,duration,geometry 또는 raw)")
+) -> FrozenSet[str]:
+    try:
+        return parse_route_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/cache/stats")
+async def get_route_cache_stats(
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    길찾기 응답 캐시 적중/미스 및 요청 합치기 통계 (스냅 반경 튜닝용, 현재 워커 기준)
+    """
+    return {**route_cache.stats(), "single_flight": route_single_flight.stats()}
+
+@router.get("/route", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_route(
     origin: str,
     destination: str,
@@ -24,7 +48,11 @@ async def get_route(
     road_details: Optional[bool] = False,
     car_fuel: Optional[CarFuelEnum] = CarFuelEnum.GASOLINE,
     car_hipass: Optional[bool] = False,
-    current_user: Optional[User] = Depends(get_current_user)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service)
 ):
     """
     출발지에서 목적지까지의 자동차 경로를 검색합니다.
@@ -38,10 +66,11 @@ async def get_route(
     - **road_details**: 상세 도로 정보 제공 여부
     - **car_fuel**: 차량 유종 (GASOLINE, DIESEL, LPG)
     - **car_hipass**: 하이패스 사용 여부
+    - **geometry**: 경로 좌표 형식 (nested: [[경도, 위도], ...], polyline: encoded polyline, float32: base64 float32 배열)
+    - **zoom**: 지도 줌 레벨 (지정 시 해당 줌에서 구분되지 않는 좌표를 Douglas-Peucker로 제거)
+    - **fields**: 응답 필드 선택 (summary, distance, duration, geometry 중 쉼표로 구분, raw는 카카오 원본 응답)
     """
     try:
-        navigation_service = NavigationService()
-        
         # NavigationRequest 객체 생성
         request = NavigationRequest(
             origin=origin,
@@ -56,8 +85,9 @@ async def get_route(
         )
         
         result = await navigation_service.get_route(request)
-        # 카카오 API 응답을 그대로 반환 (vertexes 전처리만 적용됨)
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        # 앱에서 사용하는 필드만 남겨 orjson으로 직렬화
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except NavigationError as e:
         raise HTTPException(
@@ -70,30 +100,29 @@ async def get_route(
             detail=str(e)
         )
     except Exception as e:
-        print(f"예상치 못한 오류 발생: {str(e)}")  # 디버깅용 로그
-        print(f"오류 타입: {type(e)}")  # 디버깅용 로그
-        import traceback
-        print(f"스택 트레이스: {traceback.format_exc()}")  # 디버깅용 로그
+        logger.exception(f"예상치 못한 오류 발생 ({type(e).__name__}): {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"서버 내부 오류: {str(e)}"
         )
 
-@router.get("/route/simple")
+@router.get("/route/simple", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_simple_route(
     origin_x: float,
     origin_y: float,
     destination_x: float,
     destination_y: float,
     angle: Optional[int] = None,
-    current_user: Optional[User] = Depends(get_current_user)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service)
 ):
     """
     간단한 좌표 기반 경로 검색
     """
     try:
-        navigation_service = NavigationService()
-        
         # 좌표 형식 변환
         origin = navigation_service.format_coordinate(origin_x, origin_y, angle)
         destination = navigation_service.format_coordinate(destination_x, destination_y)
@@ -105,7 +134,8 @@ async def get_simple_route(
         )
         
         result = await navigation_service.get_route(request)
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except Exception as e:
         raise HTTPException(
@@ -113,7 +143,7 @@ async def get_simple_route(
             detail=f"경로 검색 실패: {str(e)}"
         )
 
-@router.get("/route/protector-to-caree")
+@router.get("/route/protector-to-caree", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_protector_to_caree_route(
     priority: Optional[PriorityEnum] = PriorityEnum.RECOMMEND,
     summary: Optional[bool] = True,
@@ -121,8 +151,12 @@ async def get_protector_to_caree_route(
     road_details: Optional[bool] = False,
     car_fuel: Optional[CarFuelEnum] = CarFuelEnum.GASOLINE,
     car_hipass: Optional[bool] = False,
-    current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     보호자의 현재 위치에서 피보호자의 현재 위치까지의 경로를 검색합니다.
@@ -133,10 +167,13 @@ async def get_protector_to_caree_route(
     - **road_details**: 상세 도로 정보 제공 여부
     - **car_fuel**: 차량 유종 (GASOLINE, DIESEL, LPG)
     - **car_hipass**: 하이패스 사용 여부
+    - **geometry**: 경로 좌표 형식 (nested: [[경도, 위도], ...], polyline: encoded polyline, float32: base64 float32 배열)
+    - **zoom**: 지도 줌 레벨 (지정 시 해당 줌에서 구분되지 않는 좌표를 Douglas-Peucker로 제거)
+    - **fields**: 응답 필드 선택 (summary, distance, duration, geometry 중 쉼표로 구분, raw는 카카오 원본 응답)
     """
     try:
         # 현재 보호자의 피보호자 조회
-        carees = get_carees_by_user(db, current_user.user_id)
+        carees = await get_carees_by_user(db, current_user.user_id)
         if not carees:
             raise HTTPException(
                 status_code=404,
@@ -146,11 +183,8 @@ async def get_protector_to_caree_route(
         caree_id = carees[0].caree_id
         
         # 보호자와 피보호자의 최신 위치 정보 조회
-        protector_location = get_latest_protector_location(db, current_user.user_id)
-        caree_location = get_latest_caree_location(db, caree_id)
-        
-        print(f"보호자 위치: {protector_location}")  # 디버깅용 로그
-        print(f"피보호자 위치: {caree_location}")    # 디버깅용 로그
+        protector_location = await get_latest_protector_location(db, current_user.user_id)
+        caree_location = await get_latest_caree_location(db, caree_id)
         
         if not protector_location:
             raise HTTPException(
@@ -164,12 +198,7 @@ async def get_protector_to_caree_route(
                 detail="피보호자의 위치 정보를 찾을 수 없습니다."
             )
         
-        navigation_service = NavigationService()
-        
         # 좌표 형식 변환 (보호자 위치에 각도 정보 포함)
-        print(f"보호자 원본 좌표 - 위도: {protector_location.latitude}, 경도: {protector_location.longitude}")
-        print(f"피보호자 원본 좌표 - 위도: {caree_location.latitude}, 경도: {caree_location.longitude}")
-        
         origin = navigation_service.format_coordinate(
             protector_location.latitude, 
             protector_location.longitude, 
@@ -180,8 +209,7 @@ async def get_protector_to_caree_route(
             caree_location.longitude
         )
         
-        print(f"변환된 출발지 좌표: {origin}")      # 디버깅용 로그
-        print(f"변환된 목적지 좌표: {destination}") # 디버깅용 로그
+        logger.debug(f"보호자->피보호자 경로 요청: {origin} -> {destination}")
         
         # NavigationRequest 객체 생성
         request = NavigationRequest(
@@ -195,10 +223,9 @@ async def get_protector_to_caree_route(
             car_hipass=car_hipass
         )
         
-        print(f"NavigationRequest: {request}")  # 디버깅용 로그
-        
         result = await navigation_service.get_route(request)
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except NavigationError as e:
         raise HTTPException(
@@ -216,7 +243,7 @@ async def get_protector_to_caree_route(
             detail=f"서버 내부 오류: {str(e)}"
         )
 
-@router.get("/walking/route")
+@router.get("/walking/route", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_walking_route(
     origin: str,
     destination: str,
@@ -224,7 +251,11 @@ async def get_walking_route(
     priority: Optional[WalkingPriorityEnum] = WalkingPriorityEnum.DISTANCE,
     summary: Optional[bool] = False,
     default_speed: Optional[float] = 0,
-    current_user: Optional[User] = Depends(get_current_user)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service)
 ):
     """
     출발지에서 목적지까지의 도보 경로를 검색합니다.
@@ -235,10 +266,11 @@ async def get_walking_route(
     - **priority**: 경로 탐색 우선순위 (DISTANCE, MAIN_STREET)
     - **summary**: 경로 요약 정보 제공 여부
     - **default_speed**: 도보 속도 (km/h, 기본값: 4km/h)
+    - **geometry**: 경로 좌표 형식 (nested: [[경도, 위도], ...], polyline: encoded polyline, float32: base64 float32 배열)
+    - **zoom**: 지도 줌 레벨 (지정 시 해당 줌에서 구분되지 않는 좌표를 Douglas-Peucker로 제거)
+    - **fields**: 응답 필드 선택 (summary, distance, duration, geometry 중 쉼표로 구분, raw는 카카오 원본 응답)
     """
     try:
-        navigation_service = NavigationService()
-        
         # WalkingNavigationRequest 객체 생성
         request = WalkingNavigationRequest(
             origin=origin,
@@ -250,7 +282,8 @@ async def get_walking_route(
         )
         
         result = await navigation_service.get_walking_route(request)
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except NavigationError as e:
         raise HTTPException(
@@ -263,16 +296,13 @@ async def get_walking_route(
             detail=str(e)
         )
     except Exception as e:
-        print(f"예상치 못한 오류 발생: {str(e)}")  # 디버깅용 로그
-        print(f"오류 타입: {type(e)}")  # 디버깅용 로그
-        import traceback
-        print(f"스택 트레이스: {traceback.format_exc()}")  # 디버깅용 로그
+        logger.exception(f"예상치 못한 오류 발생 ({type(e).__name__}): {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"서버 내부 오류: {str(e)}"
         )
 
-@router.get("/walking/route/simple")
+@router.get("/walking/route/simple", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_simple_walking_route(
     origin_x: float,
     origin_y: float,
@@ -281,14 +311,16 @@ async def get_simple_walking_route(
     priority: Optional[WalkingPriorityEnum] = WalkingPriorityEnum.DISTANCE,
     summary: Optional[bool] = False,
     default_speed: Optional[float] = 0,
-    current_user: Optional[User] = Depends(get_current_user)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service)
 ):
     """
     간단한 좌표 기반 도보 경로 검색
     """
     try:
-        navigation_service = NavigationService()
-        
         # 좌표 형식 변환
         origin = navigation_service.format_coordinate(origin_x, origin_y)
         destination = navigation_service.format_coordinate(destination_x, destination_y)
@@ -303,7 +335,8 @@ async def get_simple_walking_route(
         )
         
         result = await navigation_service.get_walking_route(request)
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except Exception as e:
         raise HTTPException(
@@ -311,13 +344,17 @@ async def get_simple_walking_route(
             detail=f"도보 경로 검색 실패: {str(e)}"
         )
 
-@router.get("/walking/route/protector-to-caree")
+@router.get("/walking/route/protector-to-caree", response_model=RouteProjectionResponse, response_class=ORJSONResponse)
 async def get_protector_to_caree_walking_route(
     priority: Optional[WalkingPriorityEnum] = WalkingPriorityEnum.DISTANCE,
     summary: Optional[bool] = False,
     default_speed: Optional[float] = 0,
-    current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    geometry: Optional[GeometryFormatEnum] = GeometryFormatEnum.NESTED,
+    zoom: Optional[int] = Query(default=None, ge=0, le=22),
+    route_fields: FrozenSet[str] = Depends(get_route_fields),
+    current_user: Principal = Depends(get_current_principal),
+    navigation_service: NavigationService = Depends(get_navigation_service),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     보호자의 현재 위치에서 피보호자의 현재 위치까지의 도보 경로를 검색합니다.
@@ -325,10 +362,13 @@ async def get_protector_to_caree_walking_route(
     - **priority**: 경로 탐색 우선순위 (DISTANCE, MAIN_STREET)
     - **summary**: 경로 요약 정보 제공 여부
     - **default_speed**: 도보 속도 (km/h, 기본값: 4km/h)
+    - **geometry**: 경로 좌표 형식 (nested: [[경도, 위도], ...], polyline: encoded polyline, float32: base64 float32 배열)
+    - **zoom**: 지도 줌 레벨 (지정 시 해당 줌에서 구분되지 않는 좌표를 Douglas-Peucker로 제거)
+    - **fields**: 응답 필드 선택 (summary, distance, duration, geometry 중 쉼표로 구분, raw는 카카오 원본 응답)
     """
     try:
         # 현재 보호자의 피보호자 조회
-        carees = get_carees_by_user(db, current_user.user_id)
+        carees = await get_carees_by_user(db, current_user.user_id)
         if not carees:
             raise HTTPException(
                 status_code=404,
@@ -338,11 +378,8 @@ async def get_protector_to_caree_walking_route(
         caree_id = carees[0].caree_id
         
         # 보호자와 피보호자의 최신 위치 정보 조회
-        protector_location = get_latest_protector_location(db, current_user.user_id)
-        caree_location = get_latest_caree_location(db, caree_id)
-        
-        print(f"보호자 위치: {protector_location}")  # 디버깅용 로그
-        print(f"피보호자 위치: {caree_location}")    # 디버깅용 로그
+        protector_location = await get_latest_protector_location(db, current_user.user_id)
+        caree_location = await get_latest_caree_location(db, caree_id)
         
         if not protector_location:
             raise HTTPException(
@@ -356,12 +393,7 @@ async def get_protector_to_caree_walking_route(
                 detail="피보호자의 위치 정보를 찾을 수 없습니다."
             )
         
-        navigation_service = NavigationService()
-        
         # 좌표 형식 변환
-        print(f"보호자 원본 좌표 - 위도: {protector_location.latitude}, 경도: {protector_location.longitude}")
-        print(f"피보호자 원본 좌표 - 위도: {caree_location.latitude}, 경도: {caree_location.longitude}")
-        
         origin = navigation_service.format_coordinate(
             protector_location.latitude, 
             protector_location.longitude
@@ -371,8 +403,7 @@ async def get_protector_to_caree_walking_route(
             caree_location.longitude
         )
         
-        print(f"변환된 출발지 좌표: {origin}")      # 디버깅용 로그
-        print(f"변환된 목적지 좌표: {destination}") # 디버깅용 로그
+        logger.debug(f"보호자->피보호자 경로 요청: {origin} -> {destination}")
         
         # WalkingNavigationRequest 객체 생성
         request = WalkingNavigationRequest(
@@ -383,11 +414,9 @@ async def get_protector_to_caree_walking_route(
             default_speed=default_speed
         )
         
-        print(f"WalkingNavigationRequest: {request}")  # 디버깅용 로그
-        
         result = await navigation_service.get_walking_route(request)
-        #print(f"도보 경로 검색 결과: {result}")  # 디버깅용 로그
-        return result
+        result = encode_route_geometry(result, geometry.value, zoom)
+        return ORJSONResponse(project_route_response(result, route_fields))
         
     except NavigationError as e:
         raise HTTPException(
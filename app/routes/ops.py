@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_db
+from schema.ops import (
+    OutsideCareeResponse,
+    OutsideCareeListResponse,
+    ContainingZoneResponse,
+    ContainingZoneListResponse,
+    NotificationJobResponse
+)
+from services.geofence import geofence_engine
+from services.notification_queue import notification_dispatcher
+from utils.auth import require_ops_token
+
+# 관제/운영 담당자용 전체 피보호자 대상 조회 (보호자 앱에서는 사용하지 않음)
+router = APIRouter(prefix="/ops", tags=["ops"], dependencies=[Depends(require_ops_token)])
+
+
+@router.get("/geofence/outside", response_model=OutsideCareeListResponse)
+async def list_carees_outside_zones(db: AsyncSession = Depends(get_db)):
+    """활성 안전구역이 있는 피보호자 중 최신 위치가 모든 구역 밖에 있는 피보호자 목록"""
+    positions = await geofence_engine.find_carees_outside_zones(db)
+    return OutsideCareeListResponse(
+        carees=[OutsideCareeResponse.from_orm(position) for position in positions],
+        total_count=len(positions)
+    )
+
+
+@router.get("/geofence/zones", response_model=ContainingZoneListResponse)
+async def list_zones_containing(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    db: AsyncSession = Depends(get_db)
+):
+    """지점을 포함하는 모든 피보호자의 활성 안전구역 (공간 인덱스 조회)"""
+    index = await geofence_engine.sync_index(db)
+    zones = index.zones_containing(latitude, longitude)
+    return ContainingZoneListResponse(
+        safe_zones=[ContainingZoneResponse.from_orm(zone) for zone in zones],
+        total_count=len(zones)
+    )
+
+
+@router.get("/notifications/{job_id}", response_model=NotificationJobResponse)
+async def get_notification_job(job_id: str):
+    """알림 발송 작업 상태 (queued/sending/sent/skipped/retrying/failed)"""
+    job = await notification_dispatcher.get_job_status(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="알림 작업을 찾을 수 없습니다."
+        )
+    return NotificationJobResponse(
+        job_id=job_id,
+        type=job["type"],
+        caree_id=int(job["caree_id"]),
+        status=job["status"],
+        attempts=int(job["attempts"]),
+        updated_at=datetime.fromtimestamp(float(job["updated_at"])),
+        last_error=job.get("last_error")
+    )
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.pairing import pair_watch_with_caree
 from schema.pairing import WatchPairingRequest, WatchPairingResponse
@@ -10,11 +10,11 @@ router = APIRouter(prefix="/api/pairing", tags=["pairing"])
 @router.post("/connect", response_model=WatchPairingResponse)
 async def pair_watch(
     pairing_data: WatchPairingRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """워치와 피보호자 페어링"""
     try:
-        caree = pair_watch_with_caree(db, pairing_data)
+        caree = await pair_watch_with_caree(db, pairing_data)
         
         if not caree:
             return WatchPairingResponse(
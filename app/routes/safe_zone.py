@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.safe_zone import (
     create_safe_zone,
     get_safe_zone_by_user,
     update_safe_zone,
     delete_safe_zone,
-    toggle_safe_zone_active
+    toggle_safe_zone_active,
+    add_safe_zone,
+    get_safe_zones_by_user,
+    delete_safe_zone_by_id
 )
 from schema.safe_zone import (
     SafeZoneCreateRequest,
@@ -14,6 +17,7 @@ from schema.safe_zone import (
     SafeZoneResponse,
     SafeZoneCreateResponse,
     SafeZoneUpdateResponse,
+    SafeZoneListResponse,
     SafeZoneDeleteResponse
 )
 from utils.auth import get_current_user_id
@@ -21,15 +25,18 @@ from utils.auth import get_current_user_id
 router = APIRouter(prefix="/api/safezone", tags=["safezone"])
 
 
-@router.post("/create", response_model=SafeZoneCreateResponse)
+@router.post("/create", response_model=SafeZoneCreateResponse, deprecated=True)
 async def create_safe_zone_endpoint(
     safe_zone_data: SafeZoneCreateRequest,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """안전구역 생성/업데이트"""
+    """안전구역 생성/업데이트 (deprecated: POST /zones, PUT /zones/{safe_zone_id} 사용)
+
+    구역이 여러 개면 홈 화면에 표시되는 구역(활성 구역 중 최신)을 덮어씁니다.
+    """
     try:
-        safe_zone = create_safe_zone(db, current_user_id, safe_zone_data)
+        safe_zone = await create_safe_zone(db, current_user_id, safe_zone_data)
         
         if not safe_zone:
             return SafeZoneCreateResponse(
@@ -50,14 +57,14 @@ async def create_safe_zone_endpoint(
         )
 
 
-@router.get("/info", response_model=SafeZoneResponse)
+@router.get("/info", response_model=SafeZoneResponse, deprecated=True)
 async def get_safe_zone_info(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """현재 설정된 안전구역 정보 조회"""
+    """홈 화면에 표시되는 안전구역 정보 조회 (deprecated: GET /zones/{safe_zone_id} 사용)"""
     try:
-        safe_zone = get_safe_zone_by_user(db, current_user_id)
+        safe_zone = await get_safe_zone_by_user(db, current_user_id)
         
         if not safe_zone:
             raise HTTPException(
@@ -76,15 +83,15 @@ async def get_safe_zone_info(
         )
 
 
-@router.put("/update", response_model=SafeZoneUpdateResponse)
+@router.put("/update", response_model=SafeZoneUpdateResponse, deprecated=True)
 async def update_safe_zone_endpoint(
     safe_zone_data: SafeZoneUpdateRequest,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """안전구역 부분 업데이트"""
+    """홈 화면에 표시되는 안전구역 부분 업데이트 (deprecated: PUT /zones/{safe_zone_id} 사용)"""
     try:
-        safe_zone = update_safe_zone(db, current_user_id, safe_zone_data)
+        safe_zone = await update_safe_zone(db, current_user_id, safe_zone_data)
         
         if not safe_zone:
             return SafeZoneUpdateResponse(
@@ -105,14 +112,14 @@ async def update_safe_zone_endpoint(
         )
 
 
-@router.post("/toggle", response_model=SafeZoneUpdateResponse)
+@router.post("/toggle", response_model=SafeZoneUpdateResponse, deprecated=True)
 async def toggle_safe_zone_endpoint(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """안전구역 활성화/비활성화 토글"""
+    """홈 화면에 표시되는 안전구역 활성화/비활성화 토글 (deprecated: POST /zones/{safe_zone_id}/toggle 사용)"""
     try:
-        safe_zone = toggle_safe_zone_active(db, current_user_id)
+        safe_zone = await toggle_safe_zone_active(db, current_user_id)
         
         if not safe_zone:
             return SafeZoneUpdateResponse(
@@ -134,14 +141,179 @@ async def toggle_safe_zone_endpoint(
         )
 
 
-@router.delete("/delete", response_model=SafeZoneDeleteResponse)
+@router.delete("/delete", response_model=SafeZoneDeleteResponse, deprecated=True)
 async def delete_safe_zone_endpoint(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
+):
+    """홈 화면에 표시되는 안전구역 삭제 (deprecated: DELETE /zones/{safe_zone_id} 사용)"""
+    try:
+        success = await delete_safe_zone(db, current_user_id)
+        
+        if success:
+            return SafeZoneDeleteResponse(
+                success=True,
+                message="안전구역이 삭제되었습니다."
+            )
+        else:
+            return SafeZoneDeleteResponse(
+                success=False,
+                message="삭제할 안전구역이 없습니다."
+            )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 삭제 실패: {str(e)}"
+        )
+
+
+@router.post("/zones", response_model=SafeZoneCreateResponse)
+async def add_safe_zone_endpoint(
+    safe_zone_data: SafeZoneCreateRequest,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """안전구역 추가 (피보호자당 여러 개 등록 가능)"""
+    try:
+        safe_zone = await add_safe_zone(db, current_user_id, safe_zone_data)
+        
+        if not safe_zone:
+            return SafeZoneCreateResponse(
+                success=False,
+                message="등록된 피보호자가 없습니다."
+            )
+        
+        return SafeZoneCreateResponse(
+            success=True,
+            message="안전구역이 추가되었습니다.",
+            safe_zone=SafeZoneResponse.from_orm(safe_zone)
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 추가 실패: {str(e)}"
+        )
+
+
+@router.get("/zones", response_model=SafeZoneListResponse)
+async def get_safe_zones_endpoint(
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """등록된 모든 안전구역 조회"""
+    try:
+        safe_zones = await get_safe_zones_by_user(db, current_user_id)
+        
+        return SafeZoneListResponse(
+            safe_zones=[SafeZoneResponse.from_orm(safe_zone) for safe_zone in safe_zones],
+            total_count=len(safe_zones)
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 목록 조회 실패: {str(e)}"
+        )
+
+
+@router.get("/zones/{safe_zone_id}", response_model=SafeZoneResponse)
+async def get_safe_zone_by_id_endpoint(
+    safe_zone_id: int,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 안전구역 조회"""
+    try:
+        safe_zone = await get_safe_zone_by_user(db, current_user_id, safe_zone_id)
+        
+        if not safe_zone:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="안전구역을 찾을 수 없습니다."
+            )
+        
+        return SafeZoneResponse.from_orm(safe_zone)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 조회 실패: {str(e)}"
+        )
+
+
+@router.put("/zones/{safe_zone_id}", response_model=SafeZoneUpdateResponse)
+async def update_safe_zone_by_id_endpoint(
+    safe_zone_id: int,
+    safe_zone_data: SafeZoneUpdateRequest,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 안전구역 부분 업데이트"""
+    try:
+        safe_zone = await update_safe_zone(db, current_user_id, safe_zone_data, safe_zone_id)
+        
+        if not safe_zone:
+            return SafeZoneUpdateResponse(
+                success=False,
+                message="안전구역을 찾을 수 없습니다."
+            )
+        
+        return SafeZoneUpdateResponse(
+            success=True,
+            message="안전구역이 업데이트되었습니다.",
+            safe_zone=SafeZoneResponse.from_orm(safe_zone)
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 업데이트 실패: {str(e)}"
+        )
+
+
+@router.post("/zones/{safe_zone_id}/toggle", response_model=SafeZoneUpdateResponse)
+async def toggle_safe_zone_by_id_endpoint(
+    safe_zone_id: int,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 안전구역 활성화/비활성화 토글"""
+    try:
+        safe_zone = await toggle_safe_zone_active(db, current_user_id, safe_zone_id)
+        
+        if not safe_zone:
+            return SafeZoneUpdateResponse(
+                success=False,
+                message="안전구역을 찾을 수 없습니다."
+            )
+        
+        status_text = "활성화" if safe_zone.is_active else "비활성화"
+        return SafeZoneUpdateResponse(
+            success=True,
+            message=f"안전구역이 {status_text}되었습니다.",
+            safe_zone=SafeZoneResponse.from_orm(safe_zone)
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"안전구역 토글 실패: {str(e)}"
+        )
+
+
+@router.delete("/zones/{safe_zone_id}", response_model=SafeZoneDeleteResponse)
+async def delete_safe_zone_by_id_endpoint(
+    safe_zone_id: int,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
-    """안전구역 삭제"""
+    """특정 안전구역 삭제"""
     try:
-        success = delete_safe_zone(db, current_user_id)
+        success = await delete_safe_zone_by_id(db, current_user_id, safe_zone_id)
         
         if success:
             return SafeZoneDeleteResponse(
@@ -1,25 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.user import create_user, get_user_by_id, get_user_by_phone, verify_password, has_registered_caree
+from services.password_hasher import PasswordHasherBusy
 from crud.fcm_token import update_user_fcm_token, delete_all_user_fcm_tokens
 from schema.user import UserRegisterRequest, UserRegisterResponse, UserResponse, UserLoginRequest, UserLoginResponse, UserLogoutResponse, CareeRegistrationStatusResponse
 from utils.jwt import create_access_token
-from utils.auth import get_current_user_id
+from utils.auth import get_current_user_id, get_current_principal
+from services.token_verifier import Principal, token_verifier
 
 router = APIRouter(prefix="/api/user", tags=["user"])
 
 
 @router.post("/register", response_model=UserRegisterResponse)
-async def register_user(user_data: UserRegisterRequest, db: Session = Depends(get_db)):
-    existing_user = get_user_by_id(db, user_data.user_id)
+async def register_user(user_data: UserRegisterRequest, db: AsyncSession = Depends(get_db)):
+    existing_user = await get_user_by_id(db, user_data.user_id)
     if existing_user:
         return UserRegisterResponse(
             success=False,
             message="이미 존재하는 아이디입니다."
         )
     
-    existing_phone = get_user_by_phone(db, user_data.phone_number)
+    existing_phone = await get_user_by_phone(db, user_data.phone_number)
     if existing_phone:
         return UserRegisterResponse(
             success=False,
@@ -27,7 +29,7 @@ async def register_user(user_data: UserRegisterRequest, db: Session = Depends(ge
         )
     
     try:
-        new_user = create_user(db, user_data)
+        new_user = await create_user(db, user_data)
         
         return UserRegisterResponse(
             success=True,
@@ -35,6 +37,12 @@ async def register_user(user_data: UserRegisterRequest, db: Session = Depends(ge
             user=UserResponse.from_orm(new_user)
         )
     
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="회원가입 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -43,15 +51,24 @@ async def register_user(user_data: UserRegisterRequest, db: Session = Depends(ge
 
 
 @router.post("/login", response_model=UserLoginResponse)
-async def login_user(login_data: UserLoginRequest, db: Session = Depends(get_db)):
-    user = get_user_by_id(db, login_data.user_id)
+async def login_user(login_data: UserLoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await get_user_by_id(db, login_data.user_id)
     if not user:
         return UserLoginResponse(
             success=False,
             message="존재하지 않는 아이디입니다."
         )
     
-    if not verify_password(login_data.password, user.password_hash):
+    try:
+        verified = await verify_password(db, user, login_data.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"}
+        )
+    
+    if not verified:
         return UserLoginResponse(
             success=False,
             message="비밀번호가 틀렸습니다."
@@ -61,7 +78,7 @@ async def login_user(login_data: UserLoginRequest, db: Session = Depends(get_db)
         access_token = create_access_token(data={"sub": user.user_id})
         
         if login_data.fcm_token:
-            update_user_fcm_token(
+            await update_user_fcm_token(
                 db=db,
                 user_id=user.user_id,
                 new_fcm_token=login_data.fcm_token,
@@ -84,11 +101,13 @@ async def login_user(login_data: UserLoginRequest, db: Session = Depends(get_db)
 
 @router.post("/logout", response_model=UserLogoutResponse)
 async def logout_user(
-    current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        deleted_count = delete_all_user_fcm_tokens(db, current_user_id)
+        deleted_count = await delete_all_user_fcm_tokens(db, principal.user_id)
+        # 로그아웃한 토큰은 만료 전이라도 더 이상 사용할 수 없도록 폐기
+        await token_verifier.revoke(principal)
         
         return UserLogoutResponse(
             success=True,
@@ -105,10 +124,10 @@ async def logout_user(
 @router.get("/caree-status", response_model=CareeRegistrationStatusResponse)
 async def check_caree_registration_status(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        has_caree = has_registered_caree(db, current_user_id)
+        has_caree = await has_registered_caree(db, current_user_id)
         return CareeRegistrationStatusResponse(has_registered_caree=has_caree)
     
     except Exception as e:
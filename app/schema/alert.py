@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from models.alert_history import AlertType
+
+
+class AlertAcknowledgeRequest(BaseModel):
+    alert_type: AlertType
+
+
+class AlertAcknowledgeResponse(BaseModel):
+    success: bool
+    message: str
+    acknowledged_count: int = 0
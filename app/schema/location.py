@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -10,6 +10,15 @@ class LocationUpdateRequest(BaseModel):
     battery_level: Optional[int] = Field(None, ge=0, le=100)
 
 
+class LocationBatchItem(LocationUpdateRequest):
+    recorded_at: Optional[datetime] = None
+
+
+class LocationBatchUpdateRequest(BaseModel):
+    # 측정 순서대로 정렬된 위치 목록 (오프라인 버퍼 업로드용)
+    locations: List[LocationBatchItem] = Field(..., min_length=1, max_length=500)
+
+
 class LocationResponse(BaseModel):
     position_id: int
     latitude: float
@@ -30,6 +39,15 @@ class LocationUpdateResponse(BaseModel):
     care_level: Optional[int] = None
 
 
+class LocationBatchUpdateResponse(BaseModel):
+    success: bool
+    message: str
+    accepted_count: int = 0
+    geofence_breach: bool = False
+    location: Optional[LocationResponse] = None
+    care_level: Optional[int] = None
+
+
 class BothLocationResponse(BaseModel):
     protector_location: Optional[LocationResponse] = None
     caree_location: Optional[LocationResponse] = None
\ No newline at end of file
@@ -16,6 +16,11 @@ class CarFuelEnum(str, Enum):
     DIESEL = "DIESEL"
     LPG = "LPG"
 
+class GeometryFormatEnum(str, Enum):
+    NESTED = "nested"
+    POLYLINE = "polyline"
+    FLOAT32 = "float32"
+
 class NavigationRequest(BaseModel):
     origin: str = Field(..., description="출발지 좌표 (예: 127.111202,37.394912,angle=270)")
     destination: str = Field(..., description="목적지 좌표 (예: 127.111202,37.394912)")
@@ -110,6 +115,39 @@ class NavigationResponse(BaseModel):
     class Config:
         extra = "allow"  # 추가 필드 허용
 
+# 앱에서 사용하는 필드만 남긴 길찾기 응답 (fields= 로 선택)
+class RouteGeometry(BaseModel):
+    distance: Optional[int] = None
+    duration: Optional[int] = None
+    vertexes: Optional[List[List[float]]] = None
+    polyline: Optional[str] = None
+    vertexes_float32: Optional[str] = None
+
+class SectionGeometry(RouteGeometry):
+    roads: Optional[List[RouteGeometry]] = None
+
+class RouteSummary(BaseModel):
+    origin: Optional[Coordinate] = None
+    destination: Optional[Coordinate] = None
+    waypoints: Optional[List[Coordinate]] = None
+    priority: Optional[str] = None
+    bound: Optional[Bound] = None
+    distance: Optional[int] = None
+    duration: Optional[int] = None
+
+class ProjectedRoute(BaseModel):
+    result_code: Optional[int] = None
+    result_msg: Optional[str] = None
+    summary: Optional[RouteSummary] = None
+    distance: Optional[int] = None
+    duration: Optional[int] = None
+    sections: Optional[List[SectionGeometry]] = None
+
+class RouteProjectionResponse(BaseModel):
+    trans_id: Optional[str] = None
+    geometry_format: Optional[str] = None
+    routes: List[ProjectedRoute] = []
+
 class NavigationError(Exception):
     def __init__(self, error_code: int, error_msg: str):
         self.error_code = error_code
@@ -0,0 +1,44 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+
+class OutsideCareeResponse(BaseModel):
+    caree_id: int
+    latitude: float
+    longitude: float
+    recorded_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OutsideCareeListResponse(BaseModel):
+    carees: List[OutsideCareeResponse]
+    total_count: int
+
+
+class ContainingZoneResponse(BaseModel):
+    safe_zone_id: int
+    caree_id: int
+    center_latitude: float
+    center_longitude: float
+    radius_meters: int
+
+    class Config:
+        from_attributes = True
+
+
+class ContainingZoneListResponse(BaseModel):
+    safe_zones: List[ContainingZoneResponse]
+    total_count: int
+
+
+class NotificationJobResponse(BaseModel):
+    job_id: str
+    type: str
+    caree_id: int
+    status: str
+    attempts: int
+    updated_at: datetime
+    last_error: Optional[str] = None
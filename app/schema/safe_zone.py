@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 
 
 class SafeZoneCreateRequest(BaseModel):
@@ -42,6 +42,11 @@ class SafeZoneUpdateResponse(BaseModel):
     safe_zone: Optional[SafeZoneResponse] = None
 
 
+class SafeZoneListResponse(BaseModel):
+    safe_zones: List[SafeZoneResponse]
+    total_count: int
+
+
 class SafeZoneDeleteResponse(BaseModel):
     success: bool
     message: str
\ No newline at end of file
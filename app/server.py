@@ -0,0 +1,52 @@
+"""
+운영 서버 실행 (uvicorn 멀티 워커)
+
+    cd app && WEB_CONCURRENCY=4 python server.py
+
+워커 수를 지정하지 않으면 사용 가능한 CPU 코어 수만큼 띄웁니다. 워커마다 DB 커넥션 풀을
+따로 가지므로 풀 크기는 DB_MAX_CONNECTIONS를 워커 수로 나눠 정합니다 (db/session.pool_limits).
+SIGTERM을 받으면 새 연결을 받지 않고 진행 중인 요청을 SERVER_GRACEFUL_SHUTDOWN_SECONDS까지
+기다린 뒤, lifespan 종료 단계에서 위치/알림 기록 버퍼를 flush 합니다.
+개발 중에는 자동 재시작이 켜진 `python main.py`를 사용합니다.
+"""
+import os
+import shutil
+
+import uvicorn
+
+from utils.config import settings
+
+
+def default_workers() -> int:
+    # 컨테이너 CPU 제한(cgroup quota)은 반영되지 않으므로 운영에서는 WEB_CONCURRENCY를 지정
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def prepare_metrics_dir(path: str) -> None:
+    """이전 실행에서 남은 워커별 지표 파일 제거"""
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def main() -> None:
+    workers = int(os.getenv("WEB_CONCURRENCY") or default_workers())
+    # 워커 프로세스가 같은 워커 수로 DB 풀 크기를 계산하도록 환경변수로 전달
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1:
+        metrics_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.PROMETHEUS_MULTIPROC_DIR)
+        prepare_metrics_dir(metrics_dir)
+
+    uvicorn.run(
+        "main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=True
+    )
+
+
+if __name__ == "__main__":
+    main()
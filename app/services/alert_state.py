@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from db.session import async_engine
+from models.alert_history import AlertHistory, AlertType
+from utils.config import settings
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "alert:state:"
+
+
+class AlertStateMachine:
+    """피보호자별 알림 상태 (Redis TTL 키) + AlertHistory 비동기 기록
+
+    알림 타입마다 alert:state:{caree_id}:{alert_type} 키를 SET NX EX로 잡은 요청만 알림을
+    발생시키므로, 중복 판정은 Redis 왕복 한 번입니다. 키가 살아 있는 동안(cooldown)은
+    같은 알림을 다시 보내지 않고, 보호자가 확인(acknowledge)하면 키를 지워 다음 이벤트부터
+    바로 알립니다. AlertHistory는 감사 로그로만 쓰이며 버퍼에 모아 배치로 INSERT 합니다.
+    """
+
+    def __init__(
+        self,
+        cooldowns: Optional[Dict[AlertType, int]] = None,
+        batch_size: int = settings.ALERT_AUDIT_BATCH_SIZE,
+        flush_interval: float = settings.ALERT_AUDIT_FLUSH_INTERVAL
+    ):
+        self.cooldowns = cooldowns or {
+            AlertType.geofence_breach: settings.ALERT_GEOFENCE_COOLDOWN_SECONDS,
+            AlertType.low_battery: settings.ALERT_LOW_BATTERY_COOLDOWN_SECONDS
+        }
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = batch_size * 20
+        self._buffer: List[dict] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def _key(self, caree_id: int, alert_type: AlertType) -> str:
+        return f"{KEY_PREFIX}{caree_id}:{alert_type.value}"
+
+    async def try_fire(self, caree_id: int, alert_type: AlertType) -> bool:
+        """cooldown 중이 아니면 상태를 '발생'으로 바꾸고 True (동시 요청 중 하나만 True)"""
+        cooldown = self.cooldowns.get(alert_type, settings.ALERT_GEOFENCE_COOLDOWN_SECONDS)
+        try:
+            return bool(await get_redis().set(self._key(caree_id, alert_type), int(time.time()), nx=True, ex=cooldown))
+        except Exception as e:
+            # 알림 누락보다 중복 알림이 낫기 때문에 Redis 장애 시에는 발생으로 처리
+            logger.warning(f"알림 상태 확인 실패, 알림을 발생시킵니다: {str(e)}")
+            return True
+
+    async def acknowledge(self, caree_id: int, alert_type: AlertType) -> None:
+        """보호자 확인 처리: cooldown을 해제해 다음 이벤트부터 다시 알림"""
+        await get_redis().delete(self._key(caree_id, alert_type))
+
+    async def reset(self, caree_id: int) -> None:
+        """피보호자 삭제 시 알림 상태와 아직 기록되지 않은 감사 로그 제거"""
+        self._buffer = [row for row in self._buffer if row["caree_id"] != caree_id]
+        try:
+            await get_redis().delete(*(self._key(caree_id, alert_type) for alert_type in AlertType))
+        except Exception as e:
+            logger.warning(f"알림 상태 삭제 실패 (cooldown 만료 후 정리): {str(e)}")
+
+    def record(self, caree_id: int, alert_type: AlertType, message: str) -> None:
+        """AlertHistory 감사 로그를 버퍼에 추가 (DB 접근 없음)"""
+        self._buffer.append({
+            "caree_id": caree_id,
+            "alert_type": alert_type,
+            "message": message,
+            "created_at": datetime.now()
+        })
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """버퍼에 쌓인 알림 기록을 한 번에 INSERT"""
+        if not self._buffer:
+            return 0
+
+        rows, self._buffer = self._buffer, []
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(insert(AlertHistory), rows)
+            return len(rows)
+        except IntegrityError:
+            # 기록 전에 피보호자가 삭제된 경우 등: 한 건씩 다시 넣고 실패한 건만 버림
+            return await self._insert_each(rows)
+        except Exception as e:
+            logger.error(f"알림 기록 저장 실패 ({len(rows)}건): {str(e)}")
+            self._buffer = (rows + self._buffer)[-self.max_buffer_size:]
+            return 0
+
+    async def _insert_each(self, rows: List[dict]) -> int:
+        saved = 0
+        for index, row in enumerate(rows):
+            try:
+                async with async_engine.begin() as conn:
+                    await conn.execute(insert(AlertHistory), [row])
+                saved += 1
+            except IntegrityError as e:
+                logger.warning(f"알림 기록 제외 (피보호자 {row['caree_id']}): {str(e)}")
+            except Exception as e:
+                logger.error(f"알림 기록 저장 실패 ({len(rows) - index}건): {str(e)}")
+                self._buffer = (rows[index:] + self._buffer)[-self.max_buffer_size:]
+                break
+        return saved
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # 종료 전 남은 기록 저장
+        await self.flush()
+
+
+alert_state = AlertStateMachine()
@@ -1,17 +1,43 @@
 import firebase_admin
-from firebase_admin import credentials, messaging
-from sqlalchemy.orm import Session
+from firebase_admin import credentials, exceptions, messaging
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.fcm_token import FCMToken
 from models.user import User
 from models.caree import Caree
 from models.safe_zone import SafeZone
-from typing import List, Optional
+from crud.fcm_token import deactivate_fcm_token
+from utils.logging_config import mask
+from utils.metrics import track_external
+from typing import List, NamedTuple, Optional
+import asyncio
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
 
+# FCM 멀티캐스트 요청당 최대 토큰 수
+MULTICAST_BATCH_SIZE = 500
+
+# 재전송해도 성공할 수 없는 토큰 (앱 삭제, 잘못된 형식, 다른 프로젝트의 토큰)
+INVALID_TOKEN_ERRORS = (
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+    exceptions.InvalidArgumentError
+)
+
+
+class FCMSendResult(NamedTuple):
+    success_count: int
+    failure_count: int
+    invalid_tokens: List[str]
+
+
+class FCMDeliveryError(Exception):
+    """유효한 토큰에 대한 전송이 모두 실패한 경우"""
+
+
 class FCMService:
     _instance = None
     _initialized = False
@@ -44,98 +70,134 @@ class FCMService:
             logger.error(f"FCM 서비스 초기화 실패: {str(e)}")
             raise
     
+    def warm_up(self) -> None:
+        """첫 알림 전송 때 하던 OAuth 액세스 토큰 발급을 미리 수행 (블로킹 호출)"""
+        firebase_admin.get_app().credential.get_access_token()
+    
     def send_notification(
         self, 
         fcm_tokens: List[str], 
         title: str, 
         body: str, 
         data: Optional[dict] = None
-    ) -> bool:
-        """FCM 푸시 알림 전송"""
+    ) -> FCMSendResult:
+        """FCM 푸시 알림 전송 (최대 500개 토큰씩 멀티캐스트)"""
         if not fcm_tokens:
             logger.warning("전송할 FCM 토큰이 없습니다.")
-            return False
+            return FCMSendResult(0, 0, [])
         
-        try:
-            # 각 토큰에 대해 개별 메시지 전송
-            success_count = 0
-            for token in fcm_tokens:
-                try:
-                    message = messaging.Message(
-                        token=token,
-                        notification=messaging.Notification(
-                            title=title,
-                            body=body
-                        ),
-                        data=data or {},
-                        android=messaging.AndroidConfig(
-                            priority="high",
-                            notification=messaging.AndroidNotification(
-                                priority="high",
-                                sound="default"
-                            )
-                        ),
-                        apns=messaging.APNSConfig(
-                            payload=messaging.APNSPayload(
-                                aps=messaging.Aps(
-                                    sound="default",
-                                    badge=1
-                                )
-                            )
+        success_count = 0
+        failure_count = 0
+        invalid_tokens = []
+        for start in range(0, len(fcm_tokens), MULTICAST_BATCH_SIZE):
+            chunk = fcm_tokens[start:start + MULTICAST_BATCH_SIZE]
+            message = messaging.MulticastMessage(
+                tokens=chunk,
+                notification=messaging.Notification(
+                    title=title,
+                    body=body
+                ),
+                data=data or {},
+                android=messaging.AndroidConfig(
+                    priority="high",
+                    notification=messaging.AndroidNotification(
+                        priority="high",
+                        sound="default"
+                    )
+                ),
+                apns=messaging.APNSConfig(
+                    payload=messaging.APNSPayload(
+                        aps=messaging.Aps(
+                            sound="default",
+                            badge=1
                         )
                     )
-                    
-                    response = messaging.send(message)
-                    if response:
-                        success_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"토큰 {token}에 알림 전송 실패: {str(e)}")
-                    continue
+                )
+            )
             
-            logger.info(f"FCM 알림 전송 완료: 성공 {success_count}, 실패 {len(fcm_tokens) - success_count}")
-            
-            return success_count > 0
+            try:
+                batch_response = messaging.send_each_for_multicast(message)
+            except Exception as e:
+                # 요청 자체가 실패한 경우 해당 묶음 전체를 실패로 처리
+                logger.error(f"FCM 멀티캐스트 전송 실패 ({len(chunk)}개 토큰): {str(e)}")
+                failure_count += len(chunk)
+                continue
             
-        except Exception as e:
-            logger.error(f"FCM 알림 전송 실패: {str(e)}")
-            return False
+            success_count += batch_response.success_count
+            failure_count += batch_response.failure_count
+            # 응답 순서는 요청한 토큰 순서와 동일
+            for token, response in zip(chunk, batch_response.responses):
+                if response.success:
+                    continue
+                if isinstance(response.exception, INVALID_TOKEN_ERRORS):
+                    invalid_tokens.append(token)
+                else:
+                    logger.error(f"토큰 {mask(token)}에 알림 전송 실패: {str(response.exception)}")
+        
+        logger.info(
+            f"FCM 알림 전송 완료: 성공 {success_count}, 실패 {failure_count} (무효 토큰 {len(invalid_tokens)})"
+        )
+        return FCMSendResult(success_count, failure_count, invalid_tokens)
     
-    def send_geofence_breach_notification(
+    async def _send_to_tokens(
+        self,
+        db: AsyncSession,
+        fcm_tokens: List[str],
+        title: str,
+        body: str,
+        data: dict
+    ) -> bool:
+        """알림 전송 후 무효 토큰 비활성화 (유효 토큰 전송이 모두 실패하면 FCMDeliveryError)"""
+        # send_each_for_multicast는 블로킹 호출이므로 스레드에서 실행
+        with track_external("fcm", "send_multicast"):
+            result = await asyncio.to_thread(self.send_notification, fcm_tokens, title, body, data)
+        
+        for token in result.invalid_tokens:
+            await deactivate_fcm_token(db, token)
+        if result.invalid_tokens:
+            logger.info(f"무효 FCM 토큰 {len(result.invalid_tokens)}개를 비활성화했습니다.")
+        
+        if result.success_count == 0 and result.failure_count > len(result.invalid_tokens):
+            raise FCMDeliveryError(f"{result.failure_count}개 토큰 전송 실패")
+        return result.success_count > 0
+    
+    async def send_geofence_breach_notification(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         caree_id: int, 
         caree_name: str
     ) -> bool:
         """안전구역 이탈 알림 전송"""
         try:
             # 피보호자와 연결된 보호자들의 FCM 토큰 조회
-            caree = db.query(Caree).filter(Caree.caree_id == caree_id).first()
+            caree = await db.get(Caree, caree_id)
             if not caree:
                 logger.error(f"피보호자를 찾을 수 없습니다: {caree_id}")
                 return False
             
             # 안전구역이 활성화되어 있는지 확인
-            safe_zone = db.query(SafeZone).filter(
+            result = await db.execute(select(SafeZone).where(
                 SafeZone.caree_id == caree_id,
                 SafeZone.is_active == True
-            ).first()
+            ).limit(1))
+            safe_zone = result.scalars().first()
             
             if not safe_zone:
                 logger.info(f"피보호자 {caree_id}의 안전구역이 비활성화되어 있어 알림을 전송하지 않습니다.")
                 return False
             
             # 보호자 정보 조회
-            protector = db.query(User).filter(User.user_id == caree.created_by_user_id).first()
+            protector = await db.get(User, caree.created_by_user_id)
             if not protector:
                 logger.error(f"보호자를 찾을 수 없습니다: {caree.created_by_user_id}")
                 return False
             
             # 보호자의 활성 FCM 토큰들 조회
-            fcm_tokens = db.query(FCMToken.fcm_token).filter(
+            result = await db.execute(select(FCMToken.fcm_token).where(
                 FCMToken.user_id == protector.user_id,
                 FCMToken.is_active == True
-            ).all()
+            ))
+            fcm_tokens = result.all()
             
             if not fcm_tokens:
                 logger.warning(f"보호자 {protector.user_id}의 활성 FCM 토큰이 없습니다.")
@@ -153,15 +215,16 @@ class FCMService:
                 "timestamp": str(caree.updated_at) if caree.updated_at else ""
             }
             
-            return self.send_notification(token_list, title, body, data)
+            return await self._send_to_tokens(db, token_list, title, body, data)
             
         except Exception as e:
+            # 알림 발송 큐에서 재시도할 수 있도록 예외를 전달
             logger.error(f"안전구역 이탈 알림 전송 실패: {str(e)}")
-            return False
+            raise
     
-    def send_low_battery_notification(
+    async def send_low_battery_notification(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         caree_id: int, 
         caree_name: str, 
         battery_level: int
@@ -169,22 +232,23 @@ class FCMService:
         """배터리 부족 알림 전송"""
         try:
             # 피보호자와 연결된 보호자들의 FCM 토큰 조회
-            caree = db.query(Caree).filter(Caree.caree_id == caree_id).first()
+            caree = await db.get(Caree, caree_id)
             if not caree:
                 logger.error(f"피보호자를 찾을 수 없습니다: {caree_id}")
                 return False
             
             # 보호자 정보 조회
-            protector = db.query(User).filter(User.user_id == caree.created_by_user_id).first()
+            protector = await db.get(User, caree.created_by_user_id)
             if not protector:
                 logger.error(f"보호자를 찾을 수 없습니다: {caree.created_by_user_id}")
                 return False
             
             # 보호자의 활성 FCM 토큰들 조회
-            fcm_tokens = db.query(FCMToken.fcm_token).filter(
+            result = await db.execute(select(FCMToken.fcm_token).where(
                 FCMToken.user_id == protector.user_id,
                 FCMToken.is_active == True
-            ).all()
+            ))
+            fcm_tokens = result.all()
             
             if not fcm_tokens:
                 logger.warning(f"보호자 {protector.user_id}의 활성 FCM 토큰이 없습니다.")
@@ -203,8 +267,9 @@ class FCMService:
                 "timestamp": str(caree.updated_at) if hasattr(caree, 'updated_at') and caree.updated_at else ""
             }
             
-            return self.send_notification(token_list, title, body, data)
+            return await self._send_to_tokens(db, token_list, title, body, data)
             
         except Exception as e:
+            # 알림 발송 큐에서 재시도할 수 있도록 예외를 전달
             logger.error(f"배터리 부족 알림 전송 실패: {str(e)}")
-            return False
+            raise
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from redis.asyncio import Redis
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.position_history import PositionHistory, PositionType
+from models.safe_zone import SafeZone
+from services.spatial_index import CachedSafeZone, ZoneGridIndex
+from utils.config import settings
+from utils.geo import calculate_distance, batch_containment
+from utils.redis_client import close_pubsub
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "geofence:invalidate"
+# 이탈 현황 조회 시 한 번에 IN 조건으로 조회할 피보호자 수
+SWEEP_BATCH_SIZE = 500
+
+
+def active_zones_query(caree_id: int):
+    """피보호자의 활성 안전구역 조회 (캐시 미스 시 실행, benchmarks/query_plans.py에서 실행계획 검사)"""
+    return select(SafeZone).where(
+        SafeZone.caree_id == caree_id,
+        SafeZone.is_active == True
+    )
+
+
+class GeofenceEngine:
+    """피보호자별 활성 안전구역을 메모리에 캐시하고 포함 여부를 판정하는 엔진
+
+    안전구역이 변경되면 crud/safe_zone에서 invalidate()를 호출하고,
+    Redis pub/sub으로 다른 워커 프로세스의 캐시도 함께 무효화합니다.
+    pub/sub 메시지를 놓치는 경우에 대비해 TTL이 지나면 DB에서 다시 읽습니다.
+    전체 피보호자 대상 조회(이탈 현황 등)는 격자 공간 인덱스(zone_index)로 처리합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = settings.GEOFENCE_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._zones: Dict[int, Tuple[float, Tuple[CachedSafeZone, ...]]] = {}
+        self._redis: Optional[Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self.zone_index = ZoneGridIndex()
+        self._index_loaded_at: Optional[float] = None
+        self._dirty_carees: Set[int] = set()
+        # 무효화 세대: DB 조회 중 무효화되면 조회 결과(변경 전 구역일 수 있음)를 캐시에 넣지 않음
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0
+
+    async def get_active_zones(self, db: AsyncSession, caree_id: int) -> Tuple[CachedSafeZone, ...]:
+        """캐시된 활성 안전구역 조회 (캐시 미스 시에만 DB 조회)"""
+        cached = self._zones.get(caree_id)
+        if cached and time.monotonic() - cached[0] < self.ttl_seconds:
+            return cached[1]
+
+        generation = self._generation(caree_id)
+        result = await db.execute(active_zones_query(caree_id))
+        zones = tuple(self._to_cached(zone) for zone in result.scalars().all())
+        if self._generation(caree_id) == generation:
+            self._zones[caree_id] = (time.monotonic(), zones)
+        return zones
+
+    def _generation(self, caree_id: int) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(caree_id, 0)
+
+    @staticmethod
+    def _to_cached(zone: SafeZone) -> CachedSafeZone:
+        return CachedSafeZone(
+            safe_zone_id=zone.safe_zone_id,
+            caree_id=zone.caree_id,
+            center_latitude=float(zone.center_latitude),
+            center_longitude=float(zone.center_longitude),
+            radius_meters=zone.radius_meters
+        )
+
+    @staticmethod
+    def contains(zones: Tuple[CachedSafeZone, ...], latitude: float, longitude: float) -> bool:
+        for zone in zones:
+            # 하버사인 공식
+            distance = calculate_distance(latitude, longitude, zone.center_latitude, zone.center_longitude)
+            if distance <= zone.radius_meters:
+                return True
+        return False
+
+    @staticmethod
+    def contains_many(zones: Tuple[CachedSafeZone, ...], latitudes, longitudes) -> np.ndarray:
+        """여러 지점의 안전구역 포함 여부를 한 번에 판정 (배치 업로드, 과거 기록 재처리용)"""
+        if not zones:
+            return np.zeros(len(latitudes), dtype=bool)
+        return batch_containment(
+            latitudes,
+            longitudes,
+            [zone.center_latitude for zone in zones],
+            [zone.center_longitude for zone in zones],
+            [zone.radius_meters for zone in zones]
+        ).inside_any
+
+    async def is_inside(self, db: AsyncSession, caree_id: int, latitude: float, longitude: float) -> bool:
+        zones = await self.get_active_zones(db, caree_id)
+        return self.contains(zones, latitude, longitude)
+
+    async def sync_index(self, db: AsyncSession) -> ZoneGridIndex:
+        """공간 인덱스를 최신 상태로 맞춤 (최초/TTL 만료 시 전체 적재, 이후 변경된 피보호자만 재적재)"""
+        now = time.monotonic()
+        if self._index_loaded_at is None or now - self._index_loaded_at >= self.ttl_seconds:
+            self._dirty_carees.clear()
+            result = await db.execute(select(SafeZone).where(SafeZone.is_active == True))
+            zones_by_caree: Dict[int, List[CachedSafeZone]] = defaultdict(list)
+            for zone in result.scalars().all():
+                zones_by_caree[zone.caree_id].append(self._to_cached(zone))
+            self.zone_index.clear()
+            for caree_id, zones in zones_by_caree.items():
+                self.zone_index.replace_caree(caree_id, zones)
+            self._index_loaded_at = now
+        elif self._dirty_carees:
+            caree_ids, self._dirty_carees = self._dirty_carees, set()
+            result = await db.execute(select(SafeZone).where(
+                SafeZone.caree_id.in_(caree_ids),
+                SafeZone.is_active == True
+            ))
+            zones_by_caree = defaultdict(list)
+            for zone in result.scalars().all():
+                zones_by_caree[zone.caree_id].append(self._to_cached(zone))
+            for caree_id in caree_ids:
+                self.zone_index.replace_caree(caree_id, zones_by_caree.get(caree_id, []))
+        return self.zone_index
+
+    async def find_carees_outside_zones(self, db: AsyncSession) -> List[Row]:
+        """활성 안전구역이 있는 피보호자 중 최신 위치가 모든 구역 밖에 있는 피보호자의 위치 목록
+
+        안전구역이 있는 피보호자의 최신 위치만 SWEEP_BATCH_SIZE명씩 나눠 필요한 컬럼만 조회합니다.
+        """
+        index = await self.sync_index(db)
+        caree_ids = sorted(index.caree_ids)
+        outside = []
+        for start in range(0, len(caree_ids), SWEEP_BATCH_SIZE):
+            result = await db.execute(select(
+                PositionHistory.caree_id,
+                PositionHistory.latitude,
+                PositionHistory.longitude,
+                PositionHistory.recorded_at
+            ).where(
+                PositionHistory.position_type == PositionType.caree,
+                PositionHistory.caree_id.in_(caree_ids[start:start + SWEEP_BATCH_SIZE])
+            ))
+            outside.extend(
+                row for row in result
+                if not index.contains(row.caree_id, float(row.latitude), float(row.longitude))
+            )
+        return outside
+
+    def _drop(self, caree_id: int) -> None:
+        self._generations[caree_id] = self._generations.get(caree_id, 0) + 1
+        self._zones.pop(caree_id, None)
+        self._dirty_carees.add(caree_id)
+
+    async def invalidate(self, caree_id: int) -> None:
+        """캐시 무효화 (현재 프로세스 + 다른 워커)"""
+        self._drop(caree_id)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, str(caree_id))
+        except Exception as e:
+            logger.warning(f"안전구역 캐시 무효화 메시지 발행 실패 (TTL 만료 후 갱신): {str(e)}")
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._drop(int(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"안전구역 캐시 무효화 구독 오류, 재연결합니다: {str(e)}")
+                # 구독이 끊긴 동안의 변경을 놓쳤을 수 있으므로 전체 캐시를 비움
+                self._epoch += 1
+                self._zones.clear()
+                self._index_loaded_at = None
+                await asyncio.sleep(1)
+            finally:
+                # 재연결 전에 이전 연결을 닫음 (끊긴 pub/sub 연결이 풀 밖에 쌓이지 않도록)
+                await close_pubsub(pubsub)
+
+    async def start(self, redis: Redis) -> None:
+        self._redis = redis
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+geofence_engine = GeofenceEngine()
@@ -0,0 +1,148 @@
+import logging
+from typing import Any, Dict, Optional
+
+from utils.config import settings
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "home:"
+VERSION_KEY_PREFIX = "home:version:"
+
+# 버전을 올리고(진행 중인 재구성 저장 차단) 스냅샷의 피보호자가 같을 때만 필드 갱신 (스냅샷이 없으면 만들지 않음)
+UPDATE_IF_CAREE_SCRIPT = """
+redis.call("incr", KEYS[2])
+redis.call("expire", KEYS[2], ARGV[1])
+if redis.call("hget", KEYS[1], "caree_id") == ARGV[2] then
+    redis.call("hset", KEYS[1], unpack(ARGV, 3))
+    return 1
+end
+return 0
+"""
+
+# 재구성을 시작한 뒤 쓰기 경로의 갱신이 없었을 때만 스냅샷 저장
+SET_IF_VERSION_SCRIPT = """
+if (redis.call("get", KEYS[2]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("del", KEYS[1])
+redis.call("hset", KEYS[1], unpack(ARGV, 3))
+redis.call("expire", KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def _encode(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+def _decode_bool(value: str) -> Optional[bool]:
+    return None if value == "" else value == "1"
+
+
+class HomeSnapshotStore:
+    """보호자별 홈 화면 정보 스냅샷 (Redis 해시)
+
+    조회는 HGETALL 한 번으로 끝나고, 위치/안전구역/피보호자 쓰기 경로가 바뀐 필드만
+    갱신합니다. 스냅샷이 없을 때의 갱신은 무시하고 다음 조회에서 DB로 다시 만듭니다.
+    쓰기 경로는 갱신할 때마다 보호자별 버전을 올리고, DB 재구성은 조회 전에 읽은 버전이
+    그대로일 때만 저장하므로 재구성과 동시에 일어난 갱신이 오래된 값으로 덮어써지지 않습니다.
+    """
+
+    def __init__(self, ttl_seconds: int = settings.HOME_SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, user_id: str) -> str:
+        return f"{KEY_PREFIX}{user_id}"
+
+    def _version_key(self, user_id: str) -> str:
+        return f"{VERSION_KEY_PREFIX}{user_id}"
+
+    async def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await get_redis().hgetall(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"홈 스냅샷 Redis 조회 실패: {str(e)}")
+            raw = None
+
+        if not raw or "caree_id" not in raw:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {
+            "protector_name": raw["protector_name"],
+            "caree_id": int(raw["caree_id"]),
+            "caree_name": raw["caree_name"],
+            "safe_zone_active": raw["safe_zone_active"] == "1",
+            "caree_in_safe_zone": _decode_bool(raw["caree_in_safe_zone"]),
+            "safe_zone_radius_meters": int(raw["safe_zone_radius_meters"]) if raw["safe_zone_radius_meters"] else None
+        }
+
+    async def version(self, user_id: str) -> Optional[str]:
+        """DB 재구성 전에 호출 (결과는 set()에 전달, Redis 장애 시 None)"""
+        try:
+            return await get_redis().get(self._version_key(user_id)) or "0"
+        except Exception as e:
+            logger.warning(f"홈 스냅샷 버전 조회 실패: {str(e)}")
+            return None
+
+    async def set(self, user_id: str, snapshot: Dict[str, Any], version: Optional[str]) -> bool:
+        """version 이후 쓰기 경로의 갱신이 없었을 때만 저장 (저장하지 않았으면 False)"""
+        if version is None:
+            return False
+        args = [version, self.ttl_seconds]
+        for field, value in snapshot.items():
+            args.extend((field, _encode(value)))
+        try:
+            return bool(await get_redis().eval(
+                SET_IF_VERSION_SCRIPT, 2, self._key(user_id), self._version_key(user_id), *args
+            ))
+        except Exception as e:
+            logger.warning(f"홈 스냅샷 Redis 저장 실패: {str(e)}")
+            return False
+
+    async def _update(self, user_id: str, caree_id: int, **fields: Any) -> None:
+        args = [self.ttl_seconds, str(caree_id)]
+        for field, value in fields.items():
+            args.extend((field, _encode(value)))
+        try:
+            await get_redis().eval(UPDATE_IF_CAREE_SCRIPT, 2, self._key(user_id), self._version_key(user_id), *args)
+        except Exception as e:
+            # 갱신에 실패한 스냅샷은 오래된 값을 보여주지 않도록 삭제
+            logger.warning(f"홈 스냅샷 갱신 실패, 스냅샷을 삭제합니다: {str(e)}")
+            await self.invalidate(user_id)
+
+    async def update_location(self, user_id: str, caree_id: int, is_inside_safe_zone: Optional[bool]) -> None:
+        await self._update(user_id, caree_id, caree_in_safe_zone=is_inside_safe_zone)
+
+    async def update_safe_zone(self, user_id: str, caree_id: int, safe_zone: Optional[Any]) -> None:
+        """홈 화면 기준 안전구역(활성 구역 우선, 없으면 최근 구역) 반영"""
+        await self._update(
+            user_id,
+            caree_id,
+            safe_zone_active=safe_zone.is_active if safe_zone else False,
+            safe_zone_radius_meters=safe_zone.radius_meters if safe_zone else None
+        )
+
+    async def update_caree(self, user_id: str, caree_id: int, caree_name: str) -> None:
+        await self._update(user_id, caree_id, caree_name=caree_name)
+
+    async def invalidate(self, user_id: str) -> None:
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.delete(self._key(user_id))
+                pipe.incr(self._version_key(user_id))
+                pipe.expire(self._version_key(user_id), self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"홈 스냅샷 삭제 실패: {str(e)}")
+
+
+home_snapshot_store = HomeSnapshotStore()
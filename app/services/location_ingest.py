@@ -0,0 +1,149 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.alert import create_geofence_breach_alert, create_low_battery_alert
+from crud.location import get_latest_caree_location, upsert_latest_caree_position, to_local_naive
+from models.position_history import PositionHistory, PositionType
+from schema.location import LocationUpdateRequest
+from services.geofence import geofence_engine
+from services.home_snapshot import home_snapshot_store
+from services.location_stream import location_stream, location_event, geofence_transition, TRANSITION_EXIT
+from services.notification_queue import (
+    notification_dispatcher,
+    NOTIFICATION_GEOFENCE_BREACH,
+    NOTIFICATION_LOW_BATTERY
+)
+from services.position_store import position_store
+from services.spatial_index import CachedSafeZone
+from services.watch_identity import WatchIdentity
+
+logger = logging.getLogger(__name__)
+
+LOW_BATTERY_THRESHOLD = 20
+
+
+@dataclass
+class CareeContext:
+    """위치 수신 한 건을 처리하는 동안 모든 단계가 공유하는 피보호자 정보
+
+    피보호자 식별 정보는 워치 인증 캐시, 활성 안전구역은 지오펜스 캐시에서 오므로
+    DB 조회는 최신 위치 한 건뿐입니다. 보호자 FCM 토큰은 알림 발송 워커에서 조회합니다.
+    """
+    identity: WatchIdentity
+    zones: Tuple[CachedSafeZone, ...]
+    latest_position: Optional[PositionHistory]
+
+
+@dataclass
+class IngestResult:
+    position: PositionHistory
+    geofence_breach: bool
+    battery_level: Optional[int]
+
+
+async def load_caree_context(db: AsyncSession, identity: WatchIdentity) -> CareeContext:
+    return CareeContext(
+        identity=identity,
+        zones=await geofence_engine.get_active_zones(db, identity.caree_id),
+        latest_position=await get_latest_caree_location(db, identity.caree_id)
+    )
+
+
+def _inside_flags(zones: Tuple[CachedSafeZone, ...], locations: Sequence[LocationUpdateRequest]) -> List[bool]:
+    # 한 건이면 NumPy 배열 생성 비용이 더 크므로 스칼라 판정
+    if len(locations) == 1:
+        return [geofence_engine.contains(zones, locations[0].latitude, locations[0].longitude)]
+    return geofence_engine.contains_many(
+        zones,
+        [location.latitude for location in locations],
+        [location.longitude for location in locations]
+    ).tolist()
+
+
+async def ingest_caree_locations(
+    db: AsyncSession,
+    identity: WatchIdentity,
+    locations: Sequence[LocationUpdateRequest]
+) -> IngestResult:
+    """피보호자 위치 수신 파이프라인 (단건/일괄 공통)
+
+    1) 피보호자 컨텍스트 로드  2) 안전구역 판정과 이탈 감지  3) 이동 경로 버퍼 추가
+    4) 최신 위치 갱신 후 한 번만 커밋  5) 홈 스냅샷/실시간 스트림 반영  6) 알림 판정과 발송 예약
+    위치 목록은 측정 순서대로 보며, 안전구역 내부 -> 외부 전환이 한 번이라도 있으면 이탈로 판정합니다.
+    저장된 최신 위치보다 늦게 도착한(같거나 이전 시각의) 측정값은 이동 경로에만 기록하고
+    최신 위치, 이탈/배터리 알림 판정에는 쓰지 않습니다.
+    """
+    context = await load_caree_context(db, identity)
+    caree_id = identity.caree_id
+    inside_flags = _inside_flags(context.zones, locations)
+
+    initial_inside = context.latest_position.is_inside_safe_zone if context.latest_position else None
+    latest_recorded_at = context.latest_position.recorded_at if context.latest_position else None
+    if latest_recorded_at is not None:
+        latest_recorded_at = to_local_naive(latest_recorded_at)
+    previous_inside = initial_inside
+    geofence_breach = False
+    now = datetime.now()
+    recorded_ats = [to_local_naive(getattr(location, "recorded_at", None) or now) for location in locations]
+    # 최신 위치 이후의 측정값만 알림 판정에 사용 (늦게 온 백필로 이미 지난 이탈을 다시 알리지 않음)
+    fresh = [latest_recorded_at is None or recorded_at > latest_recorded_at for recorded_at in recorded_ats]
+
+    for location, inside_safe_zone, recorded_at, is_fresh in zip(locations, inside_flags, recorded_ats, fresh):
+        if is_fresh:
+            if previous_inside == True and inside_safe_zone == False:
+                geofence_breach = True
+            previous_inside = inside_safe_zone
+
+        position_store.append(
+            PositionType.caree,
+            location.latitude,
+            location.longitude,
+            caree_id=caree_id,
+            accuracy_meters=location.accuracy_meters,
+            battery_level=location.battery_level,
+            is_inside_safe_zone=inside_safe_zone,
+            recorded_at=recorded_at
+        )
+
+    # 최신 위치는 마지막 측정값 한 건만 반영 (expire_on_commit=False라 커밋 후 refresh 불필요)
+    # 저장된 최신 위치보다 새 측정값이 아니면 기존 위치가 그대로 유지됨
+    position = upsert_latest_caree_position(
+        db,
+        caree_id,
+        locations[-1],
+        inside_flags[-1],
+        recorded_ats[-1],
+        context.latest_position
+    )
+    await db.commit()
+
+    if fresh[-1]:
+        # 커밋된 위치를 홈 스냅샷과 연결된 보호자에게 반영 (일괄 업로드 중간에 이탈했으면 exit 전환)
+        transition = TRANSITION_EXIT if geofence_breach else geofence_transition(initial_inside, position.is_inside_safe_zone)
+        await home_snapshot_store.update_location(identity.created_by_user_id, caree_id, position.is_inside_safe_zone)
+        await location_stream.publish(caree_id, location_event(position, transition))
+
+    # 배터리는 최신 위치 이후의 가장 최근 측정값 기준으로 판단
+    battery_level = next(
+        (
+            location.battery_level
+            for location, is_fresh in zip(reversed(locations), reversed(fresh))
+            if is_fresh and location.battery_level is not None
+        ),
+        None
+    )
+
+    # 알림 상태(cooldown) 판정은 커밋 후에 하고, 발생한 알림만 FCM 발송 큐에 넣음
+    if geofence_breach:
+        logger.info(f"피보호자 {caree_id} 안전구역 이탈 감지 (위치 {len(locations)}건)")
+        if await create_geofence_breach_alert(db, caree_id, identity.name):
+            await notification_dispatcher.enqueue(NOTIFICATION_GEOFENCE_BREACH, caree_id, identity.name)
+    if battery_level is not None and battery_level <= LOW_BATTERY_THRESHOLD:
+        if await create_low_battery_alert(db, caree_id, battery_level, identity.name):
+            await notification_dispatcher.enqueue(NOTIFICATION_LOW_BATTERY, caree_id, identity.name, battery_level)
+
+    return IngestResult(position=position, geofence_breach=geofence_breach, battery_level=battery_level)
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from utils.config import settings
+from utils.redis_client import get_redis, close_pubsub
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "location:caree:"
+
+TRANSITION_ENTER = "enter"
+TRANSITION_EXIT = "exit"
+
+
+def geofence_transition(previous_inside: Optional[bool], current_inside: Optional[bool]) -> Optional[str]:
+    """안전구역 내부/외부 전환 (이전 값이 없거나 변화가 없으면 None)"""
+    if previous_inside is None or current_inside is None or previous_inside == current_inside:
+        return None
+    return TRANSITION_ENTER if current_inside else TRANSITION_EXIT
+
+
+def location_event(position: Any, transition: Optional[str] = None) -> Dict[str, Any]:
+    """PositionHistory를 스트림 이벤트로 변환"""
+    recorded_at = position.recorded_at
+    # DECIMAL 컬럼 값은 JSON으로 보낼 수 있도록 float로 변환
+    return {
+        "type": "location",
+        "caree_id": position.caree_id,
+        "latitude": float(position.latitude),
+        "longitude": float(position.longitude),
+        "accuracy_meters": float(position.accuracy_meters) if position.accuracy_meters is not None else None,
+        "battery_level": position.battery_level,
+        "is_inside_safe_zone": position.is_inside_safe_zone,
+        "recorded_at": recorded_at.isoformat() if isinstance(recorded_at, datetime) else recorded_at,
+        "transition": transition
+    }
+
+
+class LocationStreamHub:
+    """피보호자 위치 변경을 연결된 보호자에게 전달하는 pub/sub 허브
+
+    위치를 받은 워커가 Redis 채널(location:caree:{caree_id})에 발행하면, 각 워커는 pub/sub 연결
+    하나로 받아서 자기 프로세스에 연결된 구독자 큐에만 나눠 줍니다. 채널은 이 워커에 첫 구독자가
+    생길 때 구독하고 마지막 구독자가 나가면 해제하므로, 워커가 받는 메시지 양은 전체 피보호자 수가
+    아니라 이 워커에 연결된 보호자 수에 비례합니다.
+    느린 구독자의 큐가 가득 차면 가장 오래된 이벤트를 버립니다 (최신 위치가 더 중요).
+    """
+
+    def __init__(self, queue_size: int = settings.LOCATION_STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._redis: Optional[Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._pubsub: Optional[PubSub] = None
+        # 현재 pub/sub 연결에서 구독 중인 피보호자
+        self._channels: Set[int] = set()
+        # 채널 구독 변경을 순서대로 적용 (start()에서 이벤트 루프에 맞춰 생성)
+        self._channel_lock: Optional[asyncio.Lock] = None
+        self._channels_changed: Optional[asyncio.Event] = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    async def publish(self, caree_id: int, event: Dict[str, Any]) -> None:
+        try:
+            await get_redis().publish(f"{CHANNEL_PREFIX}{caree_id}", json.dumps(event, ensure_ascii=False))
+            self.published += 1
+        except Exception as e:
+            # 실시간 전달 실패는 위치 저장에 영향을 주지 않음 (클라이언트는 재연결 시 최신 위치를 다시 받음)
+            logger.warning(f"위치 스트림 발행 실패: {str(e)}")
+
+    @asynccontextmanager
+    async def subscribe(self, caree_ids: Iterable[int]) -> AsyncIterator[asyncio.Queue]:
+        """피보호자들의 이벤트를 받을 큐 (컨텍스트를 벗어나면 구독 해제)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        caree_ids = list(caree_ids)
+        for caree_id in caree_ids:
+            self._subscribers[caree_id].add(queue)
+        try:
+            for caree_id in caree_ids:
+                await self._sync_channel(caree_id)
+            yield queue
+        finally:
+            for caree_id in caree_ids:
+                subscribers = self._subscribers.get(caree_id)
+                if subscribers is not None:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        del self._subscribers[caree_id]
+            for caree_id in caree_ids:
+                await self._sync_channel(caree_id)
+
+    async def _sync_channel(self, caree_id: int) -> None:
+        """이 워커에 구독자가 있으면 피보호자 채널을 구독하고, 없으면 해제"""
+        if self._pubsub is None:
+            return
+        async with self._channel_lock:
+            wanted = caree_id in self._subscribers
+            if wanted == (caree_id in self._channels):
+                return
+            try:
+                if wanted:
+                    await self._pubsub.subscribe(f"{CHANNEL_PREFIX}{caree_id}")
+                    self._channels.add(caree_id)
+                else:
+                    await self._pubsub.unsubscribe(f"{CHANNEL_PREFIX}{caree_id}")
+                    self._channels.discard(caree_id)
+            except Exception as e:
+                # 연결을 닫으면 리스너가 재연결하면서 로컬 구독자 기준으로 다시 구독
+                logger.warning(f"위치 스트림 채널 구독 변경 실패, 재연결합니다: {str(e)}")
+                await self._close_pubsub()
+            self._channels_changed.set()
+
+    async def _connect(self) -> None:
+        """pub/sub 연결을 새로 만들고 현재 로컬 구독자가 있는 채널을 다시 구독"""
+        async with self._channel_lock:
+            await self._close_pubsub()
+            self._pubsub = self._redis.pubsub()
+            carees = set(self._subscribers)
+            if carees:
+                await self._pubsub.subscribe(*(f"{CHANNEL_PREFIX}{caree_id}" for caree_id in carees))
+            self._channels = carees
+
+    async def _close_pubsub(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        self._channels = set()
+        if pubsub is not None:
+            await close_pubsub(pubsub)
+
+    def _dispatch(self, caree_id: int, data: str) -> None:
+        for queue in self._subscribers.get(caree_id, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(data)
+            self.delivered += 1
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._connect()
+                pubsub = self._pubsub
+                # 구독 변경 실패로 연결이 닫히면 다시 연결
+                while self._pubsub is pubsub:
+                    if not self._channels:
+                        # 구독한 채널이 없으면 읽을 것이 없으므로 첫 구독자가 생길 때까지 대기
+                        self._channels_changed.clear()
+                        await self._channels_changed.wait()
+                        continue
+                    # 다른 태스크가 같은 연결로 보낸 구독 변경은 읽는 중에도 반영됨
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                    if message is None or message.get("type") != "message":
+                        continue
+                    caree_id = int(message["channel"][len(CHANNEL_PREFIX):])
+                    if caree_id in self._subscribers:
+                        self._dispatch(caree_id, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"위치 스트림 구독 오류, 재연결합니다: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def start(self, redis: Redis) -> None:
+        self._redis = redis
+        if self._listener is None:
+            self._channel_lock = asyncio.Lock()
+            self._channels_changed = asyncio.Event()
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+            await self._close_pubsub()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribed_carees": len(self._subscribers),
+            "subscribers": len({id(queue) for queues in self._subscribers.values() for queue in queues}),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped
+        }
+
+
+location_stream = LocationStreamHub()
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set
+
+from redis.exceptions import ResponseError
+from db.session import AsyncSessionLocal
+from services.fcm_service import FCMService
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "notification:stream"
+GROUP_NAME = "notification-dispatchers"
+RETRY_KEY = "notification:retry"
+DEAD_LETTER_KEY = "notification:dead"
+JOB_KEY_PREFIX = "notification:job:"
+
+NOTIFICATION_GEOFENCE_BREACH = "geofence_breach"
+NOTIFICATION_LOW_BATTERY = "low_battery"
+
+# 상태 전환 (끝난 작업의 상태는 바꾸지 않음)
+# sending은 같은 시도가 이미 끝났거나(재시도 대기) 이후 시도가 있으면 거부되어 다시 전송하지 않음.
+# 같은 시도가 sending으로 남아 있으면 처리 중 워커가 죽은 작업이므로 다시 전송
+SET_STATUS_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'status')
+if current == 'sent' or current == 'skipped' or current == 'failed' then
+    return 0
+end
+if ARGV[1] == 'sending' then
+    local attempts = tonumber(redis.call('HGET', KEYS[1], 'attempts') or '0')
+    local attempt = tonumber(ARGV[2])
+    if attempts > attempt or (attempts == attempt and current ~= 'sending') then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class NotificationDispatcher:
+    """Redis Stream 기반 FCM 알림 발송 큐
+
+    요청 경로에서는 enqueue로 작업을 스트림에 추가만 하고, 컨슈머 그룹에 속한 워커들이
+    작업을 가져가 FCM으로 전송합니다. 실패한 작업은 지수 백오프로 재시도 큐(ZSET)에 넣고,
+    최대 시도 횟수를 넘기면 dead letter 목록으로 옮깁니다.
+    작업별 상태(queued/sending/sent/skipped/retrying/failed)는 notification:job:{id} 해시에 기록됩니다.
+    처리 중인 워커는 메시지의 idle 시간을 주기적으로 갱신하므로 느린 전송은 회수되지 않고,
+    회수되거나 중복 추가된 작업이 이미 끝난 상태면 다시 전송하지 않고 ACK만 합니다.
+    """
+
+    def __init__(
+        self,
+        worker_count: int = settings.NOTIFICATION_WORKER_COUNT,
+        max_attempts: int = settings.NOTIFICATION_MAX_ATTEMPTS,
+        retry_base_delay: float = settings.NOTIFICATION_RETRY_BASE_DELAY,
+        job_ttl_seconds: int = settings.NOTIFICATION_JOB_TTL_SECONDS,
+        claim_idle_seconds: float = settings.NOTIFICATION_CLAIM_IDLE_SECONDS
+    ):
+        self.worker_count = worker_count
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.job_ttl_seconds = job_ttl_seconds
+        # 워커가 처리 중 죽은 작업은 이 시간이 지나면 다른 워커가 가져감 (살아 있는 워커는 더 자주 갱신)
+        self.claim_idle_ms = int(claim_idle_seconds * 1000)
+        self.consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
+        self._redis = None
+        self._tasks: List[asyncio.Task] = []
+        # Redis 장애 시 프로세스 내에서 직접 전송하는 태스크
+        self._fallback_tasks: set = set()
+
+    async def enqueue(
+        self,
+        notification_type: str,
+        caree_id: int,
+        caree_name: str,
+        battery_level: Optional[int] = None
+    ) -> Optional[str]:
+        """알림 발송 작업을 큐에 추가하고 작업 ID를 반환"""
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "type": notification_type,
+            "caree_id": caree_id,
+            "caree_name": caree_name,
+            "battery_level": battery_level,
+            "attempts": 0
+        }
+        if self._redis is None:
+            self._send_in_background(job)
+            return None
+
+        try:
+            await self._set_status(job, "queued")
+            await self._redis.xadd(STREAM_KEY, {"job": json.dumps(job)})
+            # 발송 상태는 GET /ops/notifications/{job_id}로 조회
+            logger.info(f"알림 작업 추가 ({notification_type}, 피보호자 {caree_id}): {job['job_id']}")
+            return job["job_id"]
+        except Exception as e:
+            logger.error(f"알림 큐 추가 실패, 직접 전송으로 대체: {str(e)}")
+            self._send_in_background(job)
+            return None
+
+    async def get_job_status(self, job_id: str) -> dict:
+        """작업 상태 조회 (작업이 없거나 job_ttl_seconds가 지나 만료되면 빈 dict)"""
+        if self._redis is None:
+            return {}
+        return await self._redis.hgetall(f"{JOB_KEY_PREFIX}{job_id}")
+
+    def _send_in_background(self, job: dict) -> None:
+        task = asyncio.create_task(self._deliver_once(job))
+        self._fallback_tasks.add(task)
+        task.add_done_callback(self._fallback_tasks.discard)
+
+    async def _deliver_once(self, job: dict) -> None:
+        try:
+            await self._deliver(job)
+        except Exception as e:
+            logger.error(f"알림 직접 전송 실패 ({job['type']}, 피보호자 {job['caree_id']}): {str(e)}")
+
+    async def _deliver(self, job: dict) -> bool:
+        """작업 1건을 FCM으로 전송 (전송 대상이 없으면 False, 전송 실패 시 예외)"""
+        fcm_service = FCMService()
+        async with AsyncSessionLocal() as db:
+            if job["type"] == NOTIFICATION_GEOFENCE_BREACH:
+                return await fcm_service.send_geofence_breach_notification(db, job["caree_id"], job["caree_name"])
+            if job["type"] == NOTIFICATION_LOW_BATTERY:
+                return await fcm_service.send_low_battery_notification(
+                    db, job["caree_id"], job["caree_name"], job["battery_level"]
+                )
+        raise ValueError(f"알 수 없는 알림 유형: {job['type']}")
+
+    async def _set_status(self, job: dict, status: str, error: Optional[str] = None) -> bool:
+        """작업 상태 기록 (이미 끝난 작업이거나 이미 처리한 시도면 바꾸지 않고 False)"""
+        fields = ["type", job["type"], "caree_id", job["caree_id"], "attempts", job["attempts"], "updated_at", time.time()]
+        if error is not None:
+            fields += ["last_error", error]
+        return bool(await self._redis.eval(
+            SET_STATUS_SCRIPT, 1, f"{JOB_KEY_PREFIX}{job['job_id']}",
+            status, job["attempts"], self.job_ttl_seconds, *fields
+        ))
+
+    async def _process(self, message_id: str, fields: dict) -> None:
+        job = json.loads(fields["job"])
+        job["attempts"] += 1
+        try:
+            if not await self._set_status(job, "sending"):
+                logger.info(f"이미 처리된 알림 작업이라 다시 전송하지 않음 ({job['job_id']}, {job['attempts']}회차)")
+                return
+            try:
+                delivered = await self._deliver(job)
+                await self._set_status(job, "sent" if delivered else "skipped")
+            except Exception as e:
+                error = str(e)
+                if job["attempts"] >= self.max_attempts:
+                    logger.error(f"알림 전송 최종 실패 ({job['job_id']}, {job['attempts']}회): {error}")
+                    if await self._set_status(job, "failed", error):
+                        await self._redis.lpush(DEAD_LETTER_KEY, json.dumps(job))
+                else:
+                    delay = self.retry_base_delay * (2 ** (job["attempts"] - 1))
+                    logger.warning(f"알림 전송 실패, {delay:.0f}초 후 재시도 ({job['job_id']}): {error}")
+                    # 다른 워커가 같은 작업을 이미 끝냈으면 재시도하지 않음
+                    if await self._set_status(job, "retrying", error):
+                        await self._redis.zadd(RETRY_KEY, {json.dumps(job): time.time() + delay})
+        finally:
+            await self._redis.xack(STREAM_KEY, GROUP_NAME, message_id)
+            await self._redis.xdel(STREAM_KEY, message_id)
+
+    @asynccontextmanager
+    async def _keep_claimed(self, consumer: str, message_ids: List[str]) -> AsyncIterator[Set[str]]:
+        """처리 중인 메시지의 idle 시간을 주기적으로 갱신 (느린 전송이나 배치 대기 중에 회수되지 않도록)
+
+        처리가 끝난 메시지는 반환된 집합에서 빼야 합니다.
+        """
+        pending = set(message_ids)
+
+        async def refresh():
+            while True:
+                await asyncio.sleep(self.claim_idle_ms / 1000 / 3)
+                if not pending:
+                    continue
+                try:
+                    await self._redis.xclaim(STREAM_KEY, GROUP_NAME, consumer, 0, list(pending), justid=True)
+                except Exception as e:
+                    logger.warning(f"알림 작업 idle 시간 갱신 실패 ({consumer}): {str(e)}")
+
+        task = asyncio.create_task(refresh())
+        try:
+            yield pending
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _process_batch(self, consumer: str, messages: list) -> None:
+        async with self._keep_claimed(consumer, [message_id for message_id, _ in messages]) as pending:
+            for message_id, fields in messages:
+                await self._process(message_id, fields)
+                pending.discard(message_id)
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(STREAM_KEY, GROUP_NAME, id="0", mkstream=True)
+        except ResponseError as e:
+            # 이미 그룹이 존재하는 경우
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _worker(self, consumer: str) -> None:
+        while True:
+            try:
+                response = await self._redis.xreadgroup(
+                    GROUP_NAME, consumer, {STREAM_KEY: ">"}, count=10, block=5000
+                )
+                for _, messages in response or []:
+                    await self._process_batch(consumer, messages)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"알림 워커 오류 ({consumer}): {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _retry_scheduler(self) -> None:
+        """재시도 시각이 된 작업을 스트림으로 되돌리고, 중단된 워커의 작업을 회수"""
+        consumer = f"{self.consumer_prefix}-scheduler"
+        while True:
+            try:
+                # 처리 도중 프로세스가 죽어 ACK 되지 않은 작업을 가져와 처리
+                _, claimed, *_ = await self._redis.xautoclaim(
+                    STREAM_KEY, GROUP_NAME, consumer, min_idle_time=self.claim_idle_ms, count=10
+                )
+                await self._process_batch(consumer, claimed)
+
+                due_jobs = await self._redis.zrangebyscore(RETRY_KEY, 0, time.time(), start=0, num=100)
+                for raw_job in due_jobs:
+                    # 여러 프로세스가 동시에 옮기지 않도록 ZREM에 성공한 쪽만 다시 추가
+                    if await self._redis.zrem(RETRY_KEY, raw_job):
+                        await self._redis.xadd(STREAM_KEY, {"job": raw_job})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"알림 재시도 스케줄러 오류: {str(e)}")
+            await asyncio.sleep(1)
+
+    async def start(self, redis) -> None:
+        if self._tasks:
+            return
+        self._redis = redis
+        try:
+            await self._ensure_group()
+        except Exception as e:
+            logger.error(f"알림 큐 초기화 실패, 직접 전송 모드로 동작: {str(e)}")
+            self._redis = None
+            return
+
+        self._tasks = [
+            asyncio.create_task(self._worker(f"{self.consumer_prefix}-{index}"))
+            for index in range(self.worker_count)
+        ]
+        self._tasks.append(asyncio.create_task(self._retry_scheduler()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._fallback_tasks:
+            await asyncio.gather(*self._fallback_tasks, return_exceptions=True)
+        self._redis = None
+
+
+notification_dispatcher = NotificationDispatcher()
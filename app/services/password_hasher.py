@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _crypt_context(rounds: int) -> CryptContext:
+    # rounds를 바꾸면 기존 해시는 needs_update 대상이 되어 로그인 시 다시 해시됨
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+# 프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둠 (컨텍스트는 작업 프로세스마다 생성)
+def _hash(rounds: int, password: str) -> str:
+    return _crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(rounds: int, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    return _crypt_context(rounds).verify_and_update(password, password_hash)
+
+
+def _timed(func: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 비밀번호 작업이 한도를 넘어 새 요청을 받지 않음"""
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 이벤트 루프 밖의 제한된 작업 풀에서 실행
+
+    bcrypt 패키지 백엔드는 계산 중 GIL을 놓기 때문에 기본은 스레드 풀이고, GIL을 잡는
+    백엔드(os_crypt 등)만 있는 환경에서는 executor="process"를 사용합니다.
+    로그인이 몰려도 대기 작업 수가 max_pending을 넘으면 PasswordHasherBusy로 바로 거절해서
+    워치 위치 전송 등 다른 요청의 지연이 커지지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+        rounds: int = settings.PASSWORD_BCRYPT_ROUNDS,
+        executor: str = settings.PASSWORD_HASH_EXECUTOR
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self.executor = executor
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"비밀번호 작업 대기열 초과로 요청 거절 (대기 {self._pending}건)")
+            raise PasswordHasherBusy()
+
+        submitted_at = time.perf_counter()
+        self._pending += 1
+        try:
+            result, elapsed = await asyncio.get_running_loop().run_in_executor(self._get_executor(), _timed, func, args)
+        finally:
+            self._pending -= 1
+
+        # 대기 시간 = 전체 소요 시간 - 실제 계산 시간
+        waited = max(time.perf_counter() - submitted_at - elapsed, 0.0)
+        self.completed += 1
+        self.total_wait_seconds += waited
+        self.total_run_seconds += elapsed
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, self.rounds, password)
+
+    async def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """비밀번호 검증, 현재 설정과 다른 해시면 새 해시도 함께 반환 (불일치 시 (False, None))"""
+        verified, new_hash = await self._run(_verify_and_update, self.rounds, password, password_hash)
+        if verified and new_hash is not None:
+            self.rehashed += 1
+        return verified, new_hash
+
+    def stop(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.executor,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0
+        }
+
+
+password_hasher = PasswordHasher()
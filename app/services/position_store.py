@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import insert, text
+from db.session import async_engine
+from models.position_track import PositionTrack
+from services.single_flight import RELEASE_LOCK_SCRIPT
+from utils.config import settings
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+MAX_PARTITION_NAME = "pmax"
+# 파티션 DDL은 워커/프로세스 중 한 곳에서만 실행 (락 보유 중 프로세스가 죽어도 TTL 후 해제)
+MAINTENANCE_LOCK_KEY = "position_track:maintenance_lock"
+MAINTENANCE_LOCK_TTL_SECONDS = 10 * 60
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _partition_clause(month: date) -> str:
+    return f"PARTITION {_partition_name(month)} VALUES LESS THAN (TO_DAYS('{_next_month(month).isoformat()}'))"
+
+
+class PositionTrackStore:
+    """PositionTrack 테이블에 위치 기록을 배치로 append 하는 저장소
+
+    요청 경로에서는 메모리 버퍼에 추가만 하고, 백그라운드 태스크가 일정 주기 또는
+    버퍼가 batch_size에 도달할 때마다 한 번의 multi-row INSERT로 기록합니다.
+    월별 파티션 생성과 보관 기간이 지난 파티션 삭제(DDL)는 워커가 아니라
+    migrate.py(배포 시, 매일 예약 실행)의 maintain_partitions()로 수행합니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.POSITION_TRACK_BATCH_SIZE,
+        flush_interval: float = settings.POSITION_TRACK_FLUSH_INTERVAL,
+        retention_days: int = settings.POSITION_TRACK_RETENTION_DAYS,
+        partitions_ahead: int = settings.POSITION_TRACK_PARTITIONS_AHEAD
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.partitions_ahead = partitions_ahead
+        # DB 장애 시 버퍼가 무한히 커지지 않도록 상한을 둠
+        self.max_buffer_size = batch_size * 20
+        self._buffer: List[dict] = []
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def append(
+        self,
+        position_type,
+        latitude: float,
+        longitude: float,
+        caree_id: Optional[int] = None,
+        user_id: Optional[str] = None,
+        accuracy_meters: Optional[float] = None,
+        battery_level: Optional[int] = None,
+        is_inside_safe_zone: Optional[bool] = None,
+        recorded_at: Optional[datetime] = None
+    ) -> None:
+        """위치 기록을 버퍼에 추가 (DB 접근 없음)"""
+        self._buffer.append({
+            "position_type": position_type,
+            "caree_id": caree_id,
+            "user_id": user_id,
+            "latitude": latitude,
+            "longitude": longitude,
+            "accuracy_meters": accuracy_meters,
+            "battery_level": battery_level,
+            "is_inside_safe_zone": is_inside_safe_zone,
+            "recorded_at": recorded_at or datetime.now()
+        })
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """버퍼에 쌓인 위치 기록을 한 번에 INSERT"""
+        if not self._buffer:
+            return 0
+
+        rows, self._buffer = self._buffer, []
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(insert(PositionTrack), rows)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"위치 이동 경로 저장 실패 ({len(rows)}건): {str(e)}")
+            # 다음 주기에 재시도 (상한 초과분은 오래된 기록부터 버림)
+            self._buffer = (rows + self._buffer)[-self.max_buffer_size:]
+            return 0
+
+    async def ensure_partitions(self) -> None:
+        """현재 월부터 partitions_ahead 개월 뒤까지 파티션이 존재하도록 보장"""
+        async with async_engine.begin() as conn:
+            result = await conn.execute(text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ), {"table_name": PositionTrack.__tablename__})
+            existing = {row[0] for row in result if row[0]}
+
+            months = [_month_start(date.today())]
+            for _ in range(self.partitions_ahead):
+                months.append(_next_month(months[-1]))
+
+            if not existing:
+                # 최초 1회: 일반 테이블을 RANGE 파티션 테이블로 전환
+                clauses = [_partition_clause(month) for month in months]
+                clauses.append(f"PARTITION {MAX_PARTITION_NAME} VALUES LESS THAN MAXVALUE")
+                await conn.execute(text(
+                    f"ALTER TABLE {PositionTrack.__tablename__} "
+                    f"PARTITION BY RANGE (TO_DAYS(recorded_at)) ({', '.join(clauses)})"
+                ))
+                logger.info(f"PositionTrack 파티션 생성: {[_partition_name(m) for m in months]}")
+                return
+
+            missing = [month for month in months if _partition_name(month) not in existing]
+            latest = max((name for name in existing if name != MAX_PARTITION_NAME), default=None)
+            # 이미 존재하는 가장 최근 파티션 이전 월은 pmax 분할로 만들 수 없으므로 제외
+            missing = [month for month in missing if latest is None or _partition_name(month) > latest]
+            if not missing:
+                return
+
+            clauses = [_partition_clause(month) for month in missing]
+            clauses.append(f"PARTITION {MAX_PARTITION_NAME} VALUES LESS THAN MAXVALUE")
+            await conn.execute(text(
+                f"ALTER TABLE {PositionTrack.__tablename__} "
+                f"REORGANIZE PARTITION {MAX_PARTITION_NAME} INTO ({', '.join(clauses)})"
+            ))
+            logger.info(f"PositionTrack 파티션 추가: {[_partition_name(m) for m in missing]}")
+
+    async def prune_partitions(self) -> List[str]:
+        """보관 기간(retention_days)이 지난 월 파티션을 DROP"""
+        cutoff = date.today() - timedelta(days=self.retention_days)
+        async with async_engine.begin() as conn:
+            result = await conn.execute(text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ), {"table_name": PositionTrack.__tablename__})
+            expired = []
+            for (name,) in result:
+                if not name or name == MAX_PARTITION_NAME:
+                    continue
+                month = datetime.strptime(name[1:], "%Y%m").date()
+                # 파티션의 모든 기록이 cutoff 이전일 때만 삭제
+                if _next_month(month) <= cutoff:
+                    expired.append(name)
+
+            if expired:
+                await conn.execute(text(
+                    f"ALTER TABLE {PositionTrack.__tablename__} DROP PARTITION {', '.join(expired)}"
+                ))
+                logger.info(f"PositionTrack 만료 파티션 삭제: {expired}")
+            return expired
+
+    async def maintain_partitions(self) -> bool:
+        """Redis 락을 잡은 경우에만 파티션 생성/삭제 실행 (다른 곳에서 실행 중이면 False)"""
+        redis = get_redis()
+        token = uuid.uuid4().hex
+        if not await redis.set(MAINTENANCE_LOCK_KEY, token, nx=True, ex=MAINTENANCE_LOCK_TTL_SECONDS):
+            logger.info("PositionTrack 파티션 관리가 다른 프로세스에서 실행 중이라 건너뜀")
+            return False
+        try:
+            await self.ensure_partitions()
+            await self.prune_partitions()
+            return True
+        finally:
+            try:
+                await redis.eval(RELEASE_LOCK_SCRIPT, 1, MAINTENANCE_LOCK_KEY, token)
+            except Exception as e:
+                logger.warning(f"PositionTrack 파티션 관리 락 해제 실패: {str(e)}")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        # 워커는 배치 저장만 담당 (기동 시 파티션 DDL로 테이블 메타데이터 락을 잡지 않음)
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._flush_loop())]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # 종료 전 남은 기록 저장
+        await self.flush()
+
+
+position_store = PositionTrackStore()
@@ -0,0 +1,141 @@
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from utils.config import settings
+from utils.geo import EARTH_RADIUS_METERS
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "route:"
+
+
+class RouteCache:
+    """길찾기 응답 캐시 (프로세스 내 LRU + Redis 공유 계층)
+
+    출발지/목적지 좌표를 snap_meters 크기의 격자로 스냅한 값과 나머지 요청 파라미터(priority 등)로
+    키를 만들기 때문에, 위치가 조금씩만 움직이는 동안의 반복 조회는 카카오 API를 호출하지 않습니다.
+    캐시된 응답 dict는 여러 요청이 공유하므로 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = settings.ROUTE_CACHE_TTL_SECONDS,
+        max_entries: int = settings.ROUTE_CACHE_MAX_ENTRIES,
+        snap_meters: float = settings.ROUTE_CACHE_SNAP_METERS
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.snap_meters = snap_meters
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def snap_coordinate(self, coordinate: str) -> Optional[str]:
+        """'경도,위도[,key=value...]' 좌표를 격자 칸 인덱스로 변환 (형식이 다르면 None)"""
+        parts = coordinate.split(",")
+        try:
+            longitude = float(parts[0])
+            latitude = float(parts[1])
+        except (IndexError, ValueError):
+            return None
+
+        step_lat = math.degrees(self.snap_meters / EARTH_RADIUS_METERS)
+        lat_index = math.floor(latitude / step_lat)
+        # 같은 위도 칸 안에서는 같은 경도 간격을 쓰도록 칸 중심 위도 기준으로 계산
+        cell_latitude = (lat_index + 0.5) * step_lat
+        step_lon = step_lat / max(math.cos(math.radians(cell_latitude)), 0.01)
+        lon_index = math.floor(longitude / step_lon)
+
+        # angle 등 추가 옵션은 그대로 키에 포함
+        extras = ",".join(part.strip() for part in parts[2:])
+        return f"{lat_index}:{lon_index}" + (f":{extras}" if extras else "")
+
+    def make_key(self, mode: str, request: BaseModel) -> Optional[str]:
+        """캐시 키 생성 (좌표를 해석할 수 없으면 캐시하지 않도록 None)"""
+        origin = self.snap_coordinate(request.origin)
+        destination = self.snap_coordinate(request.destination)
+        if origin is None or destination is None:
+            return None
+
+        params = request.model_dump(mode="json", exclude={"origin", "destination"})
+        options = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return f"{KEY_PREFIX}{mode}:{self.snap_meters:g}:{origin}:{destination}:{options}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value, tier = await self._lookup(key)
+        if tier == "local":
+            self.local_hits += 1
+        elif tier == "redis":
+            self.redis_hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    async def peek(self, key: str) -> Optional[Dict[str, Any]]:
+        """통계에 반영하지 않는 조회 (single-flight 대기 중 폴링용)"""
+        value, _ = await self._lookup(key)
+        return value
+
+    async def _lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return value, "local"
+            del self._entries[key]
+
+        try:
+            raw = await get_redis().get(key)
+        except Exception as e:
+            logger.warning(f"경로 캐시 Redis 조회 실패: {str(e)}")
+            raw = None
+
+        if raw is not None:
+            value = json.loads(raw)
+            self._store_local(key, value)
+            return value, "redis"
+        return None, None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._store_local(key, value)
+        try:
+            await get_redis().set(key, json.dumps(value, ensure_ascii=False), ex=int(math.ceil(self.ttl_seconds)))
+        except Exception as e:
+            logger.warning(f"경로 캐시 Redis 저장 실패: {str(e)}")
+
+    def _store_local(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """스냅 반경 튜닝용 적중/미스 통계"""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "snap_meters": self.snap_meters,
+            "ttl_seconds": self.ttl_seconds,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0
+        }
+
+
+route_cache = RouteCache()
@@ -0,0 +1,73 @@
+from typing import Any, Dict, FrozenSet, Optional
+
+ROUTE_FIELDS = frozenset({"summary", "distance", "duration", "geometry"})
+RAW_FIELD = "raw"
+
+# 요약 정보 중 앱에서 사용하는 키 (fare 등 제외)
+SUMMARY_KEYS = ("origin", "destination", "waypoints", "priority", "bound", "distance", "duration")
+GEOMETRY_KEYS = ("vertexes", "polyline", "vertexes_float32")
+
+
+def parse_route_fields(fields: Optional[str]) -> FrozenSet[str]:
+    """fields 쿼리 파라미터 해석 (미지정 시 전체 필드, raw는 원본 응답)"""
+    if not fields:
+        return ROUTE_FIELDS
+    selected = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    if selected == {RAW_FIELD}:
+        return selected
+    unknown = selected - ROUTE_FIELDS
+    if unknown or not selected:
+        raise ValueError(
+            f"지원하지 않는 fields 값입니다: {', '.join(sorted(unknown))} "
+            f"(사용 가능: {', '.join(sorted(ROUTE_FIELDS))}, {RAW_FIELD})"
+        )
+    return selected
+
+
+def _project_geometry(container: Dict[str, Any], include_totals: bool) -> Dict[str, Any]:
+    projected = {key: container[key] for key in GEOMETRY_KEYS if key in container}
+    if include_totals:
+        for key in ("distance", "duration"):
+            if key in container:
+                projected[key] = container[key]
+    return projected
+
+
+def project_route_response(response_data: Dict[str, Any], fields: FrozenSet[str]) -> Dict[str, Any]:
+    """카카오 길찾기 응답에서 선택한 필드만 남긴 새 dict 반환 (schema.navigation.RouteProjectionResponse 형태)
+
+    원본 dict는 캐시 공유 객체이므로 수정하지 않습니다.
+    """
+    if RAW_FIELD in fields:
+        return response_data
+
+    projected_routes = []
+    for route in response_data.get("routes") or []:
+        projected = {"result_code": route.get("result_code"), "result_msg": route.get("result_msg")}
+
+        if "summary" in fields and route.get("summary") is not None:
+            summary = route["summary"]
+            projected["summary"] = {key: summary[key] for key in SUMMARY_KEYS if key in summary}
+        for key in ("distance", "duration"):
+            if key in fields and key in route:
+                projected[key] = route[key]
+
+        if "geometry" in fields and isinstance(route.get("sections"), list):
+            include_totals = "distance" in fields or "duration" in fields
+            sections = []
+            for section in route["sections"]:
+                projected_section = _project_geometry(section, include_totals)
+                if isinstance(section.get("roads"), list):
+                    projected_section["roads"] = [
+                        _project_geometry(road, include_totals) for road in section["roads"]
+                    ]
+                sections.append(projected_section)
+            projected["sections"] = sections
+
+        projected_routes.append(projected)
+
+    return {
+        "trans_id": response_data.get("trans_id"),
+        "geometry_format": response_data.get("geometry_format", "nested"),
+        "routes": projected_routes
+    }
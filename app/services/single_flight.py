@@ -0,0 +1,136 @@
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.config import settings
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 락 소유자(token)가 일치할 때만 삭제
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """동일한 키의 동시 요청을 하나의 업스트림 호출로 합치는 single-flight
+
+    같은 프로세스 안에서는 진행 중인 태스크를 공유하고, 여러 워커 사이에서는 Redis 락을 잡은
+    워커만 호출합니다. 락을 얻지 못한 워커는 lookup(공유 캐시 조회)으로 결과가 채워지기를 기다리다가
+    락이 사라지거나 대기 시간이 지나면 직접 호출합니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        lock_ttl_seconds: float = settings.SINGLE_FLIGHT_LOCK_TTL_SECONDS,
+        wait_timeout_seconds: float = settings.SINGLE_FLIGHT_WAIT_SECONDS,
+        poll_interval_seconds: float = 0.05
+    ):
+        self.namespace = namespace
+        self.lock_ttl_ms = int(lock_ttl_seconds * 1000)
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leader_calls = 0
+        self.local_coalesced = 0
+        self.remote_coalesced = 0
+        self.wait_timeouts = 0
+
+    async def do(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        lookup: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Any:
+        """key가 같은 진행 중 호출이 있으면 그 결과를 공유하고, 없으면 fetch 실행
+
+        fetch는 결과를 lookup이 조회하는 공유 캐시에 저장한 뒤 반환해야 합니다.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.local_coalesced += 1
+        else:
+            task = asyncio.create_task(self._run(key, fetch, lookup))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # 요청 하나가 취소되어도 다른 대기자를 위해 공유 태스크는 계속 진행
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 예외가 미회수 경고로 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    async def _run(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        lookup: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Any:
+        redis = get_redis()
+        lock_key = f"singleflight:{self.namespace}:{hashlib.sha1(key.encode()).hexdigest()}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await redis.set(lock_key, token, nx=True, px=self.lock_ttl_ms)
+        except Exception as e:
+            # Redis 장애 시 워커 간 합치기 없이 바로 호출
+            logger.warning(f"single-flight 락 획득 실패: {str(e)}")
+            acquired = None
+            token = None
+
+        if acquired or token is None:
+            self.leader_calls += 1
+            try:
+                return await fetch()
+            finally:
+                if token is not None:
+                    try:
+                        await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                    except Exception as e:
+                        logger.warning(f"single-flight 락 해제 실패: {str(e)}")
+
+        # 다른 워커가 호출 중: 결과가 공유 캐시에 저장될 때까지 대기
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval_seconds)
+            value = await lookup()
+            if value is not None:
+                self.remote_coalesced += 1
+                return value
+            try:
+                if not await redis.exists(lock_key):
+                    break
+            except Exception:
+                break
+        else:
+            self.wait_timeouts += 1
+
+        # 다른 워커의 호출이 실패했거나 너무 오래 걸리면 직접 호출
+        value = await lookup()
+        if value is not None:
+            self.remote_coalesced += 1
+            return value
+        self.leader_calls += 1
+        return await fetch()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "leader_calls": self.leader_calls,
+            "local_coalesced": self.local_coalesced,
+            "remote_coalesced": self.remote_coalesced,
+            "wait_timeouts": self.wait_timeouts
+        }
+
+
+route_single_flight = SingleFlight("route")
@@ -0,0 +1,98 @@
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.geo import EARTH_RADIUS_METERS, calculate_distance
+
+Cell = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class CachedSafeZone:
+    safe_zone_id: int
+    caree_id: int
+    center_latitude: float
+    center_longitude: float
+    radius_meters: int
+
+
+class ZoneGridIndex:
+    """위경도 격자(geohash 버킷과 동일한 방식) 기반 안전구역 공간 인덱스
+
+    각 안전구역을 외접 사각형이 걸치는 모든 격자 칸에 등록해 두고,
+    지점 조회 시 해당 칸에 등록된 구역만 하버사인으로 확인하므로 전체 구역 수와 무관하게 동작합니다.
+    """
+
+    def __init__(self, cell_degrees: float = 0.01):
+        self.cell_degrees = cell_degrees
+        self._cells: Dict[Cell, Dict[int, List[CachedSafeZone]]] = defaultdict(dict)
+        self._caree_cells: Dict[int, Set[Cell]] = {}
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        return math.floor(latitude / self.cell_degrees), math.floor(longitude / self.cell_degrees)
+
+    def _covering_cells(self, zone: CachedSafeZone) -> Iterable[Cell]:
+        delta_lat = math.degrees(zone.radius_meters / EARTH_RADIUS_METERS)
+        # 고위도에서 cos가 0에 가까워지는 것을 방지
+        delta_lon = delta_lat / max(math.cos(math.radians(zone.center_latitude)), 0.01)
+        min_lat, min_lon = self._cell(zone.center_latitude - delta_lat, zone.center_longitude - delta_lon)
+        max_lat, max_lon = self._cell(zone.center_latitude + delta_lat, zone.center_longitude + delta_lon)
+        for lat_index in range(min_lat, max_lat + 1):
+            for lon_index in range(min_lon, max_lon + 1):
+                yield lat_index, lon_index
+
+    def remove_caree(self, caree_id: int) -> None:
+        for cell in self._caree_cells.pop(caree_id, ()):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.pop(caree_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def replace_caree(self, caree_id: int, zones: Iterable[CachedSafeZone]) -> None:
+        """피보호자의 안전구역 목록을 교체"""
+        self.remove_caree(caree_id)
+        cells: Set[Cell] = set()
+        for zone in zones:
+            for cell in self._covering_cells(zone):
+                self._cells[cell].setdefault(caree_id, []).append(zone)
+                cells.add(cell)
+        if cells:
+            self._caree_cells[caree_id] = cells
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._caree_cells.clear()
+
+    def has_zones(self, caree_id: int) -> bool:
+        return caree_id in self._caree_cells
+
+    @property
+    def caree_ids(self) -> Set[int]:
+        return set(self._caree_cells)
+
+    def zones_containing(
+        self,
+        latitude: float,
+        longitude: float,
+        caree_id: Optional[int] = None
+    ) -> List[CachedSafeZone]:
+        """지점을 포함하는 안전구역 목록 (caree_id를 주면 해당 피보호자 구역만)"""
+        bucket = self._cells.get(self._cell(latitude, longitude))
+        if not bucket:
+            return []
+
+        if caree_id is not None:
+            candidates = bucket.get(caree_id, [])
+        else:
+            candidates = [zone for zones in bucket.values() for zone in zones]
+
+        return [
+            zone for zone in candidates
+            if calculate_distance(latitude, longitude, zone.center_latitude, zone.center_longitude) <= zone.radius_meters
+        ]
+
+    def contains(self, caree_id: int, latitude: float, longitude: float) -> bool:
+        return bool(self.zones_containing(latitude, longitude, caree_id))
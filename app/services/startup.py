@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from crud.navigation import get_navigation_service
+from db.session import async_engine, POOL_SIZE
+from services.fcm_service import FCMService
+from utils.config import settings
+from utils.http_client import get_kakao_client
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 기동 준비 단계별 최대 대기 시간 (넘으면 기동을 계속하고 첫 사용 시 다시 연결)
+WARMUP_TIMEOUT_SECONDS = 5.0
+
+
+class Readiness:
+    """워커 기동 단계별 소요 시간과 트래픽 수신 가능 여부 (/readyz)
+
+    lifespan의 기동 단계가 모두 끝나야 ready가 되고, 종료가 시작되면 다시 내려가
+    로드밸런서가 새 요청을 다른 워커로 보내게 합니다.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.created_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.startup_seconds: Optional[float] = None
+
+    @asynccontextmanager
+    async def phase(self, name: str) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(time.perf_counter() - started, 4)
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        # 모듈 import부터 기동 완료까지 (uvicorn이 앱을 import하는 시간 포함)
+        self.startup_seconds = round(time.perf_counter() - self.created_at, 4)
+        logger.info(f"워커 기동 완료 ({self.startup_seconds * 1000:.0f}ms): {self.phases}")
+
+    def mark_stopping(self) -> None:
+        self.ready = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "startup_seconds": self.startup_seconds, "phases": self.phases}
+
+
+async def warm_db_pool(connections: int = settings.DB_POOL_PREWARM) -> int:
+    """커넥션을 미리 열어 두어 첫 요청들이 TCP/인증 핸드셰이크를 기다리지 않도록 함"""
+    connections = min(connections, POOL_SIZE)
+
+    async def open_one() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # 동시에 열어야 풀에 여러 개가 남음 (순서대로 열면 같은 연결을 재사용)
+    await asyncio.gather(*(open_one() for _ in range(connections)))
+    return connections
+
+
+async def warm_redis() -> None:
+    await get_redis().ping()
+
+
+async def warm_kakao_client() -> None:
+    """카카오 API 호스트와 TLS 연결을 맺어 keep-alive 풀에 넣어 둠 (응답 코드는 무시)"""
+    await get_kakao_client().head("/")
+
+
+async def init_fcm() -> None:
+    """Firebase 앱 초기화와 액세스 토큰 발급을 기동 시 한 번만 수행"""
+    fcm_service = await asyncio.to_thread(FCMService)
+    await asyncio.to_thread(fcm_service.warm_up)
+
+
+def init_navigation_service() -> None:
+    try:
+        get_navigation_service()
+    except HTTPException as e:
+        logger.error(f"길찾기 서비스 초기화 실패: {e.detail}")
+
+
+async def warm_up() -> None:
+    """DB 풀, Redis, 카카오 API 연결과 Firebase를 동시에 준비
+
+    실패해도 기동은 계속하고(해당 기능은 첫 사용 시 다시 연결), 의존성 상태는 /readyz가 보고합니다.
+    """
+    async def timed(name: str, step) -> None:
+        async with readiness.phase(name):
+            await asyncio.wait_for(step, timeout=WARMUP_TIMEOUT_SECONDS)
+
+    steps = {
+        "db_pool": warm_db_pool(),
+        "redis": warm_redis(),
+        "kakao": warm_kakao_client(),
+        "fcm": init_fcm()
+    }
+    results = await asyncio.gather(*(timed(name, step) for name, step in steps.items()), return_exceptions=True)
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.error(f"기동 준비 실패 ({name}): {str(result) or type(result).__name__}")
+    init_navigation_service()
+
+
+async def check_dependencies(timeout: float = settings.READINESS_CHECK_TIMEOUT) -> Dict[str, bool]:
+    """DB/Redis 응답 여부 (readyz 요청마다 실행)"""
+
+    async def check_db() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def probe(name: str, check) -> bool:
+        try:
+            await asyncio.wait_for(check(), timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"readyz {name} 확인 실패: {str(e)}")
+            return False
+
+    checks = {"database": check_db, "redis": warm_redis}
+    results = await asyncio.gather(*(probe(name, check) for name, check in checks.items()))
+    return dict(zip(checks, results))
+
+
+readiness = Readiness()
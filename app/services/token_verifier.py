@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from utils.config import settings
+from utils.jwt import verify_token
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+DENYLIST_KEY_PREFIX = "auth:denylist:"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """검증된 액세스 토큰의 클레임만으로 만든 인증 주체 (User 조회 없음)"""
+    user_id: str
+    token_hash: str
+    expires_at: Optional[float]
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenVerifier:
+    """JWT 검증 결과 캐시 + Redis 폐기 목록(denylist)
+
+    같은 토큰의 반복 요청은 서명 검증/디코딩을 다시 하지 않도록 토큰 해시를 키로
+    짧은 TTL 동안 Principal을 보관합니다. 폐기 여부는 매 요청 Redis에서 확인하므로
+    로그아웃한 토큰은 캐시 TTL과 관계없이 바로 거부됩니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+        max_entries: int = settings.AUTH_TOKEN_CACHE_MAX_ENTRIES
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+
+    def _decode(self, token: str, token_hash: str) -> Optional[Principal]:
+        now = time.monotonic()
+        entry = self._entries.get(token_hash)
+        if entry is not None:
+            cached_until, principal = entry
+            if cached_until > now:
+                self._entries.move_to_end(token_hash)
+                return principal
+            del self._entries[token_hash]
+
+        payload = verify_token(token)
+        if not payload or not payload.get("sub"):
+            return None
+
+        expires_at = payload.get("exp")
+        principal = Principal(user_id=payload["sub"], token_hash=token_hash, expires_at=expires_at)
+        # 토큰 만료 시각 이후까지 캐시하지 않음
+        cached_until = now + self.ttl_seconds
+        if expires_at is not None:
+            cached_until = min(cached_until, now + (expires_at - time.time()))
+        self._entries[token_hash] = (cached_until, principal)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return principal
+
+    async def verify(self, token: str) -> Optional[Principal]:
+        """유효하고 폐기되지 않은 토큰이면 Principal, 아니면 None"""
+        token_hash = hash_token(token)
+        principal = self._decode(token, token_hash)
+        if principal is None:
+            return None
+
+        try:
+            revoked = await get_redis().exists(f"{DENYLIST_KEY_PREFIX}{token_hash}")
+        except Exception as e:
+            # Redis 장애 시에도 서명/만료 검증은 끝났으므로 인증은 유지
+            logger.warning(f"토큰 폐기 목록 조회 실패: {str(e)}")
+            revoked = False
+
+        if revoked:
+            self._entries.pop(token_hash, None)
+            return None
+        return principal
+
+    async def is_revoked(self, principal: Principal) -> bool:
+        """이미 인증된 연결(위치 스트림 등)이 주기적으로 폐기/만료 여부를 다시 확인할 때 사용"""
+        if principal.expires_at is not None and principal.expires_at <= time.time():
+            return True
+        try:
+            return bool(await get_redis().exists(f"{DENYLIST_KEY_PREFIX}{principal.token_hash}"))
+        except Exception as e:
+            logger.warning(f"토큰 폐기 목록 조회 실패: {str(e)}")
+            return False
+
+    async def revoke(self, principal: Principal) -> None:
+        """토큰을 만료 시각까지 폐기 목록에 등록"""
+        self._entries.pop(principal.token_hash, None)
+        remaining = int(principal.expires_at - time.time()) + 1 if principal.expires_at else settings.AUTH_DENYLIST_DEFAULT_TTL_SECONDS
+        if remaining <= 0:
+            return
+        await get_redis().set(f"{DENYLIST_KEY_PREFIX}{principal.token_hash}", principal.user_id, ex=remaining)
+
+
+token_verifier = TokenVerifier()
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+from redis.asyncio import Redis
+from utils.config import settings
+from utils.redis_client import get_redis, close_pubsub
+
+logger = logging.getLogger(__name__)
+
+CODE_KEY_PREFIX = "watch:code:"
+CAREE_KEY_PREFIX = "watch:caree:"
+INVALIDATED_KEY_PREFIX = "watch:invalidated:"
+SEQUENCE_KEY = "watch:sequence"
+INVALIDATION_CHANNEL = "watch_identity:invalidate"
+
+# 무효화 순번을 올려 피보호자의 무효화 표시에 기록하고 캐시 항목 삭제
+INVALIDATE_SCRIPT = """
+local sequence = redis.call("incr", KEYS[1])
+redis.call("set", KEYS[2], sequence, "ex", ARGV[1])
+local registration_code = redis.call("get", KEYS[3])
+if registration_code then
+    redis.call("del", ARGV[2] .. registration_code)
+end
+redis.call("del", KEYS[3])
+return sequence
+"""
+
+# DB 조회를 시작한 뒤 피보호자가 무효화되지 않았을 때만 저장 (취소된 등록코드 재캐시 방지)
+SET_IF_NOT_INVALIDATED_SCRIPT = """
+local invalidated = tonumber(redis.call("get", KEYS[1]) or "0")
+if invalidated > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call("set", KEYS[2], ARGV[2], "ex", ARGV[4])
+redis.call("set", KEYS[3], ARGV[3], "ex", ARGV[4])
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class WatchIdentity:
+    """워치 요청 처리에 필요한 피보호자 정보 (등록코드로 인증된 주체)"""
+    caree_id: int
+    name: str
+    care_level: Optional[int]
+    created_by_user_id: str
+
+
+@dataclass(frozen=True)
+class FillVersion:
+    """캐시 미스 후 DB 조회 전에 읽은 무효화 순번 (조회 중 무효화되면 set()이 저장하지 않음)"""
+    redis_sequence: Optional[int]
+    local_sequence: int
+
+
+class WatchIdentityCache:
+    """등록코드 -> 피보호자 식별 정보 캐시 (프로세스 내 + Redis)
+
+    워치 위치 전송마다 발생하던 등록코드/피보호자 조회를 없애기 위해 사용합니다.
+    등록코드 재발급, 페어링 해제, 피보호자 수정/삭제 시 invalidate()를 호출하면
+    Redis 키를 지우고 pub/sub으로 다른 워커의 로컬 캐시도 비웁니다.
+    무효화마다 순번을 올려 피보호자별로 기록해 두고, 그보다 먼저 시작한 DB 조회 결과는
+    저장하지 않아 취소된 등록코드가 다시 캐시되지 않도록 합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = settings.WATCH_IDENTITY_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, WatchIdentity]] = {}
+        self._codes_by_caree: Dict[int, str] = {}
+        # 프로세스 내 무효화 순번 (피보호자별 마지막 무효화 시점, 전체 비움 시점)
+        self._local_sequence = 0
+        self._invalidated_at: Dict[int, int] = {}
+        self._cleared_at = 0
+        self._redis: Optional[Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get(self, registration_code: str) -> Optional[WatchIdentity]:
+        entry = self._entries.get(registration_code)
+        if entry is not None:
+            expires_at, identity = entry
+            if expires_at > time.monotonic():
+                self.local_hits += 1
+                return identity
+            self._drop_code(registration_code)
+
+        local_sequence = self._local_sequence
+        try:
+            raw = await get_redis().get(f"{CODE_KEY_PREFIX}{registration_code}")
+        except Exception as e:
+            logger.warning(f"워치 인증 캐시 Redis 조회 실패: {str(e)}")
+            raw = None
+
+        if raw is not None:
+            identity = WatchIdentity(**json.loads(raw))
+            # 조회 중 무효화 메시지를 받았다면 삭제 전 값일 수 있으므로 이번 요청에만 사용
+            self._store_local(registration_code, identity, local_sequence)
+            self.redis_hits += 1
+            return identity
+
+        self.misses += 1
+        return None
+
+    async def fill_version(self) -> FillVersion:
+        """캐시 미스 후 DB 조회 직전에 호출 (결과는 set()에 전달)"""
+        try:
+            redis_sequence = int(await get_redis().get(SEQUENCE_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"워치 인증 캐시 무효화 순번 조회 실패: {str(e)}")
+            redis_sequence = None
+        return FillVersion(redis_sequence=redis_sequence, local_sequence=self._local_sequence)
+
+    async def set(self, registration_code: str, identity: WatchIdentity, version: FillVersion) -> bool:
+        """version 이후 피보호자가 무효화되지 않았을 때만 저장 (저장하지 않았으면 False)"""
+        if not self._store_local(registration_code, identity, version.local_sequence):
+            return False
+        if version.redis_sequence is None:
+            # 무효화 순번을 확인할 수 없으면 Redis에는 저장하지 않음 (로컬 캐시는 pub/sub으로 무효화)
+            return True
+
+        ttl = int(self.ttl_seconds)
+        try:
+            stored = await get_redis().eval(
+                SET_IF_NOT_INVALIDATED_SCRIPT,
+                3,
+                f"{INVALIDATED_KEY_PREFIX}{identity.caree_id}",
+                f"{CODE_KEY_PREFIX}{registration_code}",
+                # 피보호자 ID로 무효화할 수 있도록 역방향 키도 저장
+                f"{CAREE_KEY_PREFIX}{identity.caree_id}",
+                version.redis_sequence,
+                json.dumps(asdict(identity), ensure_ascii=False),
+                registration_code,
+                ttl
+            )
+        except Exception as e:
+            logger.warning(f"워치 인증 캐시 Redis 저장 실패: {str(e)}")
+            return True
+
+        if not stored:
+            # 다른 워커에서 무효화됨: pub/sub 메시지보다 먼저 알게 된 경우 로컬 항목도 제거
+            self._drop_code(registration_code)
+            return False
+        return True
+
+    async def invalidate(self, caree_id: int) -> None:
+        """피보호자의 캐시 항목 삭제 (현재 프로세스 + Redis + 다른 워커)"""
+        self._drop_caree(caree_id)
+        redis = get_redis()
+        try:
+            # 무효화 표시는 진행 중인 DB 조회가 끝날 때까지만 있으면 되지만 캐시 TTL만큼 유지
+            await redis.eval(
+                INVALIDATE_SCRIPT,
+                3,
+                SEQUENCE_KEY,
+                f"{INVALIDATED_KEY_PREFIX}{caree_id}",
+                f"{CAREE_KEY_PREFIX}{caree_id}",
+                int(self.ttl_seconds),
+                CODE_KEY_PREFIX
+            )
+            await redis.publish(INVALIDATION_CHANNEL, str(caree_id))
+        except Exception as e:
+            logger.warning(f"워치 인증 캐시 무효화 실패 (TTL 만료 후 갱신): {str(e)}")
+
+    def _store_local(self, registration_code: str, identity: WatchIdentity, local_sequence: int) -> bool:
+        invalidated_at = max(self._invalidated_at.get(identity.caree_id, 0), self._cleared_at)
+        if invalidated_at > local_sequence:
+            return False
+        self._entries[registration_code] = (time.monotonic() + self.ttl_seconds, identity)
+        self._codes_by_caree[identity.caree_id] = registration_code
+        return True
+
+    def _drop_code(self, registration_code: str) -> None:
+        entry = self._entries.pop(registration_code, None)
+        if entry is not None and self._codes_by_caree.get(entry[1].caree_id) == registration_code:
+            del self._codes_by_caree[entry[1].caree_id]
+
+    def _drop_caree(self, caree_id: int) -> None:
+        self._local_sequence += 1
+        self._invalidated_at[caree_id] = self._local_sequence
+        registration_code = self._codes_by_caree.pop(caree_id, None)
+        if registration_code is not None:
+            self._entries.pop(registration_code, None)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._drop_caree(int(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"워치 인증 캐시 무효화 구독 오류, 재연결합니다: {str(e)}")
+                # 구독이 끊긴 동안의 무효화를 놓쳤을 수 있으므로 로컬 캐시를 비움
+                self._local_sequence += 1
+                self._cleared_at = self._local_sequence
+                self._entries.clear()
+                self._codes_by_caree.clear()
+                await asyncio.sleep(1)
+            finally:
+                # 재연결 전에 이전 연결을 닫음 (끊긴 pub/sub 연결이 풀 밖에 쌓이지 않도록)
+                await close_pubsub(pubsub)
+
+    async def start(self, redis: Redis) -> None:
+        self._redis = redis
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+watch_identity_cache = WatchIdentityCache()
@@ -1,50 +1,42 @@
-from fastapi import Depends, HTTPException, status
+import hmac
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from db.session import get_db
-from utils.jwt import get_user_id_from_token
-from crud.user import get_user_by_id
-from models.user import User
+from services.token_verifier import Principal, token_verifier
+from utils.config import settings
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    user_id = get_user_id_from_token(token)
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """토큰 클레임만으로 인증 (DB 조회 없음, 폐기 여부는 Redis에서 확인)"""
+    principal = await token_verifier.verify(credentials.credentials)
     
-    if user_id is None:
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = get_user_by_id(db, user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="사용자를 찾을 수 없습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    return user
+    return principal
 
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    principal: Principal = Depends(get_current_principal)
 ) -> str:
-    token = credentials.credentials
-    user_id = get_user_id_from_token(token)
-    
-    if user_id is None:
+    return principal.user_id
+
+
+async def require_ops_token(x_ops_token: Optional[str] = Header(None)) -> None:
+    """운영 점검 API 인증 (OPS_API_TOKEN이 설정되지 않은 환경에서는 404)"""
+    if not settings.OPS_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_ops_token is None or not hmac.compare_digest(x_ops_token, settings.OPS_API_TOKEN):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="운영 토큰이 올바르지 않습니다."
         )
-    
-    return user_id
\ No newline at end of file
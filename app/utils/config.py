@@ -5,8 +5,53 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Settings:
+    # 로깅
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # 로거별 레벨 (예: "crud.navigation=DEBUG,services.geofence=WARNING")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "httpx=WARNING")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    # 경로 prefix별 INFO 이하 로그 샘플링 비율 (WARNING 이상은 항상 기록)
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "/navigation=0.1,/api/location/caree=0.1")
+    
+    # 운영 서버 (server.py, uvicorn 멀티 워커)
+    SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT: int = int(os.getenv("SERVER_PORT", "7777"))
+    # 워커 수 (server.py가 지정하지 않으면 CPU 코어 수로 정해 워커에 전달)
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # 종료 신호 후 진행 중인 요청을 기다리는 최대 시간 (이후 SSE 등 남은 연결을 끊고 버퍼를 flush)
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: float = float(os.getenv("SERVER_GRACEFUL_SHUTDOWN_SECONDS", "20"))
+    # 멀티 워커에서 /metrics가 모든 워커의 지표를 합산하도록 워커별 지표 파일을 두는 디렉터리
+    PROMETHEUS_MULTIPROC_DIR: str = os.getenv("PROMETHEUS_MULTIPROC_DIR", "/tmp/dolbomgil-metrics")
+    
+    # DB 커넥션 풀: 모든 워커가 나눠 쓰는 MySQL 연결 수 상한 (워커 수로 나눠 풀 크기 결정)
+    DB_MAX_CONNECTIONS: int = int(os.getenv("DB_MAX_CONNECTIONS", "60"))
+    # 지정하면 워커 수로 계산한 값 대신 사용
+    DB_POOL_SIZE: str = os.getenv("DB_POOL_SIZE", "")
+    DB_MAX_OVERFLOW: str = os.getenv("DB_MAX_OVERFLOW", "")
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    # 워커 기동 시 미리 열어 둘 DB 연결 수 (pool_size를 넘지 않음)
+    DB_POOL_PREWARM: int = int(os.getenv("DB_POOL_PREWARM", "4"))
+    # /readyz의 DB/Redis 확인 제한 시간
+    READINESS_CHECK_TIMEOUT: float = float(os.getenv("READINESS_CHECK_TIMEOUT", "2.0"))
+    
     # 카카오 모빌리티 API
     KAKAO_MOBILITY_API_KEY: str = os.getenv("KAKAO_MOBILITY_API_KEY", "")
+    KAKAO_API_BASE_URL: str = os.getenv("KAKAO_API_BASE_URL", "https://apis-navi.kakaomobility.com")
+    KAKAO_HTTP2: bool = os.getenv("KAKAO_HTTP2", "true").lower() == "true"
+    KAKAO_HTTP_CONNECT_TIMEOUT: float = float(os.getenv("KAKAO_HTTP_CONNECT_TIMEOUT", "3.0"))
+    KAKAO_HTTP_READ_TIMEOUT: float = float(os.getenv("KAKAO_HTTP_READ_TIMEOUT", "10.0"))
+    KAKAO_HTTP_MAX_CONNECTIONS: int = int(os.getenv("KAKAO_HTTP_MAX_CONNECTIONS", "100"))
+    KAKAO_HTTP_MAX_KEEPALIVE: int = int(os.getenv("KAKAO_HTTP_MAX_KEEPALIVE", "20"))
+    KAKAO_HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("KAKAO_HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    
+    # 길찾기 응답 캐시
+    ROUTE_CACHE_TTL_SECONDS: float = float(os.getenv("ROUTE_CACHE_TTL_SECONDS", "60"))
+    ROUTE_CACHE_MAX_ENTRIES: int = int(os.getenv("ROUTE_CACHE_MAX_ENTRIES", "1000"))
+    ROUTE_CACHE_SNAP_METERS: float = float(os.getenv("ROUTE_CACHE_SNAP_METERS", "20"))
+    
+    # 동일 길찾기 요청 합치기 (single-flight)
+    SINGLE_FLIGHT_LOCK_TTL_SECONDS: float = float(os.getenv("SINGLE_FLIGHT_LOCK_TTL_SECONDS", "15"))
+    SINGLE_FLIGHT_WAIT_SECONDS: float = float(os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", "12"))
     
     # 데이터베이스
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
@@ -16,5 +61,58 @@ class Settings:
     
     # Redis
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6378")
+    
+    # 위치 이동 경로 (PositionTrack)
+    POSITION_TRACK_BATCH_SIZE: int = int(os.getenv("POSITION_TRACK_BATCH_SIZE", "500"))
+    POSITION_TRACK_FLUSH_INTERVAL: float = float(os.getenv("POSITION_TRACK_FLUSH_INTERVAL", "1.0"))
+    POSITION_TRACK_RETENTION_DAYS: int = int(os.getenv("POSITION_TRACK_RETENTION_DAYS", "90"))
+    POSITION_TRACK_PARTITIONS_AHEAD: int = int(os.getenv("POSITION_TRACK_PARTITIONS_AHEAD", "2"))
+    
+    # 지오펜스 (안전구역 캐시)
+    GEOFENCE_CACHE_TTL_SECONDS: float = float(os.getenv("GEOFENCE_CACHE_TTL_SECONDS", "300"))
+    
+    # 비밀번호 해시 (bcrypt 전용 스레드 풀)
+    # thread: bcrypt 패키지 백엔드(GIL 해제), process: GIL을 잡는 백엔드만 있는 경우
+    PASSWORD_HASH_EXECUTOR: str = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    # 변경하면 기존 사용자는 다음 로그인 때 새 비용으로 다시 해시됨
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+    
+    # 보호자 토큰 검증 캐시 / 폐기 목록
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "60"))
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+    AUTH_DENYLIST_DEFAULT_TTL_SECONDS: int = int(os.getenv("AUTH_DENYLIST_DEFAULT_TTL_SECONDS", "86400"))
+    
+    # 알림 상태 (Redis cooldown) / AlertHistory 감사 로그 배치 기록
+    ALERT_GEOFENCE_COOLDOWN_SECONDS: int = int(os.getenv("ALERT_GEOFENCE_COOLDOWN_SECONDS", "300"))
+    ALERT_LOW_BATTERY_COOLDOWN_SECONDS: int = int(os.getenv("ALERT_LOW_BATTERY_COOLDOWN_SECONDS", "1800"))
+    ALERT_AUDIT_BATCH_SIZE: int = int(os.getenv("ALERT_AUDIT_BATCH_SIZE", "100"))
+    ALERT_AUDIT_FLUSH_INTERVAL: float = float(os.getenv("ALERT_AUDIT_FLUSH_INTERVAL", "2.0"))
+    
+    # 보호자 위치 실시간 스트림 (SSE)
+    LOCATION_STREAM_QUEUE_SIZE: int = int(os.getenv("LOCATION_STREAM_QUEUE_SIZE", "100"))
+    # 이 간격마다 keep-alive 주석을 보내고 토큰 폐기/만료 여부를 다시 확인
+    LOCATION_STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("LOCATION_STREAM_HEARTBEAT_SECONDS", "15"))
+    
+    # 보호자 홈 화면 스냅샷 (쓰기 경로에서 갱신, TTL은 최대 지연 한도)
+    HOME_SNAPSHOT_TTL_SECONDS: int = int(os.getenv("HOME_SNAPSHOT_TTL_SECONDS", "600"))
+    
+    # 워치 인증 (등록코드 -> 피보호자) 캐시
+    WATCH_IDENTITY_CACHE_TTL_SECONDS: float = float(os.getenv("WATCH_IDENTITY_CACHE_TTL_SECONDS", "600"))
+    
+    # 요청 지표 (/metrics): 요청 하나의 SQL 문 수가 이 값을 넘으면 경고 로그
+    METRICS_QUERY_WARN_THRESHOLD: int = int(os.getenv("METRICS_QUERY_WARN_THRESHOLD", "20"))
+    
+    # 운영 점검 API (/ops/*, X-Ops-Token 헤더로 인증). 비워 두면 비활성화
+    OPS_API_TOKEN: str = os.getenv("OPS_API_TOKEN", "")
+    
+    # 알림 발송 큐
+    NOTIFICATION_WORKER_COUNT: int = int(os.getenv("NOTIFICATION_WORKER_COUNT", "4"))
+    NOTIFICATION_MAX_ATTEMPTS: int = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "5"))
+    NOTIFICATION_RETRY_BASE_DELAY: float = float(os.getenv("NOTIFICATION_RETRY_BASE_DELAY", "2.0"))
+    NOTIFICATION_JOB_TTL_SECONDS: int = int(os.getenv("NOTIFICATION_JOB_TTL_SECONDS", "86400"))
+    # ACK 되지 않은 작업을 다른 워커가 회수하기까지의 idle 시간 (처리 중인 워커는 이 시간의 1/3마다 갱신)
+    NOTIFICATION_CLAIM_IDLE_SECONDS: float = float(os.getenv("NOTIFICATION_CLAIM_IDLE_SECONDS", "60"))
 
 settings = Settings()
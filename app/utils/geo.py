@@ -0,0 +1,109 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+EARTH_RADIUS_METERS = 6371000
+
+# 근사 거리 사전 필터의 안전 여유 (반경 배수, 고정 여유 m)
+PREFILTER_MARGIN = 1.5
+PREFILTER_SLACK_METERS = 100.0
+
+
+def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    R = EARTH_RADIUS_METERS
+    
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+    
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    
+    return R * c
+
+
+class ZoneContainment(NamedTuple):
+    distances: np.ndarray  # (N, M) 각 지점-구역 중심 간 거리 (m)
+    inside: np.ndarray  # (N, M) 구역 반경 내부 여부
+    inside_any: np.ndarray  # (N,) 하나 이상의 구역 내부 여부
+
+
+def _as_array(values) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+def batch_distances(
+    latitudes: ArrayLike,
+    longitudes: ArrayLike,
+    zone_latitudes: ArrayLike,
+    zone_longitudes: ArrayLike
+) -> np.ndarray:
+    """N개 지점 x M개 구역 중심 간 하버사인 거리 (N, M)를 한 번에 계산"""
+    lat1 = np.radians(_as_array(latitudes))[:, None]
+    lon1 = np.radians(_as_array(longitudes))[:, None]
+    lat2 = np.radians(_as_array(zone_latitudes))[None, :]
+    lon2 = np.radians(_as_array(zone_longitudes))[None, :]
+
+    a = (np.sin((lat2 - lat1) / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return EARTH_RADIUS_METERS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _approximate_squared_degrees(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    zone_latitudes: np.ndarray,
+    zone_longitudes: np.ndarray
+) -> np.ndarray:
+    """등장방형(equirectangular) 근사 거리의 제곱 (N, M, 도^2) - 사전 필터용
+
+    지점마다 cos를 한 번만 계산하고 나머지는 사칙연산만 사용하므로 하버사인보다 훨씬 가볍습니다.
+    """
+    delta_lat = zone_latitudes[None, :] - latitudes[:, None]
+    delta_lon = zone_longitudes[None, :] - longitudes[:, None]
+    # 날짜변경선(±180°)을 넘는 경우에만 경도 차이를 [-180, 180]으로 정규화
+    if delta_lon.size and np.abs(delta_lon).max() > 180:
+        delta_lon = (delta_lon + 180) % 360 - 180
+    delta_lon *= np.cos(np.radians(latitudes))[:, None]
+    return delta_lat * delta_lat + delta_lon * delta_lon
+
+
+def batch_containment(
+    latitudes: ArrayLike,
+    longitudes: ArrayLike,
+    zone_latitudes: ArrayLike,
+    zone_longitudes: ArrayLike,
+    zone_radius_meters: ArrayLike,
+    prefilter: bool = True
+) -> ZoneContainment:
+    """N개 지점이 M개 원형 구역 안에 있는지 한 번에 판정
+
+    prefilter=True이면 근사 거리로 모든 구역에서 충분히 먼 지점을 먼저 걸러내고,
+    남은 지점에 대해서만 하버사인 거리를 계산합니다. 걸러진 지점의 distances에는 근사 거리가 들어갑니다.
+    """
+    latitudes = _as_array(latitudes)
+    longitudes = _as_array(longitudes)
+    zone_latitudes = _as_array(zone_latitudes)
+    zone_longitudes = _as_array(zone_longitudes)
+    radius = _as_array(zone_radius_meters)[None, :]
+
+    if not prefilter:
+        distances = batch_distances(latitudes, longitudes, zone_latitudes, zone_longitudes)
+    else:
+        squared = _approximate_squared_degrees(latitudes, longitudes, zone_latitudes, zone_longitudes)
+        # 근사 오차를 감안해 반경의 PREFILTER_MARGIN 배 안쪽에 걸리는 지점만 정밀 계산
+        limit = np.degrees((radius * PREFILTER_MARGIN + PREFILTER_SLACK_METERS) / EARTH_RADIUS_METERS)
+        near = (squared <= limit * limit).any(axis=1)
+        distances = np.sqrt(squared, out=squared)
+        distances *= np.radians(EARTH_RADIUS_METERS)
+        if near.any():
+            distances[near] = batch_distances(
+                latitudes[near], longitudes[near], zone_latitudes, zone_longitudes
+            )
+
+    inside = distances <= radius
+    return ZoneContainment(distances=distances, inside=inside, inside_any=inside.any(axis=1))
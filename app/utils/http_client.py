@@ -0,0 +1,40 @@
+from typing import Optional
+
+import httpx
+from utils.config import settings
+
+_kakao_client: Optional[httpx.AsyncClient] = None
+
+
+def create_kakao_client() -> httpx.AsyncClient:
+    """카카오 모빌리티 API용 HTTP 클라이언트 생성 (keep-alive, HTTP/2, 커넥션 풀)"""
+    return httpx.AsyncClient(
+        base_url=settings.KAKAO_API_BASE_URL,
+        http2=settings.KAKAO_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.KAKAO_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KAKAO_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.KAKAO_HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.KAKAO_HTTP_CONNECT_TIMEOUT,
+            read=settings.KAKAO_HTTP_READ_TIMEOUT,
+            write=settings.KAKAO_HTTP_CONNECT_TIMEOUT,
+            pool=settings.KAKAO_HTTP_CONNECT_TIMEOUT
+        )
+    )
+
+
+def get_kakao_client() -> httpx.AsyncClient:
+    """앱 전체에서 공유하는 카카오 API 클라이언트 (lifespan 밖에서 호출되면 지연 생성)"""
+    global _kakao_client
+    if _kakao_client is None or _kakao_client.is_closed:
+        _kakao_client = create_kakao_client()
+    return _kakao_client
+
+
+async def close_kakao_client() -> None:
+    global _kakao_client
+    if _kakao_client is not None:
+        await _kakao_client.aclose()
+        _kakao_client = None
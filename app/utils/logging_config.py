@@ -0,0 +1,174 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from utils.config import settings
+
+# 요청 단위 로그 컨텍스트 (request_id, route, sampled)
+log_context: ContextVar[Optional[dict]] = ContextVar("log_context", default=None)
+
+SECRET_PATTERNS = [
+    # Authorization 헤더 값 (카카오 API 키, JWT, 워치 등록 코드)
+    (re.compile(r"\b(KakaoAK|Bearer)\s+[^\s'\",}]+", re.IGNORECASE), r"\1 ***"),
+    # key=value / 'key': 'value' 형태의 비밀 값
+    (
+        re.compile(
+            r"(['\"]?\b(?:authorization|api_key|password|secret|access_token|fcm_token|registration_code)\b['\"]?\s*[:=]\s*)"
+            r"(['\"]?)[^\s'\",}]+\2",
+            re.IGNORECASE
+        ),
+        r"\1\2***\2"
+    ),
+]
+# 위경도로 보이는 소수는 소수점 둘째 자리(약 1km)까지만 남김
+COORDINATE_PATTERN = re.compile(r"(?<![\d.])(-?\d{1,3}\.\d{2})\d{2,}")
+
+
+def mask(value: Optional[str], visible: int = 6) -> str:
+    """토큰 등 식별자를 앞부분만 남기고 가림"""
+    if not value:
+        return ""
+    return value[:visible] + "***" if len(value) > visible else "***"
+
+
+def redact(message: str) -> str:
+    for pattern, replacement in SECRET_PATTERNS:
+        message = pattern.sub(replacement, message)
+    return COORDINATE_PATTERN.sub(r"\1", message)
+
+
+class RedactionFilter(logging.Filter):
+    """로그 메시지에서 비밀 값과 정밀 좌표를 제거"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = redact(message)
+        record.args = None
+        if record.exc_text:
+            record.exc_text = redact(record.exc_text)
+        return True
+
+
+class ContextFilter(logging.Filter):
+    """요청 컨텍스트를 레코드에 복사하고, 샘플링에서 제외된 요청의 INFO 이하 로그를 버림"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = log_context.get()
+        record.request_id = context["request_id"] if context else None
+        record.route = context["route"] if context else None
+        if context is not None and not context["sampled"] and record.levelno < logging.WARNING:
+            return False
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if getattr(record, "request_id", None):
+            payload["request_id"] = record.request_id
+            payload["route"] = record.route
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def _parse_pairs(value: str) -> List[Tuple[str, str]]:
+    pairs = []
+    for item in value.split(","):
+        if "=" in item:
+            key, _, raw = item.partition("=")
+            pairs.append((key.strip(), raw.strip()))
+    return pairs
+
+
+# 경로 prefix별 샘플링 비율 (긴 prefix 우선)
+SAMPLE_RATES: List[Tuple[str, float]] = sorted(
+    ((prefix, float(rate)) for prefix, rate in _parse_pairs(settings.LOG_SAMPLE_RATES)),
+    key=lambda item: len(item[0]),
+    reverse=True
+)
+
+
+def sample_rate_for(path: str) -> float:
+    for prefix, rate in SAMPLE_RATES:
+        if path.startswith(prefix):
+            return rate
+    return 1.0
+
+
+class LogContextMiddleware:
+    """요청마다 request_id와 샘플링 여부를 정해 로그 컨텍스트에 설정 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1") or uuid.uuid4().hex[:16]
+        path = scope.get("path", "")
+        token = log_context.set({
+            "request_id": request_id,
+            "route": path,
+            "sampled": random.random() < sample_rate_for(path)
+        })
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            log_context.reset(token)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """루트 로거를 큐 핸들러로 구성 (포맷/출력은 별도 스레드에서 수행)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"))
+
+    # 필터는 호출한 스레드(요청 컨텍스트가 있는 곳)에서 실행되도록 큐 핸들러에 등록
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(RedactionFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.LOG_LEVEL.upper())
+    for name, level in _parse_pairs(settings.LOG_LEVELS):
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
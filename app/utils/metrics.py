@@ -0,0 +1,173 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "요청당 실행한 SQL 문 수",
+    ["route"],
+    buckets=STATEMENT_COUNT_BUCKETS
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "요청당 SQL 실행 시간 합계",
+    ["route"],
+    buckets=LATENCY_BUCKETS
+)
+REQUEST_EXTERNAL_DURATION = Histogram(
+    "http_request_external_duration_seconds",
+    "요청당 외부 API(카카오, FCM) 호출 시간 합계",
+    ["route", "service"],
+    buckets=LATENCY_BUCKETS
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL 문 실행 시간 (백그라운드 작업 포함)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS
+)
+EXTERNAL_CALL_DURATION = Histogram(
+    "external_call_duration_seconds",
+    "외부 API 호출 시간 (백그라운드 작업 포함)",
+    ["service", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+
+STATEMENT_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+# 경로 템플릿이 없는 요청(404 등)은 경로별 시계열이 무한히 늘지 않도록 하나로 묶음
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestMetrics:
+    """요청 하나에서 누적하는 SQL/외부 API 사용량"""
+    statements: int = 0
+    db_seconds: float = 0.0
+    external_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+# 요청 처리 중이 아니면 None (백그라운드 작업은 전역 히스토그램에만 기록)
+request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+def _statement_operation(statement: str) -> str:
+    operation = statement.lstrip()[:6].upper()
+    return operation if operation in STATEMENT_OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 모든 SQL 실행 시간을 기록하고 진행 중인 요청의 사용량에 더함"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        DB_STATEMENT_DURATION.labels(_statement_operation(statement)).observe(elapsed)
+        metrics = request_metrics.get()
+        if metrics is not None:
+            metrics.statements += 1
+            metrics.db_seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
+
+@contextmanager
+def track_external(service: str, operation: str) -> Iterator[None]:
+    """외부 API 호출 시간 기록 (asyncio.to_thread로 넘긴 호출도 요청 사용량에 합산됨)"""
+    metrics = request_metrics.get()
+    outcome = "ok"
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        outcome = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        EXTERNAL_CALL_DURATION.labels(service, operation, outcome).observe(elapsed)
+        if metrics is not None:
+            metrics.external_seconds[service] = metrics.external_seconds.get(service, 0.0) + elapsed
+
+
+def route_template(scope: dict) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """경로 템플릿별 지연시간, SQL 문 수/시간, 외부 API 시간 기록 (ASGI 미들웨어)
+
+    지연시간은 응답 헤더(http.response.start)를 보낼 때까지로 잽니다.
+    SSE 같은 스트리밍 응답은 연결이 유지되는 동안 본문을 계속 보내므로,
+    요청 종료 시점으로 재면 연결 시간이 지연시간 히스토그램에 섞입니다.
+    """
+
+    def __init__(self, app, exclude_paths=("/metrics", "/healthz", "/readyz")):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        status_code = 500
+        elapsed: Optional[float] = None
+
+        async def send_with_status(message):
+            nonlocal status_code, elapsed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - started
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 응답을 시작하지 못하고 예외로 끝난 요청은 종료 시점까지
+            if elapsed is None:
+                elapsed = time.perf_counter() - started
+            request_metrics.reset(token)
+            # 라우팅이 끝난 뒤 scope에 설정된 경로 템플릿 사용 (/api/caree/update/{caree_id})
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(scope["method"], route, str(status_code)).observe(elapsed)
+            REQUEST_DB_STATEMENTS.labels(route).observe(metrics.statements)
+            REQUEST_DB_DURATION.labels(route).observe(metrics.db_seconds)
+            for service, seconds in metrics.external_seconds.items():
+                REQUEST_EXTERNAL_DURATION.labels(route, service).observe(seconds)
+
+            if metrics.statements > settings.METRICS_QUERY_WARN_THRESHOLD:
+                logger.warning(
+                    f"{scope['method']} {route} 요청에서 SQL {metrics.statements}개 실행 "
+                    f"({metrics.db_seconds * 1000:.0f}ms, N+1 쿼리 의심)"
+                )
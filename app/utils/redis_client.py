@@ -0,0 +1,25 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis: Redis = None
+
+
+def get_redis() -> Redis:
+    """앱 전체에서 공유하는 Redis 클라이언트 (커넥션 풀 재사용)"""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+    return _redis
+
+
+async def close_pubsub(pubsub: PubSub) -> None:
+    """pub/sub 연결 닫기 (재연결할 때 이전 연결이 남지 않도록 새 연결을 만들기 전에 호출)"""
+    try:
+        await pubsub.aclose()
+    except Exception as e:
+        logger.warning(f"Redis pub/sub 연결 종료 실패: {str(e)}")
@@ -0,0 +1,200 @@
+import base64
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.geo import EARTH_RADIUS_METERS
+
+GEOMETRY_NESTED = "nested"
+GEOMETRY_POLYLINE = "polyline"
+GEOMETRY_FLOAT32 = "float32"
+
+# 웹 메르카토르 줌 0에서 적도 기준 1픽셀의 실제 거리 (m)
+METERS_PER_PIXEL_AT_ZOOM_0 = 156543.03392
+
+
+def vertexes_to_pairs(vertexes: List[float]) -> np.ndarray:
+    """[경도1, 위도1, 경도2, 위도2, ...] 배열을 (N, 2) 배열로 변환 (형식이 맞지 않으면 빈 배열)"""
+    if not vertexes or len(vertexes) % 2 != 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.asarray(vertexes, dtype=np.float64).reshape(-1, 2)
+
+
+def tolerance_for_zoom(zoom: int, latitude: float) -> float:
+    """지도 줌 레벨에서 1픽셀에 해당하는 거리 (m) - 이보다 작은 굴곡은 화면에서 구분되지 않음"""
+    return METERS_PER_PIXEL_AT_ZOOM_0 * math.cos(math.radians(latitude)) / (2 ** zoom)
+
+
+def simplify(
+    coordinates: np.ndarray,
+    tolerance_meters: float,
+    boundaries: Optional[List[int]] = None
+) -> np.ndarray:
+    """Douglas-Peucker 단순화 ((N, 2) [경도, 위도] 배열), 남길 점의 인덱스를 반환
+
+    boundaries(도로 경계 등)로 나뉜 구간을 각각 단순화하되, 모든 구간의 같은 깊이 분할을
+    한 번의 벡터 연산으로 처리합니다. 시작/끝점과 경계점은 항상 유지됩니다.
+    """
+    count = len(coordinates)
+    if count < 3 or tolerance_meters <= 0:
+        return np.arange(count)
+
+    # 짧은 경로이므로 등장방형 근사로 평면 좌표(m) 변환
+    meters_per_degree = math.radians(1) * EARTH_RADIUS_METERS
+    reference_latitude = math.radians(float(coordinates[:, 1].mean()))
+    x = coordinates[:, 0] * meters_per_degree * math.cos(reference_latitude)
+    y = coordinates[:, 1] * meters_per_degree
+
+    cuts = np.unique(np.clip(np.asarray([0, count - 1] + list(boundaries or []), dtype=np.int64), 0, count - 1))
+    keep = np.zeros(count, dtype=bool)
+    keep[cuts] = True
+    starts, ends = cuts[:-1], cuts[1:]
+
+    while len(starts):
+        interior = ends - starts - 1
+        active = interior > 0
+        starts, ends, interior = starts[active], ends[active], interior[active]
+        if not len(starts):
+            break
+
+        # 모든 구간의 내부 점 인덱스와 소속 구간 번호를 평탄화
+        segment = np.repeat(np.arange(len(starts)), interior)
+        offsets = np.concatenate(([0], np.cumsum(interior)[:-1]))
+        index = np.arange(interior.sum()) - np.repeat(offsets, interior) + np.repeat(starts + 1, interior)
+
+        start_x, start_y = x[starts][segment], y[starts][segment]
+        dx = x[ends][segment] - start_x
+        dy = y[ends][segment] - start_y
+        px = x[index] - start_x
+        py = y[index] - start_y
+        length_squared = dx * dx + dy * dy
+        t = np.clip(
+            np.divide(px * dx + py * dy, length_squared, out=np.zeros_like(px), where=length_squared > 0),
+            0.0,
+            1.0
+        )
+        distances = np.hypot(px - t * dx, py - t * dy)
+
+        # 구간별 최대 거리 점 (동률이면 앞쪽 점)
+        max_distances = np.maximum.reduceat(distances, offsets)
+        is_max = distances == max_distances[segment]
+        split_segments, first = np.unique(segment[is_max], return_index=True)
+        split_index = index[is_max][first]
+        split = max_distances[split_segments] > tolerance_meters
+
+        split_segments, split_index = split_segments[split], split_index[split]
+        keep[split_index] = True
+        starts = np.concatenate((starts[split_segments], split_index))
+        ends = np.concatenate((split_index, ends[split_segments]))
+
+    return np.flatnonzero(keep)
+
+
+def encode_polyline(coordinates: np.ndarray, precision: int = 5) -> str:
+    """Google encoded polyline 알고리즘 ((N, 2) [경도, 위도] 배열, 인코딩은 표준대로 위도, 경도 순)"""
+    if len(coordinates) == 0:
+        return ""
+
+    scaled = np.round(coordinates[:, ::-1] * (10 ** precision)).astype(np.int64)
+    deltas = np.diff(scaled, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+    # zigzag: 음수를 홀수로 매핑
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    # 값마다 최대 7개의 5비트 묶음으로 분해 (int32 범위의 좌표 차이면 충분)
+    shifts = np.arange(7, dtype=np.int64) * 5
+    remaining = values[:, None] >> shifts
+    chunks = remaining & 0x1F
+    needed = remaining > 0
+    needed[:, 0] = True
+    has_next = np.zeros_like(needed)
+    has_next[:, :-1] = needed[:, 1:]
+    encoded = (chunks | np.where(has_next, 0x20, 0)) + 63
+    return encoded[needed].astype(np.uint8).tobytes().decode("ascii")
+
+
+def encode_float32(coordinates: np.ndarray) -> str:
+    """[경도1, 위도1, ...] 평탄화 float32(little-endian) 배열을 base64 문자열로 변환"""
+    return base64.b64encode(coordinates.astype("<f4").tobytes()).decode("ascii")
+
+
+def _encode_vertexes(coordinates: np.ndarray, geometry: str) -> Dict[str, Any]:
+    if geometry == GEOMETRY_POLYLINE:
+        return {"polyline": encode_polyline(coordinates)}
+    if geometry == GEOMETRY_FLOAT32:
+        return {"vertexes_float32": encode_float32(coordinates)}
+    return {"vertexes": coordinates.tolist()}
+
+
+def encode_route_geometry(
+    response_data: Dict[str, Any],
+    geometry: str = GEOMETRY_NESTED,
+    zoom: Optional[int] = None
+) -> Dict[str, Any]:
+    """길찾기 응답의 vertexes를 요청한 형식으로 변환한 새 dict 반환 (원본은 캐시 공유 객체이므로 수정하지 않음)
+
+    geometry가 nested이고 zoom이 없으면 원본을 그대로 반환합니다.
+    """
+    if geometry == GEOMETRY_NESTED and zoom is None:
+        return response_data
+    routes = response_data.get("routes")
+    if not routes:
+        return response_data
+
+    converted_routes = []
+    for route in routes:
+        sections = route.get("sections") or []
+        # route 안의 vertexes를 가진 section/road를 모아 한 번에 단순화
+        containers = []
+        for section in sections:
+            if "vertexes" in section:
+                containers.append(section)
+            containers.extend(road for road in section.get("roads") or [] if "vertexes" in road)
+
+        coordinates_list = [
+            np.asarray(container["vertexes"], dtype=np.float64).reshape(-1, 2)
+            if container["vertexes"] else np.empty((0, 2))
+            for container in containers
+        ]
+        if zoom is not None and coordinates_list:
+            all_coordinates = np.concatenate(coordinates_list)
+            lengths = [len(coordinates) for coordinates in coordinates_list]
+            ends = np.cumsum(lengths)
+            boundaries = np.concatenate((ends - np.asarray(lengths), ends - 1)).tolist()
+            summary_origin = (route.get("summary") or {}).get("origin") or {}
+            kept = simplify(all_coordinates, tolerance_for_zoom(zoom, summary_origin.get("y", 37.5)), boundaries)
+            kept_mask = np.zeros(len(all_coordinates), dtype=bool)
+            kept_mask[kept] = True
+            coordinates_list = [
+                coordinates[kept_mask[end - length:end]]
+                for coordinates, length, end in zip(coordinates_list, lengths, ends)
+            ]
+
+        encoded = {
+            id(container): _encode_vertexes(coordinates, geometry)
+            for container, coordinates in zip(containers, coordinates_list)
+        }
+
+        def convert(container: Dict[str, Any]) -> Dict[str, Any]:
+            if id(container) not in encoded:
+                return container
+            converted = {key: value for key, value in container.items() if key != "vertexes"}
+            converted.update(encoded[id(container)])
+            return converted
+
+        converted_sections = []
+        for section in sections:
+            converted_section = dict(convert(section))
+            if isinstance(section.get("roads"), list):
+                converted_section["roads"] = [convert(road) for road in section["roads"]]
+            converted_sections.append(converted_section)
+
+        converted_route = dict(route)
+        if "sections" in route:
+            converted_route["sections"] = converted_sections
+        converted_routes.append(converted_route)
+
+    converted_response = dict(response_data)
+    converted_response["routes"] = converted_routes
+    converted_response["geometry_format"] = geometry
+    return converted_response
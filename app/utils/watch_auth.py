@@ -1,21 +1,28 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
 from crud.registration_code import get_registration_code_by_code
 from models.caree import Caree
+from services.watch_identity import WatchIdentity, watch_identity_cache
 
 security = HTTPBearer()
 
 
 async def get_caree_from_registration_code(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> Caree:
-    """등록코드로 피보호자 인증"""
+    db: AsyncSession = Depends(get_db)
+) -> WatchIdentity:
+    """등록코드로 피보호자 인증 (캐시 적중 시 DB 조회 없음)"""
     registration_code = credentials.credentials
     
-    code_record = get_registration_code_by_code(db, registration_code)
+    identity = await watch_identity_cache.get(registration_code)
+    if identity is not None:
+        return identity
+    
+    # DB 조회 중 등록코드가 취소되면 조회 결과를 캐시하지 않도록 조회 전에 무효화 순번을 읽음
+    version = await watch_identity_cache.fill_version()
+    code_record = await get_registration_code_by_code(db, registration_code)
     if not code_record:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -23,7 +30,7 @@ async def get_caree_from_registration_code(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    caree = db.query(Caree).filter(Caree.caree_id == code_record.caree_id).first()
+    caree = await db.get(Caree, code_record.caree_id)
     if not caree:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,4 +38,11 @@ async def get_caree_from_registration_code(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return caree
\ No newline at end of file
+    identity = WatchIdentity(
+        caree_id=caree.caree_id,
+        name=caree.name,
+        care_level=caree.care_level,
+        created_by_user_id=caree.created_by_user_id
+    )
+    await watch_identity_cache.set(registration_code, identity, version)
+    return identity
@@ -0,0 +1,101 @@
+"""
+워커 콜드 스타트 측정
+
+app/server.py를 여러 번 새로 띄우면서 프로세스 시작부터 /readyz가 200을 반환할 때까지의 시간,
+/readyz가 보고하는 기동 단계별 시간(db_pool, redis, kakao, fcm, services), 첫 요청과 이후 요청의
+지연시간을 측정합니다. --migrate를 주면 배포 단계인 migrate.py 실행 시간도 따로 잽니다.
+
+    python benchmarks/cold_start.py --runs 5 --code 123456
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+
+
+async def wait_until_ready(client: httpx.AsyncClient, base_url: str, timeout: float) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get(f"{base_url}/readyz")
+            if response.status_code == 200:
+                return response.json()
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.05)
+    raise RuntimeError(f"서버가 {timeout:.0f}초 안에 준비되지 않았습니다: {base_url}")
+
+
+async def timed_request(client: httpx.AsyncClient, base_url: str, code: str) -> float:
+    started = time.perf_counter()
+    response = await client.post(
+        f"{base_url}/api/location/caree",
+        json={"latitude": 37.5665, "longitude": 126.9780, "accuracy_meters": 5.0, "battery_level": 80},
+        headers={"Authorization": f"Bearer {code}"}
+    )
+    response.raise_for_status()
+    return (time.perf_counter() - started) * 1000
+
+
+async def measure_once(args) -> dict:
+    env = {**os.environ, "WEB_CONCURRENCY": str(args.workers), "SERVER_PORT": str(args.port)}
+    base_url = f"http://127.0.0.1:{args.port}"
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "server.py"], cwd=APP_DIR, env=env)
+    try:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            body = await wait_until_ready(client, base_url, args.startup_timeout)
+            result = {"ready": time.perf_counter() - started, "phases": body.get("phases", {})}
+            if args.code:
+                result["first_ms"] = await timed_request(client, base_url, args.code)
+                result["warm_ms"] = statistics.median([await timed_request(client, base_url, args.code) for _ in range(10)])
+            return result
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+
+def run_migrate() -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "migrate.py"], cwd=APP_DIR, check=True)
+    return time.perf_counter() - started
+
+
+async def main(args) -> None:
+    if args.migrate:
+        print(f"migrate.py: {run_migrate():.2f}s (배포 시 한 번)")
+
+    results = []
+    for index in range(args.runs):
+        result = await measure_once(args)
+        phases = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in result["phases"].items())
+        line = f"실행 {index + 1}: readyz까지 {result['ready'] * 1000:.0f}ms ({phases})"
+        if args.code:
+            line += f", 첫 요청 {result['first_ms']:.1f}ms / 이후 {result['warm_ms']:.1f}ms"
+        print(line)
+        results.append(result)
+
+    print(f"\nreadyz까지 중앙값: {statistics.median(r['ready'] for r in results) * 1000:.0f}ms (워커 {args.workers}개)")
+    if args.code:
+        print(f"첫 요청 중앙값: {statistics.median(r['first_ms'] for r in results):.1f}ms, "
+              f"이후 요청 중앙값: {statistics.median(r['warm_ms'] for r in results):.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="워커 콜드 스타트 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--code", help="첫 요청 지연시간 측정에 사용할 워치 등록코드")
+    parser.add_argument("--migrate", action="store_true", help="migrate.py 실행 시간도 측정")
+    parser.add_argument("--port", type=int, default=17778)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+"""
+스칼라 하버사인 vs NumPy 배치 커널 마이크로 벤치마크
+
+1, 100, 100,000개 지점에 대해 여러 안전구역 포함 여부를 판정하는 시간을 비교합니다.
+
+    python benchmarks/geo_kernel.py --zones 5
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from utils.geo import calculate_distance, batch_containment  # noqa: E402
+
+
+def scalar_containment(latitudes, longitudes, zones) -> list:
+    results = []
+    for latitude, longitude in zip(latitudes, longitudes):
+        inside = False
+        for zone_latitude, zone_longitude, radius in zones:
+            if calculate_distance(latitude, longitude, zone_latitude, zone_longitude) <= radius:
+                inside = True
+                break
+        results.append(inside)
+    return results
+
+
+def bench(func, repeat: int) -> float:
+    number = 1
+    # 1회 실행이 너무 짧으면 반복 횟수를 늘려 측정 오차를 줄임
+    while timeit.timeit(func, number=number) < 0.2 and number < 1_000_000:
+        number *= 10
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지오펜스 판정 커널 벤치마크")
+    parser.add_argument("--zones", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    zone_latitudes = rng.uniform(37.45, 37.65, args.zones)
+    zone_longitudes = rng.uniform(126.85, 127.15, args.zones)
+    zone_radius = rng.uniform(100, 3000, args.zones)
+    zones = list(zip(zone_latitudes.tolist(), zone_longitudes.tolist(), zone_radius.tolist()))
+
+    print(f"안전구역 {args.zones}개")
+    print(f"{'지점 수':>10} {'스칼라':>14} {'배치':>14} {'배치(필터X)':>14} {'배속':>8}")
+    for points in (1, 100, 100_000):
+        latitudes = rng.uniform(37.3, 37.8, points)
+        longitudes = rng.uniform(126.7, 127.3, points)
+        lat_list, lon_list = latitudes.tolist(), longitudes.tolist()
+
+        scalar = bench(lambda: scalar_containment(lat_list, lon_list, zones), args.repeat)
+        batch = bench(lambda: batch_containment(latitudes, longitudes, zone_latitudes, zone_longitudes, zone_radius), args.repeat)
+        batch_exact = bench(lambda: batch_containment(latitudes, longitudes, zone_latitudes, zone_longitudes, zone_radius, prefilter=False), args.repeat)
+
+        print(f"{points:>10} {scalar * 1e3:>12.3f}ms {batch * 1e3:>12.3f}ms {batch_exact * 1e3:>12.3f}ms {scalar / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
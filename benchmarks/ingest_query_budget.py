@@ -0,0 +1,92 @@
+"""
+POST /api/location/caree 요청당 쿼리 수 회귀 검사
+
+앱을 프로세스 안에서(httpx ASGITransport, lifespan 포함) 띄우고 워치 위치를 여러 번 보내면서
+각 요청이 실행한 SQL 문 수를 셉니다. 첫 요청은 워치 인증/안전구역 캐시를 채우므로 제외하고,
+이후 요청 중 하나라도 --budget을 넘으면 실패(exit code 1)로 끝납니다.
+알림 워커, 위치 버퍼 flush 등 백그라운드 작업의 쿼리는 세지 않습니다.
+
+    cd app && python ../benchmarks/ingest_query_budget.py --code 123456 --pings 20 --budget 3
+"""
+import argparse
+import asyncio
+import contextvars
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from db.session import async_engine  # noqa: E402
+from main import app, lifespan  # noqa: E402
+
+# 현재 측정 중인 요청의 문장 목록 (요청 태스크에서 만든 쿼리만 기록)
+_current_statements: contextvars.ContextVar = contextvars.ContextVar("current_statements", default=None)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    statements = _current_statements.get()
+    if statements is not None:
+        statements.append(" ".join(statement.split())[:100])
+
+
+async def ping(client: httpx.AsyncClient, code: str, latitude: float, longitude: float) -> list:
+    statements: list = []
+    _current_statements.set(statements)
+    response = await client.post(
+        "/api/location/caree",
+        json={
+            "latitude": latitude + random.uniform(-0.0005, 0.0005),
+            "longitude": longitude + random.uniform(-0.0005, 0.0005),
+            "accuracy_meters": 5.0,
+            "battery_level": random.randint(21, 100)
+        },
+        headers={"Authorization": f"Bearer {code}"}
+    )
+    response.raise_for_status()
+    return statements
+
+
+async def main(code: str, pings: int, budget: int, latitude: float, longitude: float) -> int:
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    over_budget = []
+    try:
+        async with lifespan(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://ingest-check") as client:
+                # 별도 태스크로 실행해 요청마다 독립된 컨텍스트에서 세도록 함
+                warmup = await asyncio.create_task(ping(client, code, latitude, longitude))
+                print(f"첫 요청 (캐시 적재): {len(warmup)}개 쿼리")
+                for index in range(1, pings + 1):
+                    statements = await asyncio.create_task(ping(client, code, latitude, longitude))
+                    print(f"요청 {index:>3}: {len(statements)}개 쿼리")
+                    if len(statements) > budget:
+                        over_budget.append((index, statements))
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        await async_engine.dispose()
+
+    if over_budget:
+        print(f"\n쿼리 예산({budget}개) 초과:")
+        for index, statements in over_budget:
+            print(f"  - 요청 {index}")
+            for statement in statements:
+                print(f"      {statement}")
+        return 1
+
+    print(f"\n모든 위치 수신 요청이 쿼리 {budget}개 이하입니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--code", required=True, help="피보호자 워치 등록코드")
+    parser.add_argument("--pings", type=int, default=20)
+    parser.add_argument("--budget", type=int, default=3, help="캐시 적재 후 요청당 허용 쿼리 수")
+    parser.add_argument("--latitude", type=float, default=37.5665)
+    parser.add_argument("--longitude", type=float, default=126.9780)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.code, args.pings, args.budget, args.latitude, args.longitude)))
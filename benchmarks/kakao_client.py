@@ -0,0 +1,130 @@
+"""
+카카오 모빌리티 API 호출: 요청마다 새 클라이언트 vs 공유 커넥션 풀 비교
+
+로컬 스텁 서버(카카오 길찾기 응답 형태의 JSON 반환)를 띄우고 같은 NavigationService.get_route를
+1) 호출마다 httpx.AsyncClient를 새로 만드는 방식(기존 동작)과
+2) 앱 전체에서 공유하는 커넥션 풀 클라이언트로 각각 실행해 지연 시간을 비교합니다.
+스텁은 평문 HTTP이므로 --handshake-ms로 새 연결마다 TLS 핸드셰이크 왕복 시간을 흉내 낼 수 있습니다.
+
+    python benchmarks/kakao_client.py --requests 500 --concurrency 20 --handshake-ms 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+os.environ.setdefault("KAKAO_MOBILITY_API_KEY", "benchmark")
+# 스텁 서버는 평문 HTTP/1.1만 지원
+os.environ.setdefault("KAKAO_HTTP2", "false")
+
+import httpx  # noqa: E402
+
+from crud.navigation import NavigationService  # noqa: E402
+from schema.navigation import NavigationRequest  # noqa: E402
+from utils.http_client import create_kakao_client  # noqa: E402
+
+ROUTE_BODY = json.dumps({
+    "trans_id": "benchmark",
+    "routes": [{
+        "result_code": 0,
+        "result_msg": "길찾기 성공",
+        "summary": {"distance": 1200, "duration": 300},
+        "sections": [{
+            "distance": 1200,
+            "duration": 300,
+            "roads": [{
+                "name": "",
+                "distance": 100,
+                "duration": 25,
+                "vertexes": [127.0 + i * 0.0001 if j == 0 else 37.5 + i * 0.0001 for i in range(50) for j in (0, 1)]
+            } for _ in range(12)]
+        }]
+    }]
+}).encode()
+
+
+async def run_stub_server(handshake_seconds: float) -> asyncio.AbstractServer:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # 새 연결마다 TLS 핸드셰이크 왕복 시간만큼 지연
+        if handshake_seconds:
+            await asyncio.sleep(handshake_seconds)
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(ROUTE_BODY)).encode() + b"\r\n"
+                    b"Connection: keep-alive\r\n\r\n" + ROUTE_BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def measure(label: str, call, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{label:<26} {total / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(latencies):7.2f} ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1]:7.2f} ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1]:7.2f} ms"
+    )
+
+
+async def main(args) -> None:
+    server = await run_stub_server(args.handshake_ms / 1000)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+    request = NavigationRequest(origin="127.0,37.5", destination="127.01,37.51")
+
+    async def per_call_client():
+        # 기존 동작: 호출마다 클라이언트(및 TCP 연결) 생성
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            await NavigationService(client=client).get_route(request)
+
+    shared_client = create_kakao_client()
+    shared_client.base_url = base_url
+    shared_service = NavigationService(client=shared_client)
+
+    async def shared_pool():
+        await shared_service.get_route(request)
+
+    print(f"stub {base_url}, {args.requests} requests, concurrency {args.concurrency}, handshake {args.handshake_ms} ms")
+    await measure("client per call", per_call_client, args.requests, args.concurrency)
+    await measure("shared pooled client", shared_pool, args.requests, args.concurrency)
+
+    await shared_client.aclose()
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=0.0)
+    asyncio.run(main(parser.parse_args()))
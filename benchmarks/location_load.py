@@ -0,0 +1,80 @@
+"""
+POST /api/location/caree 부하 테스트
+
+동시에 여러 워치가 위치를 전송하는 상황을 흉내내어 처리량(req/s)과 지연시간을 측정합니다.
+동기 세션 기반 서버와 비동기 세션 기반 서버를 각각 띄운 뒤 같은 옵션으로 실행해 비교합니다.
+
+    python benchmarks/location_load.py --base-url http://localhost:7777 \
+        --code 123456 --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+
+
+async def _worker(client: httpx.AsyncClient, url: str, headers: dict, queue: asyncio.Queue, latencies: list, errors: list):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        payload = {
+            "latitude": 37.5665 + random.uniform(-0.01, 0.01),
+            "longitude": 126.9780 + random.uniform(-0.01, 0.01),
+            "accuracy_meters": 5.0,
+            "battery_level": random.randint(21, 100)
+        }
+        started = time.perf_counter()
+        try:
+            response = await client.post(url, json=payload, headers=headers)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, code: str, total: int, concurrency: int) -> dict:
+    url = f"{base_url.rstrip('/')}/api/location/caree"
+    headers = {"Authorization": f"Bearer {code}"}
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    latencies: list = []
+    errors: list = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _worker(client, url, headers, queue, latencies, errors)
+            for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"요청 수: {total}, 동시성: {concurrency}, 실패: {len(errors)}")
+    print(f"처리량: {total / elapsed:.1f} req/s (총 {elapsed:.2f}s)")
+    print(f"지연시간: p50 {p50:.1f}ms, p95 {p95:.1f}ms, p99 {p99:.1f}ms")
+    return {"throughput": total / elapsed, "p50": p50, "p95": p95, "p99": p99, "errors": len(errors)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피보호자 위치 업데이트 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:7777")
+    parser.add_argument("--code", required=True, help="워치 인증에 사용할 등록코드")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.code, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+로그인 몰림 시 이벤트 루프 지연 측정: bcrypt 인라인 실행 vs 전용 스레드 풀
+
+동시 로그인 N건의 비밀번호 검증을 실행하는 동안 10ms 간격 타이머(워치 위치 전송 등
+다른 요청을 대신함)가 얼마나 늦게 깨어나는지 비교합니다.
+
+    python benchmarks/password_hashing.py --logins 20 --rounds 12 --executor thread
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from passlib.context import CryptContext  # noqa: E402
+
+from services.password_hasher import PasswordHasher  # noqa: E402
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.01) -> list:
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+    return lags
+
+
+async def run(label: str, verify, logins: int) -> None:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    lags = await probe
+    print(
+        f"{label:<20} total {elapsed * 1000:8.1f} ms  "
+        f"loop lag p50 {statistics.median(lags):7.1f} ms  max {max(lags):7.1f} ms"
+    )
+
+
+async def main(args) -> None:
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.logins, rounds=args.rounds, executor=args.executor)
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=args.rounds)
+    password_hash = context.hash("benchmark-password")
+
+    async def inline():
+        context.verify("benchmark-password", password_hash)
+
+    async def pooled():
+        await hasher.verify_and_update("benchmark-password", password_hash)
+
+    print(f"logins {args.logins}, bcrypt rounds {args.rounds}, {args.executor} workers {args.workers}")
+    await run("inline (기존)", inline, args.logins)
+    await run(f"{args.executor} pool", pooled, args.logins)
+    print(hasher.stats())
+    hasher.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,107 @@
+"""
+crud/* 핫 쿼리 실행계획(EXPLAIN) 회귀 검사
+
+각 crud 함수를 실제 DB에 대해 실행하면서 발생한 SELECT 문을 가로채 EXPLAIN 하고,
+어떤 테이블이든 full table scan(type=ALL)으로 떨어지면 실패(exit code 1)로 끝납니다.
+마이그레이션(alembic upgrade head)이 적용된 DB를 대상으로 CI에서 실행합니다.
+
+    cd app && python ../benchmarks/query_plans.py
+    python -m pytest tests/test_query_plans.py   # MySQL DB URL이 설정된 경우에만 실행
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from sqlalchemy import event  # noqa: E402
+
+from db.session import async_engine, AsyncSessionLocal  # noqa: E402
+from crud.caree import get_carees_by_user  # noqa: E402
+from crud.fcm_token import get_user_fcm_tokens  # noqa: E402
+from crud.location import (  # noqa: E402
+    get_latest_caree_location,
+    get_latest_protector_location,
+    get_caree_track
+)
+from crud.registration_code import get_registration_code_by_code, get_registration_code_by_caree_id  # noqa: E402
+from crud.safe_zone import get_caree_by_user, get_safe_zone_by_user  # noqa: E402
+from services.geofence import active_zones_query  # noqa: E402
+
+SAMPLE_USER_ID = "plan_check_user"
+SAMPLE_CAREE_ID = 1
+
+HOT_QUERIES = [
+    ("crud.caree.get_carees_by_user", lambda db: get_carees_by_user(db, SAMPLE_USER_ID)),
+    ("crud.fcm_token.get_user_fcm_tokens", lambda db: get_user_fcm_tokens(db, SAMPLE_USER_ID)),
+    # crud.location.is_inside_safe_zone은 캐시를 거치므로 캐시 미스 시 실행되는 조회문을 직접 검사
+    ("services.geofence.active_zones_query", lambda db: db.execute(active_zones_query(SAMPLE_CAREE_ID))),
+    ("crud.location.get_latest_caree_location", lambda db: get_latest_caree_location(db, SAMPLE_CAREE_ID)),
+    ("crud.location.get_latest_protector_location", lambda db: get_latest_protector_location(db, SAMPLE_USER_ID)),
+    ("crud.location.get_caree_track", lambda db: get_caree_track(db, SAMPLE_CAREE_ID, datetime.now() - timedelta(days=1))),
+    ("crud.registration_code.get_registration_code_by_code", lambda db: get_registration_code_by_code(db, "000000")),
+    ("crud.registration_code.get_registration_code_by_caree_id", lambda db: get_registration_code_by_caree_id(db, SAMPLE_CAREE_ID)),
+    ("crud.safe_zone.get_caree_by_user", lambda db: get_caree_by_user(db, SAMPLE_USER_ID)),
+    ("crud.safe_zone.get_safe_zone_by_user", lambda db: get_safe_zone_by_user(db, SAMPLE_USER_ID)),
+]
+
+
+async def capture_selects(query) -> list:
+    """crud 함수 실행 중 발생한 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncSessionLocal() as db:
+            await query(db)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+async def explain(statement: str, parameters) -> list:
+    async with async_engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return [dict(row._mapping) for row in result]
+
+
+async def collect_plans() -> list:
+    """핫 쿼리별 EXPLAIN 결과 (쿼리 이름, 테이블, 접근 방식, 사용 인덱스)"""
+    plans = []
+    try:
+        for name, query in HOT_QUERIES:
+            for statement, parameters in await capture_selects(query):
+                for row in await explain(statement, parameters):
+                    plans.append((name, row.get("table"), row.get("type"), row.get("key")))
+    finally:
+        await async_engine.dispose()
+    return plans
+
+
+def full_scans(plans: list) -> list:
+    return [(name, table) for name, table, access_type, _ in plans if access_type == "ALL"]
+
+
+async def main() -> int:
+    plans = await collect_plans()
+    for name, table, access_type, key in plans:
+        print(f"{name:<60} {str(table):<18} type={str(access_type):<8} key={key}")
+
+    failures = full_scans(plans)
+    if failures:
+        print("\nfull table scan 발생:")
+        for name, table in failures:
+            print(f"  - {name} ({table})")
+        return 1
+
+    print("\n모든 핫 쿼리가 인덱스를 사용합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,99 @@
+"""
+길찾기 응답 좌표 처리/인코딩 벤치마크
+
+긴 도보 경로 형태의 응답을 만들어
+1) vertexes 전처리(기존 section/road별 Python 루프 vs 한 번의 NumPy 변환) 시간과
+2) geometry 형식(nested / polyline / float32)과 줌 단순화별 응답 크기를 비교합니다.
+
+    python benchmarks/route_geometry.py --vertexes 20000 --zoom 16
+"""
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+os.environ.setdefault("KAKAO_MOBILITY_API_KEY", "benchmark")
+
+from crud.navigation import NavigationService  # noqa: E402
+from utils.route_geometry import encode_route_geometry  # noqa: E402
+
+
+def build_response(vertex_count: int, roads: int) -> dict:
+    rng = np.random.default_rng(0)
+    steps = rng.normal(0, 0.00005, size=(vertex_count, 2)).cumsum(axis=0) + [127.0, 37.5]
+    per_road = np.array_split(steps, roads)
+    return {
+        "trans_id": "benchmark",
+        "routes": [{
+            "summary": {"origin": {"name": "", "x": 127.0, "y": 37.5}},
+            "sections": [{
+                "distance": 5000,
+                "duration": 3600,
+                "roads": [
+                    {"name": "", "distance": 10, "duration": 10, "vertexes": chunk.ravel().tolist()}
+                    for chunk in per_road
+                ]
+            }]
+        }]
+    }
+
+
+def legacy_process_routes(routes):
+    """기존 구현: section/road마다 Python 루프로 2개씩 묶음"""
+    def process_vertexes(vertexes):
+        if not vertexes or len(vertexes) % 2 != 0:
+            return []
+        return [[vertexes[i], vertexes[i + 1]] for i in range(0, len(vertexes), 2)]
+
+    for route in routes:
+        for section in route.get("sections") or []:
+            if isinstance(section.get("vertexes"), list):
+                section["vertexes"] = process_vertexes(section["vertexes"])
+            for road in section.get("roads") or []:
+                if isinstance(road.get("vertexes"), list):
+                    road["vertexes"] = process_vertexes(road["vertexes"])
+    return routes
+
+
+def timed(label: str, func, repeat: int) -> None:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    print(f"{label:<32} {elapsed:8.2f} ms")
+
+
+def main(args) -> None:
+    raw = build_response(args.vertexes, args.roads)
+    service = NavigationService()
+
+    print(f"vertexes {args.vertexes}, roads {args.roads}")
+    timed("legacy per-road loop", lambda: legacy_process_routes(copy.deepcopy(raw)["routes"]), args.repeat)
+    timed("vectorized process_routes", lambda: service.process_routes(copy.deepcopy(raw)["routes"]), args.repeat)
+    timed("deepcopy only (baseline)", lambda: copy.deepcopy(raw), args.repeat)
+
+    processed = copy.deepcopy(raw)
+    service.process_routes(processed["routes"])
+    print()
+    for geometry, zoom in [("nested", None), ("polyline", None), ("float32", None), ("nested", args.zoom), ("polyline", args.zoom)]:
+        started = time.perf_counter()
+        encoded = encode_route_geometry(processed, geometry, zoom)
+        elapsed = (time.perf_counter() - started) * 1000
+        size = len(json.dumps(encoded, separators=(",", ":")))
+        label = f"{geometry}" + (f" zoom={zoom}" if zoom is not None else "")
+        print(f"{label:<32} {size / 1024:8.1f} KiB  encode {elapsed:7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertexes", type=int, default=20000)
+    parser.add_argument("--roads", type=int, default=200)
+    parser.add_argument("--zoom", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,80 @@
+"""
+워커 수에 따른 위치 수신 처리량 비교
+
+app/server.py를 워커 수별로 띄워 같은 조건의 location_load 부하를 주고, 처리량/지연시간을 표로 출력합니다.
+DB 커넥션 풀은 워커 수에 맞춰 다시 계산되므로 DB_MAX_CONNECTIONS는 그대로 둡니다.
+서버 종료는 SIGTERM으로 하여 graceful shutdown(진행 중 요청 대기, 버퍼 flush)까지 걸린 시간도 함께 잽니다.
+
+    python benchmarks/worker_scaling.py --code 123456 --workers 1 2 4 --requests 5000 --concurrency 100
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from location_load import run  # noqa: E402
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+
+
+async def wait_until_ready(base_url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base_url}/readyz")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"서버가 {timeout:.0f}초 안에 준비되지 않았습니다: {base_url}")
+
+
+async def measure(workers: int, args) -> dict:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "SERVER_PORT": str(args.port)}
+    server = subprocess.Popen([sys.executable, "server.py"], cwd=APP_DIR, env=env)
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        await wait_until_ready(base_url, args.startup_timeout)
+        # 커넥션 풀/캐시 적재용 워밍업
+        await run(base_url, args.code, args.concurrency * 2, args.concurrency)
+        result = await run(base_url, args.code, args.requests, args.concurrency)
+    finally:
+        started = time.perf_counter()
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+    return {**result, "workers": workers, "shutdown": time.perf_counter() - started}
+
+
+async def main(args) -> None:
+    results = []
+    for workers in args.workers:
+        print(f"\n=== 워커 {workers}개 ===")
+        results.append(await measure(workers, args))
+
+    baseline = results[0]["throughput"]
+    print(f"\n{'workers':>7} {'req/s':>9} {'배율':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'실패':>5} {'종료 s':>7}")
+    for result in results:
+        print(
+            f"{result['workers']:>7} {result['throughput']:>9.1f} {result['throughput'] / baseline:>6.2f} "
+            f"{result['p50']:>8.1f} {result['p95']:>8.1f} {result['p99']:>8.1f} {result['errors']:>5} {result['shutdown']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="워커 수별 위치 수신 처리량 비교")
+    parser.add_argument("--code", required=True, help="워치 인증에 사용할 등록코드")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--port", type=int, default=17777)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    asyncio.run(main(parser.parse_args()))
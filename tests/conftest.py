@@ -0,0 +1,62 @@
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+# 앱 모듈은 app/ 기준 import (cd app && python main.py 와 동일)
+sys.path.insert(0, str(ROOT / "app"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+# DB URL을 지정하지 않으면 임시 sqlite 파일 사용 (MySQL 전용 검사는 건너뜀)
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL_USER", f"sqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "60")
+
+import fakeredis  # noqa: E402
+
+import models  # noqa: E402,F401  모델 메타데이터 등록
+from db.base import Base  # noqa: E402
+from db.session import engine, async_engine  # noqa: E402
+from models.position_track import PositionTrack  # noqa: E402
+import utils.redis_client as redis_client  # noqa: E402
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_redis", fake)
+    return fake
+
+
+@pytest.fixture
+def database():
+    """테스트마다 빈 스키마 생성 (MySQL 대상일 때는 migrate.py가 적용된 DB를 그대로 사용)"""
+    if engine.dialect.name != "sqlite":
+        yield engine
+        return
+    # PositionTrack은 MySQL 파티션 테이블(복합 PK)이라 sqlite에서는 만들지 않음 (테스트에서는 버퍼에만 쌓임)
+    tables = [table for table in Base.metadata.sorted_tables if table.name != PositionTrack.__tablename__]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine, tables=tables)
+
+
+@pytest.fixture
+def run():
+    """코루틴을 새 이벤트 루프에서 실행 (루프가 바뀌므로 끝나면 커넥션 풀을 비움)"""
+    def run(coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await async_engine.dispose()
+        return asyncio.run(main())
+    return run
@@ -0,0 +1,72 @@
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import select
+
+from db.session import AsyncSessionLocal
+from crud.alert import create_geofence_breach_alert
+from crud.safe_zone import add_safe_zone
+from models.alert_history import AlertHistory, AlertType
+from models.caree import Caree, Gender
+from models.user import User
+from routes.alert import router
+from schema.safe_zone import SafeZoneCreateRequest
+from services.alert_state import alert_state
+from utils.auth import get_current_user_id
+
+USER_ID = "guardian"
+
+
+async def seed(db) -> int:
+    db.add(User(user_id=USER_ID, name="보호자", phone_number="010-0000-0000", password_hash="x"))
+    await db.flush()
+    caree = Caree(name="피보호자", gender=Gender.male, created_by_user_id=USER_ID)
+    db.add(caree)
+    await db.commit()
+    await add_safe_zone(db, USER_ID, SafeZoneCreateRequest(
+        zone_name="집", center_latitude=37.5665, center_longitude=126.9780, radius_meters=100
+    ))
+    return caree.caree_id
+
+
+def test_acknowledge_clears_cooldown_and_marks_alerts(database, redis, run):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user_id] = lambda: USER_ID
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            caree_id = await seed(db)
+            fired = await create_geofence_breach_alert(db, caree_id)
+            # cooldown 중에는 다시 알리지 않음
+            repeated = await create_geofence_breach_alert(db, caree_id)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/alert/acknowledge", json={"alert_type": "geofence_breach"})
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(AlertHistory))).scalars().all()
+            # 확인 후에는 cooldown 없이 다음 이탈을 바로 알림
+            refired = await create_geofence_breach_alert(db, caree_id)
+        await alert_state.flush()
+        return fired, repeated, response, rows, refired
+
+    fired, repeated, response, rows, refired = run(scenario())
+    assert fired and not repeated
+    assert response.status_code == 200, response.text
+    assert response.json() == {"success": True, "message": "알림을 확인했습니다.", "acknowledged_count": 1}
+    assert len(rows) == 1 and rows[0].is_acknowledged and rows[0].alert_type == AlertType.geofence_breach
+    assert refired
+
+
+def test_acknowledge_without_caree(database, redis, run):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user_id] = lambda: USER_ID
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post("/api/alert/acknowledge", json={"alert_type": "low_battery"})
+
+    response = run(scenario())
+    assert response.status_code == 200
+    assert response.json()["success"] is False
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+from services.geofence import GeofenceEngine
+
+CAREE_ID = 1
+
+
+class ZoneRows:
+    def __init__(self, zones):
+        self._zones = zones
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._zones
+
+
+class InvalidatedDuringRead:
+    """SELECT 실행 중 다른 요청이 안전구역을 변경하고 invalidate() 한 상황"""
+
+    def __init__(self, engine, zones):
+        self.engine = engine
+        self.zones = zones
+        self.selects = 0
+
+    async def execute(self, statement):
+        self.selects += 1
+        if self.selects == 1:
+            await self.engine.invalidate(CAREE_ID)
+        return ZoneRows(self.zones)
+
+
+def safe_zone(radius_meters=100):
+    return SimpleNamespace(
+        safe_zone_id=10,
+        caree_id=CAREE_ID,
+        center_latitude=37.5665,
+        center_longitude=126.9780,
+        radius_meters=radius_meters
+    )
+
+
+def test_fill_raced_by_invalidate_is_not_cached(run):
+    engine = GeofenceEngine()
+    db = InvalidatedDuringRead(engine, [safe_zone()])
+
+    async def scenario():
+        first = await engine.get_active_zones(db, CAREE_ID)
+        second = await engine.get_active_zones(db, CAREE_ID)
+        third = await engine.get_active_zones(db, CAREE_ID)
+        return first, second, third
+
+    first, second, third = run(scenario())
+    # 무효화와 겹친 첫 조회 결과는 캐시하지 않고, 다음 조회가 DB에서 다시 읽어 캐시
+    assert db.selects == 2
+    assert first == second == third
+
+
+def test_reconnect_epoch_discards_inflight_fill(run):
+    engine = GeofenceEngine()
+
+    class EpochBumpedDuringRead:
+        async def execute(self, statement):
+            engine._epoch += 1
+            return ZoneRows([safe_zone()])
+
+    run(engine.get_active_zones(EpochBumpedDuringRead(), CAREE_ID))
+    assert CAREE_ID not in engine._zones
@@ -0,0 +1,52 @@
+from services.home_snapshot import HomeSnapshotStore
+
+USER_ID = "guardian"
+SNAPSHOT = {
+    "protector_name": "보호자",
+    "caree_id": 1,
+    "caree_name": "피보호자",
+    "safe_zone_active": True,
+    "caree_in_safe_zone": True,
+    "safe_zone_radius_meters": 100
+}
+
+
+def test_rebuild_raced_by_write_path_is_not_stored(redis, run):
+    store = HomeSnapshotStore()
+
+    async def scenario():
+        version = await store.version(USER_ID)
+        # 재구성이 DB를 읽는 동안 워치 위치가 들어와 안전구역 이탈로 바뀜 (스냅샷이 없어 갱신은 무시됨)
+        await store.update_location(USER_ID, 1, False)
+        stored = await store.set(USER_ID, SNAPSHOT, version)
+        return stored, await store.get(USER_ID)
+
+    assert run(scenario()) == (False, None)
+
+
+def test_rebuild_raced_by_invalidate_is_not_stored(redis, run):
+    store = HomeSnapshotStore()
+
+    async def scenario():
+        version = await store.version(USER_ID)
+        await store.invalidate(USER_ID)
+        return await store.set(USER_ID, SNAPSHOT, version), await store.get(USER_ID)
+
+    assert run(scenario()) == (False, None)
+
+
+def test_stored_snapshot_is_patched_by_write_path(redis, run):
+    store = HomeSnapshotStore()
+
+    async def scenario():
+        await store.update_location(USER_ID, 1, False)
+        stored = await store.set(USER_ID, SNAPSHOT, await store.version(USER_ID))
+        await store.update_location(USER_ID, 1, False)
+        # 다른 피보호자의 갱신은 반영하지 않음
+        await store.update_caree(USER_ID, 2, "다른 피보호자")
+        return stored, await store.get(USER_ID), await redis.ttl(f"home:{USER_ID}")
+
+    stored, snapshot, ttl = run(scenario())
+    assert stored
+    assert snapshot == {**SNAPSHOT, "caree_in_safe_zone": False}
+    assert 0 < ttl <= store.ttl_seconds
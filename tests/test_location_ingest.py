@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from db.session import AsyncSessionLocal, async_engine
+from crud.location import get_latest_caree_location
+from crud.safe_zone import add_safe_zone
+from models.caree import Caree, Gender
+from models.user import User
+from schema.location import LocationBatchItem, LocationUpdateRequest
+from schema.safe_zone import SafeZoneCreateRequest
+from services.location_ingest import ingest_caree_locations
+from services.notification_queue import notification_dispatcher
+from services.position_store import position_store
+from services.watch_identity import WatchIdentity
+
+USER_ID = "guardian"
+LATITUDE, LONGITUDE = 37.5665, 126.9780
+
+
+async def seed(db) -> WatchIdentity:
+    db.add(User(user_id=USER_ID, name="보호자", phone_number="010-0000-0000", password_hash="x"))
+    await db.flush()
+    caree = Caree(name="피보호자", gender=Gender.male, created_by_user_id=USER_ID)
+    db.add(caree)
+    await db.commit()
+    await add_safe_zone(db, USER_ID, SafeZoneCreateRequest(
+        zone_name="집", center_latitude=LATITUDE, center_longitude=LONGITUDE, radius_meters=500
+    ))
+    return WatchIdentity(caree_id=caree.caree_id, name=caree.name, care_level=None, created_by_user_id=USER_ID)
+
+
+def ping(offset: float = 0.0, **fields) -> LocationUpdateRequest:
+    return LocationUpdateRequest(latitude=LATITUDE + offset, longitude=LONGITUDE, accuracy_meters=5.0, battery_level=80, **fields)
+
+
+def test_steady_state_ping_statement_budget(database, redis, run, monkeypatch):
+    """캐시가 채워진 뒤 위치 수신 한 건은 최신 위치 조회와 갱신 두 문장으로 끝남"""
+    monkeypatch.setattr(position_store, "_buffer", [])
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            identity = await seed(db)
+        # 첫 수신은 안전구역 캐시 적재와 최신 위치 추가
+        async with AsyncSessionLocal() as db:
+            await ingest_caree_locations(db, identity, [ping()])
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            per_ping = []
+            for i in range(10):
+                statements.clear()
+                async with AsyncSessionLocal() as db:
+                    await ingest_caree_locations(db, identity, [ping(i * 0.0001)])
+                per_ping.append(list(statements))
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        return per_ping
+
+    per_ping = run(scenario())
+    assert per_ping == [["SELECT", "UPDATE"]] * 10
+    assert len(position_store._buffer) == 11
+
+
+def test_late_ping_does_not_overwrite_latest_position(database, redis, run, monkeypatch):
+    monkeypatch.setattr(position_store, "_buffer", [])
+    now = datetime.now()
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            identity = await seed(db)
+        async with AsyncSessionLocal() as db:
+            await ingest_caree_locations(db, identity, [LocationBatchItem(**ping().model_dump(), recorded_at=now)])
+        # 오프라인 버퍼 업로드 등으로 더 이전 측정값이 늦게 도착
+        async with AsyncSessionLocal() as db:
+            late = LocationBatchItem(**ping(0.001).model_dump(), recorded_at=now - timedelta(minutes=5))
+            result = await ingest_caree_locations(db, identity, [late])
+        async with AsyncSessionLocal() as db:
+            return result, await get_latest_caree_location(db, identity.caree_id)
+
+    result, latest = run(scenario())
+    assert latest.recorded_at == now
+    assert float(latest.latitude) == LATITUDE
+    assert result.position.recorded_at == now
+    # 이동 경로에는 늦게 온 측정값도 기록됨
+    assert len(position_store._buffer) == 2
+
+
+def test_superseded_backfill_sends_no_alerts(database, redis, run, monkeypatch):
+    """최신 위치보다 이전 측정값만 담긴 백필은 이탈/배터리 알림을 보내지 않음"""
+    monkeypatch.setattr(position_store, "_buffer", [])
+    enqueued = []
+
+    async def enqueue(*args):
+        enqueued.append(args)
+
+    monkeypatch.setattr(notification_dispatcher, "enqueue", enqueue)
+    now = datetime.now()
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            identity = await seed(db)
+        async with AsyncSessionLocal() as db:
+            await ingest_caree_locations(db, identity, [LocationBatchItem(**ping().model_dump(), recorded_at=now)])
+        # 안전구역 밖, 배터리 부족이었던 지난 측정값이 늦게 도착
+        backfill = [
+            LocationBatchItem(latitude=LATITUDE + 0.1, longitude=LONGITUDE, battery_level=10, recorded_at=now - timedelta(minutes=2)),
+            LocationBatchItem(latitude=LATITUDE, longitude=LONGITUDE, battery_level=10, recorded_at=now)
+        ]
+        async with AsyncSessionLocal() as db:
+            return await ingest_caree_locations(db, identity, backfill)
+
+    result = run(scenario())
+    assert result.geofence_breach is False
+    assert result.battery_level is None
+    assert enqueued == []
+    assert len(position_store._buffer) == 3
+
+
+def test_timezone_aware_fixes_are_stored_as_local_naive(database, redis, run, monkeypatch):
+    monkeypatch.setattr(position_store, "_buffer", [])
+    aware = datetime.now(timezone.utc).replace(microsecond=0)
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            identity = await seed(db)
+        async with AsyncSessionLocal() as db:
+            fixes = [
+                LocationBatchItem(**ping().model_dump(), recorded_at=aware.astimezone(timezone(timedelta(hours=9)))),
+                LocationBatchItem(**ping().model_dump(), recorded_at=aware + timedelta(seconds=1))
+            ]
+            await ingest_caree_locations(db, identity, fixes)
+        async with AsyncSessionLocal() as db:
+            return await get_latest_caree_location(db, identity.caree_id)
+
+    latest = run(scenario())
+    local = aware.astimezone().replace(tzinfo=None)
+    assert [row["recorded_at"] for row in position_store._buffer] == [local, local + timedelta(seconds=1)]
+    assert latest.recorded_at == local + timedelta(seconds=1)
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+from db.session import AsyncSessionLocal
+from models.caree import Caree, Gender
+from models.user import User
+from routes.location import stream_caree_locations
+import services.location_stream as location_stream_module
+from services.location_stream import CHANNEL_PREFIX, LocationStreamHub, location_stream
+from services.token_verifier import Principal, token_verifier
+from utils.config import settings
+
+CAREE_ID = 1
+CLOSE_EVENT = 'event: close\ndata: {"reason": "token_expired"}\n\n'
+
+
+async def seed() -> None:
+    async with AsyncSessionLocal() as db:
+        db.add(User(user_id="guardian", name="보호자", phone_number="010-0000-0000", password_hash="x"))
+        await db.flush()
+        db.add(Caree(caree_id=CAREE_ID, name="피보호자", gender=Gender.female, created_by_user_id="guardian"))
+        await db.commit()
+
+
+async def read_stream_with_constant_events(principal: Principal, revoke_after: float = None):
+    """위치 이벤트를 heartbeat보다 짧은 간격으로 계속 보내면서 스트림이 닫힐 때까지 읽음"""
+    await seed()
+    response = await stream_caree_locations(principal)
+
+    async def feed():
+        while True:
+            location_stream._dispatch(CAREE_ID, '{"caree_id": 1}')
+            await asyncio.sleep(0.02)
+
+    async def read():
+        chunks = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk)
+            if revoke_after is not None and time.monotonic() - started >= revoke_after:
+                await token_verifier.revoke(principal)
+        return chunks
+
+    started = time.monotonic()
+    feeder = asyncio.create_task(feed())
+    try:
+        chunks = await asyncio.wait_for(read(), timeout=5)
+    finally:
+        feeder.cancel()
+    return chunks, time.monotonic() - started
+
+
+def test_stream_closes_after_logout_while_events_keep_arriving(database, redis, monkeypatch, run):
+    monkeypatch.setattr(settings, "LOCATION_STREAM_HEARTBEAT_SECONDS", 0.2)
+    principal = Principal(user_id="guardian", token_hash="logged-out", expires_at=None)
+
+    chunks, elapsed = run(read_stream_with_constant_events(principal, revoke_after=0.1))
+    assert chunks[-1] == CLOSE_EVENT
+    assert any(chunk.startswith("event: location") for chunk in chunks)
+    # 이벤트가 계속 와서 ping을 보낼 일이 없어도 heartbeat 간격 안에 닫힘
+    assert not any(chunk == ": ping\n\n" for chunk in chunks)
+    assert elapsed < 1.0
+
+
+def test_stream_closes_at_token_expiry(database, redis, monkeypatch, run):
+    monkeypatch.setattr(settings, "LOCATION_STREAM_HEARTBEAT_SECONDS", 15)
+    principal = Principal(user_id="guardian", token_hash="expiring", expires_at=time.time() + 0.3)
+
+    chunks, elapsed = run(read_stream_with_constant_events(principal))
+    assert chunks[-1] == CLOSE_EVENT
+    assert elapsed < 1.5
+
+
+async def subscriber_counts(redis, *caree_ids) -> list:
+    counts = dict(await redis.pubsub_numsub(*(f"{CHANNEL_PREFIX}{caree_id}" for caree_id in caree_ids)))
+    return [counts[f"{CHANNEL_PREFIX}{caree_id}"] for caree_id in caree_ids]
+
+
+_sleep = asyncio.sleep
+
+
+async def fast_sleep(delay, *args):
+    """재연결 대기(1초)를 줄임"""
+    return await _sleep(min(delay, 0.01), *args)
+
+
+async def wait_until(predicate, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        await _sleep(0.02)
+
+
+async def stop_hub(hub: LocationStreamHub) -> None:
+    # 구독 해제 응답을 읽는 중에 취소하면 fakeredis(asyncio.wait_for)가 취소를 삼킬 수 있어 응답을 먼저 소비
+    await _sleep(0.05)
+    await hub.stop()
+
+
+def test_worker_subscribes_only_to_carees_with_local_streams(redis, run):
+    """워커는 자기 프로세스에 구독자가 있는 피보호자 채널만 구독"""
+    hub = LocationStreamHub()
+
+    async def scenario():
+        await hub.start(redis)
+        try:
+            await wait_until(lambda: hub._pubsub is not None)
+            before = await subscriber_counts(redis, 1, 2)
+            async with hub.subscribe([1]) as queue:
+                during = await subscriber_counts(redis, 1, 2)
+                await hub.publish(2, {"caree_id": 2})
+                await hub.publish(1, {"caree_id": 1})
+                received = await asyncio.wait_for(queue.get(), timeout=3)
+                # 마지막 구독자가 나가면 채널 구독 해제
+                async with hub.subscribe([3]):
+                    joined = await subscriber_counts(redis, 3)
+                left = await subscriber_counts(redis, 3)
+            after = await subscriber_counts(redis, 1)
+            return before, during, received, joined, left, after
+        finally:
+            await stop_hub(hub)
+
+    before, during, received, joined, left, after = run(scenario())
+    assert before == [0, 0]
+    assert during == [1, 0]
+    assert received == '{"caree_id": 1}'
+    assert joined == [1] and left == [0]
+    assert after == [0]
+
+
+def test_failed_channel_change_reconnects_with_local_channels(redis, run, monkeypatch):
+    """구독 변경이 실패하면 이전 연결을 닫고 새 연결로 로컬 구독자의 채널을 모두 다시 구독"""
+    hub = LocationStreamHub()
+    monkeypatch.setattr(location_stream_module.asyncio, "sleep", fast_sleep)
+
+    async def scenario():
+        await hub.start(redis)
+        try:
+            await wait_until(lambda: hub._pubsub is not None)
+            async with hub.subscribe([1]) as first:
+                previous = hub._pubsub
+
+                async def broken_subscribe(*channels):
+                    raise ConnectionError("connection reset")
+
+                previous.subscribe = broken_subscribe
+                async with hub.subscribe([3]) as second:
+                    await wait_until(lambda: hub._pubsub not in (None, previous) and hub._channels == {1, 3})
+                    await hub.publish(1, {"caree_id": 1})
+                    await hub.publish(3, {"caree_id": 3})
+                    received = [
+                        await asyncio.wait_for(first.get(), timeout=3),
+                        await asyncio.wait_for(second.get(), timeout=3)
+                    ]
+            return previous, received
+        finally:
+            await stop_hub(hub)
+
+    previous, received = run(scenario())
+    assert previous.connection is None
+    assert received == ['{"caree_id": 1}', '{"caree_id": 3}']
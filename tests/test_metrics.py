@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from prometheus_client import REGISTRY
+
+from utils.metrics import MetricsMiddleware
+
+
+def latency_sum(route: str) -> float:
+    labels = {"method": "GET", "route": route, "status": "200"}
+    return REGISTRY.get_sample_value("http_request_duration_seconds_sum", labels) or 0.0
+
+
+def test_streaming_response_latency_stops_at_response_start(run):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/test-metrics/stream")
+    async def stream():
+        async def events():
+            for _ in range(3):
+                yield "data: ping\n\n"
+                await asyncio.sleep(0.2)
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/test-metrics/slow")
+    async def slow():
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            streamed = await client.get("/test-metrics/stream")
+            slow = await client.get("/test-metrics/slow")
+        return streamed, slow
+
+    before_stream, before_slow = latency_sum("/test-metrics/stream"), latency_sum("/test-metrics/slow")
+    streamed, slow = run(scenario())
+    assert streamed.text.count("data: ping") == 3 and slow.status_code == 200
+    # 스트림이 열려 있던 시간(약 0.6초)은 지연시간에 포함되지 않음
+    assert latency_sum("/test-metrics/stream") - before_stream < 0.1
+    # 일반 요청은 처리 시간이 그대로 기록됨
+    assert latency_sum("/test-metrics/slow") - before_slow >= 0.2
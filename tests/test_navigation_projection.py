@@ -0,0 +1,102 @@
+import copy
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from crud.navigation import NavigationService, get_navigation_service
+from routes.navigation import router
+from schema.navigation import RouteProjectionResponse
+from services.token_verifier import Principal
+from utils.auth import get_current_principal
+from utils.config import settings
+
+# 카카오 모빌리티 길찾기 응답 (vertexes는 [경도1, 위도1, 경도2, 위도2, ...])
+KAKAO_RESPONSE = {
+    "trans_id": "0190e1d6a2b87c6e8c3f7e3a1c5b0a11",
+    "routes": [{
+        "result_code": 0,
+        "result_msg": "길찾기 성공",
+        "summary": {
+            "origin": {"name": "", "x": 127.1112, "y": 37.3949},
+            "destination": {"name": "", "x": 127.1129, "y": 37.3962},
+            "waypoints": [],
+            "priority": "RECOMMEND",
+            "bound": {"min_x": 127.1112, "min_y": 37.3949, "max_x": 127.1129, "max_y": 37.3962},
+            "fare": {"taxi": 4800, "toll": 0},
+            "distance": 310,
+            "duration": 95
+        },
+        "sections": [{
+            "distance": 310,
+            "duration": 95,
+            "bound": {"min_x": 127.1112, "min_y": 37.3949, "max_x": 127.1129, "max_y": 37.3962},
+            "roads": [
+                {"name": "판교역로", "distance": 180, "duration": 50, "traffic_speed": 22.0, "traffic_state": 2,
+                 "vertexes": [127.1112, 37.3949, 127.1118, 37.3953, 127.1121, 37.3955]},
+                {"name": "", "distance": 130, "duration": 45, "traffic_speed": 18.0, "traffic_state": 3,
+                 "vertexes": [127.1121, 37.3955, 127.1125, 37.3959, 127.1129, 37.3962]}
+            ],
+            "guides": [{"name": "출발지", "x": 127.1112, "y": 37.3949, "distance": 0, "duration": 0,
+                        "type": 100, "guidance": "출발지", "road_index": 0}]
+        }]
+    }]
+}
+
+PATHS = [
+    "/navigation/route?origin=127.1112,37.3949&destination=127.1129,37.3962",
+    "/navigation/route/simple?origin_x=37.3949&origin_y=127.1112&destination_x=37.3962&destination_y=127.1129",
+    "/navigation/walking/route?origin=127.1112,37.3949&destination=127.1129,37.3962",
+    "/navigation/walking/route/simple?origin_x=37.3949&origin_y=127.1112&destination_x=37.3962&destination_y=127.1129"
+]
+
+
+class StubNavigationService(NavigationService):
+    """카카오 API 대신 고정 응답에 실제 vertexes 전처리만 적용"""
+
+    def _response(self):
+        response = copy.deepcopy(KAKAO_RESPONSE)
+        response["routes"] = self.process_routes(response["routes"])
+        return response
+
+    async def get_route(self, request):
+        return self._response()
+
+    async def get_walking_route(self, request):
+        return self._response()
+
+
+@pytest.fixture
+def navigation_app(monkeypatch):
+    monkeypatch.setattr(settings, "KAKAO_MOBILITY_API_KEY", "test-key")
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_navigation_service] = lambda: StubNavigationService()
+    app.dependency_overrides[get_current_principal] = lambda: Principal(user_id="guardian", token_hash="test", expires_at=None)
+    return app
+
+
+async def get(app: FastAPI, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("geometry", ["nested", "polyline", "float32"])
+@pytest.mark.parametrize("fields", [None, "summary,distance,duration,geometry", "geometry", "summary,duration", "distance,geometry"])
+@pytest.mark.parametrize("zoom", [None, 15])
+def test_projected_route_matches_response_model(navigation_app, run, path, geometry, fields, zoom):
+    """ORJSONResponse로 직접 반환하므로 response_model 검증을 거치지 않음: 응답이 스키마와 정확히 일치해야 함"""
+    query = f"{path}&geometry={geometry}"
+    if fields:
+        query += f"&fields={fields}"
+    if zoom is not None:
+        query += f"&zoom={zoom}"
+
+    response = run(get(navigation_app, query))
+    assert response.status_code == 200, response.text
+    body = response.json()
+    # 스키마에 없는 키나 타입이 다른 값이 있으면 검증 후 다시 직렬화한 결과가 달라짐
+    validated = RouteProjectionResponse.model_validate(body)
+    assert validated.model_dump(exclude_unset=True) == body
+    assert body["routes"]
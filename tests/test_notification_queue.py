@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+from services.notification_queue import (
+    GROUP_NAME,
+    NOTIFICATION_GEOFENCE_BREACH,
+    RETRY_KEY,
+    STREAM_KEY,
+    NotificationDispatcher
+)
+
+
+def dispatcher_with_sends(monkeypatch, send_seconds: float = 0.0, **kwargs) -> tuple:
+    dispatcher = NotificationDispatcher(worker_count=1, **kwargs)
+    sent = []
+
+    async def deliver(job):
+        sent.append(job["job_id"])
+        await asyncio.sleep(send_seconds)
+        return True
+
+    monkeypatch.setattr(dispatcher, "_deliver", deliver)
+    return dispatcher, sent
+
+
+async def pending_count(redis) -> int:
+    return (await redis.xpending(STREAM_KEY, GROUP_NAME))["pending"]
+
+
+def test_reclaimed_job_that_was_already_sent_is_acked_without_resending(redis, run, monkeypatch):
+    dispatcher, sent = dispatcher_with_sends(monkeypatch)
+    dispatcher._redis = redis
+
+    async def scenario():
+        await dispatcher._ensure_group()
+        job_id = await dispatcher.enqueue(NOTIFICATION_GEOFENCE_BREACH, 1, "피보호자")
+        # 전송과 상태 기록은 끝났지만 ACK 전에 워커가 죽은 경우
+        response = await redis.xreadgroup(GROUP_NAME, "crashed", {STREAM_KEY: ">"}, count=10)
+        message_id, fields = response[0][1][0]
+        await dispatcher._set_status({**json.loads(fields["job"]), "attempts": 1}, "sent")
+
+        await dispatcher._process_batch("scheduler", [(message_id, fields)])
+        return job_id, await dispatcher.get_job_status(job_id), await pending_count(redis)
+
+    job_id, status, pending = run(scenario())
+    assert sent == []
+    assert status["status"] == "sent"
+    assert pending == 0
+
+
+def test_finished_attempt_is_not_resent_or_requeued(redis, run, monkeypatch):
+    """재시도 대기로 넘긴 시도가 다시 전달되어도 전송하지 않고, 끝난 작업은 재시도 큐에 넣지 않음"""
+    dispatcher, sent = dispatcher_with_sends(monkeypatch)
+    dispatcher._redis = redis
+
+    async def scenario():
+        job = {"job_id": "job-1", "type": NOTIFICATION_GEOFENCE_BREACH, "caree_id": 1, "caree_name": "피보호자",
+               "battery_level": None, "attempts": 1}
+        await dispatcher._set_status(job, "retrying", "timeout")
+        resend = await dispatcher._set_status(job, "sending")
+        next_attempt = await dispatcher._set_status({**job, "attempts": 2}, "sending")
+        await dispatcher._set_status({**job, "attempts": 2}, "sent")
+        overwritten = await dispatcher._set_status({**job, "attempts": 2}, "retrying", "late failure")
+        return resend, next_attempt, overwritten, await dispatcher.get_job_status("job-1"), await redis.zcard(RETRY_KEY)
+
+    resend, next_attempt, overwritten, status, retries = run(scenario())
+    assert (resend, next_attempt, overwritten) == (False, True, False)
+    assert status["status"] == "sent" and status["attempts"] == "2"
+    assert retries == 0
+
+
+def test_slow_send_is_not_reclaimed_while_worker_is_alive(redis, run, monkeypatch):
+    """전송이 회수 idle 시간보다 오래 걸려도 처리 중인 워커가 idle 시간을 갱신하므로 회수되지 않음"""
+    dispatcher, sent = dispatcher_with_sends(monkeypatch, send_seconds=1.0, claim_idle_seconds=0.3)
+    dispatcher._redis = redis
+
+    async def reclaim() -> list:
+        # 재시도 스케줄러와 같은 조건으로 회수 시도
+        _, claimed, *_ = await redis.xautoclaim(
+            STREAM_KEY, GROUP_NAME, "scheduler", min_idle_time=dispatcher.claim_idle_ms, count=10
+        )
+        return claimed
+
+    async def scenario():
+        await dispatcher._ensure_group()
+        first = await dispatcher.enqueue(NOTIFICATION_GEOFENCE_BREACH, 1, "피보호자")
+        second = await dispatcher.enqueue(NOTIFICATION_GEOFENCE_BREACH, 2, "피보호자")
+        response = await redis.xreadgroup(GROUP_NAME, "worker", {STREAM_KEY: ">"}, count=10)
+        # 두 번째 작업은 첫 번째 전송이 끝날 때까지 배치 안에서 대기
+        processing = asyncio.create_task(dispatcher._process_batch("worker", response[0][1]))
+        await asyncio.sleep(0.8)
+        during_first = await reclaim()
+        await asyncio.sleep(0.8)
+        during_second = await reclaim()
+        await processing
+        return [first, second], during_first, during_second, await pending_count(redis)
+
+    job_ids, during_first, during_second, pending = run(scenario())
+    assert during_first == [] and during_second == []
+    assert sent == job_ids
+    assert pending == 0
@@ -0,0 +1,93 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+import routes.ops as ops_routes
+from db.session import AsyncSessionLocal
+from models.caree import Caree, Gender
+from models.position_history import PositionHistory, PositionType
+from models.safe_zone import SafeZone
+from models.user import User
+from services.geofence import GeofenceEngine
+from services.notification_queue import NOTIFICATION_LOW_BATTERY, notification_dispatcher
+from utils.config import settings
+
+OPS_TOKEN = "ops-test-token"
+HOME = (37.5665, 126.9780)
+
+
+@pytest.fixture
+def ops_app(monkeypatch, database):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", OPS_TOKEN)
+    monkeypatch.setattr(ops_routes, "geofence_engine", GeofenceEngine())
+    app = FastAPI()
+    app.include_router(ops_routes.router)
+    return app
+
+
+async def seed() -> None:
+    """피보호자 3명: 구역 안, 구역 밖, 구역 없음"""
+    async with AsyncSessionLocal() as db:
+        db.add(User(user_id="guardian", name="보호자", phone_number="010-0000-0000", password_hash="x"))
+        await db.flush()
+        for caree_id, latitude, has_zone in ((1, HOME[0], True), (2, HOME[0] + 0.05, True), (3, HOME[0] + 0.05, False)):
+            db.add(Caree(caree_id=caree_id, name=f"피보호자{caree_id}", gender=Gender.female, created_by_user_id="guardian"))
+            await db.flush()
+            if has_zone:
+                db.add(SafeZone(caree_id=caree_id, center_latitude=HOME[0], center_longitude=HOME[1], radius_meters=200, is_active=True))
+            db.add(PositionHistory(position_type=PositionType.caree, caree_id=caree_id, latitude=latitude, longitude=HOME[1]))
+        await db.commit()
+
+
+async def get(app: FastAPI, path: str, token=OPS_TOKEN, **params) -> httpx.Response:
+    headers = {"X-Ops-Token": token} if token else {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, params=params, headers=headers)
+
+
+def test_outside_sweep_reports_only_carees_outside_their_zones(ops_app, run):
+    async def scenario():
+        await seed()
+        return await get(ops_app, "/ops/geofence/outside")
+
+    response = run(scenario())
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_count"] == 1
+    assert body["carees"][0]["caree_id"] == 2
+
+
+def test_zones_containing_point(ops_app, run):
+    async def scenario():
+        await seed()
+        inside = await get(ops_app, "/ops/geofence/zones", latitude=HOME[0], longitude=HOME[1])
+        outside = await get(ops_app, "/ops/geofence/zones", latitude=HOME[0] + 0.05, longitude=HOME[1])
+        return inside, outside
+
+    inside, outside = run(scenario())
+    assert sorted(zone["caree_id"] for zone in inside.json()["safe_zones"]) == [1, 2]
+    assert outside.json()["total_count"] == 0
+
+
+def test_ops_token_required(ops_app, monkeypatch, run):
+    assert run(get(ops_app, "/ops/geofence/outside", token=None)).status_code == 403
+    assert run(get(ops_app, "/ops/geofence/outside", token="wrong")).status_code == 403
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "")
+    assert run(get(ops_app, "/ops/geofence/outside")).status_code == 404
+
+
+def test_notification_job_status(ops_app, redis, monkeypatch, run):
+    # 발송 워커는 띄우지 않고 큐에 추가된 상태만 확인
+    monkeypatch.setattr(notification_dispatcher, "_redis", redis)
+
+    async def scenario():
+        job_id = await notification_dispatcher.enqueue(NOTIFICATION_LOW_BATTERY, 7, "피보호자", 15)
+        found = await get(ops_app, f"/ops/notifications/{job_id}")
+        missing = await get(ops_app, "/ops/notifications/unknown")
+        return found, missing
+
+    found, missing = run(scenario())
+    assert found.status_code == 200
+    body = found.json()
+    assert (body["type"], body["caree_id"], body["status"], body["attempts"]) == (NOTIFICATION_LOW_BATTERY, 7, "queued", 0)
+    assert missing.status_code == 404
@@ -0,0 +1,44 @@
+import sys
+
+import migrate
+from services.position_store import PositionTrackStore, position_store
+
+
+def test_worker_start_runs_no_partition_ddl(run, monkeypatch):
+    """워커 기동/종료는 배치 저장 루프만 돌리고 파티션 관리는 하지 않음"""
+    calls = []
+
+    async def maintain():
+        calls.append("maintain")
+        return True
+
+    store = PositionTrackStore()
+    monkeypatch.setattr(store, "maintain_partitions", maintain)
+    monkeypatch.setattr(store, "ensure_partitions", maintain)
+    monkeypatch.setattr(store, "prune_partitions", maintain)
+
+    async def scenario():
+        await store.start()
+        tasks = list(store._tasks)
+        await store.stop()
+        return tasks
+
+    tasks = run(scenario())
+    assert len(tasks) == 1
+    assert calls == []
+
+
+def test_migrate_partitions_only_runs_maintenance(monkeypatch, redis):
+    calls = []
+
+    async def maintain():
+        calls.append("maintain")
+        return True
+
+    monkeypatch.setattr(position_store, "maintain_partitions", maintain)
+    monkeypatch.setattr(migrate.Base.metadata, "create_all", lambda **kwargs: calls.append("create_all"))
+    monkeypatch.setattr(migrate.command, "upgrade", lambda *args: calls.append("upgrade"))
+    monkeypatch.setattr(sys, "argv", ["migrate.py", "--partitions"])
+
+    migrate.main()
+    assert calls == ["maintain"]
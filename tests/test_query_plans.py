@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy.engine import make_url
+
+import query_plans
+from db.session import AsyncSessionLocal
+from services.geofence import GeofenceEngine
+from utils.variable import SQLALCHEMY_DATABASE_URL_USER
+
+requires_mysql = pytest.mark.skipif(
+    make_url(SQLALCHEMY_DATABASE_URL_USER).get_backend_name() != "mysql",
+    reason="EXPLAIN 실행계획 검사는 MySQL에서만 실행"
+)
+
+
+@requires_mysql
+def test_hot_queries_use_indexes(run):
+    plans = run(query_plans.collect_plans())
+    assert plans
+    assert query_plans.full_scans(plans) == []
+
+
+def test_active_zones_entry_matches_geofence_cache_miss(database, run):
+    """검사 대상 조회문이 캐시 미스 시 get_active_zones가 실행하는 SELECT와 같아야 함"""
+    query = dict(query_plans.HOT_QUERIES)["services.geofence.active_zones_query"]
+
+    async def cache_miss(db):
+        await GeofenceEngine().get_active_zones(db, query_plans.SAMPLE_CAREE_ID)
+
+    checked = run(query_plans.capture_selects(query))
+    executed = run(query_plans.capture_selects(cache_miss))
+    assert [statement for statement, _ in checked] == [statement for statement, _ in executed]
+    assert "is_active" in checked[0][0]
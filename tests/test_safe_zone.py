@@ -0,0 +1,50 @@
+from db.session import AsyncSessionLocal
+from crud.safe_zone import add_safe_zone, get_safe_zone_by_user, toggle_safe_zone_active, update_safe_zone
+from models.caree import Caree, Gender
+from models.user import User
+from schema.safe_zone import SafeZoneCreateRequest, SafeZoneUpdateRequest
+
+USER_ID = "guardian"
+
+
+def zone(name: str) -> SafeZoneCreateRequest:
+    return SafeZoneCreateRequest(zone_name=name, center_latitude=37.5665, center_longitude=126.9780, radius_meters=100)
+
+
+async def seed(db) -> None:
+    db.add(User(user_id=USER_ID, name="보호자", phone_number="010-0000-0000", password_hash="x"))
+    await db.flush()
+    db.add(Caree(name="피보호자", gender=Gender.male, created_by_user_id=USER_ID))
+    await db.commit()
+
+
+def test_zone_operations_target_given_safe_zone_id(database, redis, run):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            await seed(db)
+            home = await add_safe_zone(db, USER_ID, zone("집"))
+            school = await add_safe_zone(db, USER_ID, zone("복지관"))
+
+            updated = await update_safe_zone(db, USER_ID, SafeZoneUpdateRequest(radius_meters=300), home.safe_zone_id)
+            toggled = await toggle_safe_zone_active(db, USER_ID, home.safe_zone_id)
+            other = await get_safe_zone_by_user(db, USER_ID, school.safe_zone_id)
+            # safe_zone_id가 없으면 홈 화면 구역(활성 구역 중 최신)
+            default = await get_safe_zone_by_user(db, USER_ID)
+            return home, school, updated, toggled, other, default
+
+    home, school, updated, toggled, other, default = run(scenario())
+    assert updated.safe_zone_id == toggled.safe_zone_id == home.safe_zone_id
+    assert updated.radius_meters == 300
+    assert toggled.is_active is False
+    assert other.radius_meters == 100 and other.is_active
+    assert default.safe_zone_id == school.safe_zone_id
+
+
+def test_unknown_safe_zone_id_is_not_found(database, redis, run):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            await seed(db)
+            await add_safe_zone(db, USER_ID, zone("집"))
+            return await update_safe_zone(db, USER_ID, SafeZoneUpdateRequest(radius_meters=300), 999)
+
+    assert run(scenario()) is None
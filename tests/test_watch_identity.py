@@ -0,0 +1,82 @@
+from fastapi.security import HTTPAuthorizationCredentials
+
+import utils.watch_auth as watch_auth
+from db.session import AsyncSessionLocal
+from models.caree import Caree, Gender
+from models.registration_code import RegistrationCode
+from models.user import User
+from services.watch_identity import CODE_KEY_PREFIX, WatchIdentity, WatchIdentityCache
+
+CODE = "123456"
+IDENTITY = WatchIdentity(caree_id=1, name="피보호자", care_level=1, created_by_user_id="guardian")
+
+
+def test_fill_started_before_invalidate_is_not_cached(redis, run):
+    cache = WatchIdentityCache()
+
+    async def scenario():
+        version = await cache.fill_version()
+        await cache.invalidate(IDENTITY.caree_id)
+        stored = await cache.set(CODE, IDENTITY, version)
+        return stored, await cache.get(CODE), await redis.exists(f"{CODE_KEY_PREFIX}{CODE}")
+
+    assert run(scenario()) == (False, None, 0)
+
+
+def test_invalidate_from_another_worker_blocks_stale_fill(redis, run):
+    worker, other_worker = WatchIdentityCache(), WatchIdentityCache()
+
+    async def scenario():
+        version = await worker.fill_version()
+        # pub/sub 메시지가 도착하기 전에 저장을 시도해도 Redis의 무효화 표시로 거부됨
+        await other_worker.invalidate(IDENTITY.caree_id)
+        stored = await worker.set(CODE, IDENTITY, version)
+        return stored, await worker.get(CODE), await other_worker.get(CODE)
+
+    assert run(scenario()) == (False, None, None)
+
+
+def test_fill_after_invalidate_is_cached_and_shared(redis, run):
+    worker, other_worker = WatchIdentityCache(), WatchIdentityCache()
+
+    async def scenario():
+        await worker.invalidate(IDENTITY.caree_id)
+        version = await worker.fill_version()
+        stored = await worker.set(CODE, IDENTITY, version)
+        return stored, await worker.get(CODE), await other_worker.get(CODE)
+
+    stored, local, shared = run(scenario())
+    assert stored
+    assert local == shared == IDENTITY
+    assert worker.local_hits == 1 and other_worker.redis_hits == 1
+
+
+def test_code_revoked_during_auth_lookup_is_not_cached(database, redis, monkeypatch, run):
+    cache = WatchIdentityCache()
+    monkeypatch.setattr(watch_auth, "watch_identity_cache", cache)
+    lookup = watch_auth.get_registration_code_by_code
+
+    async def lookup_then_revoke(db, code):
+        # DB에서 등록코드를 읽은 직후 보호자가 등록코드를 재발급한 상황
+        record = await lookup(db, code)
+        await cache.invalidate(record.caree_id)
+        return record
+
+    monkeypatch.setattr(watch_auth, "get_registration_code_by_code", lookup_then_revoke)
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            db.add(User(user_id="guardian", name="보호자", phone_number="010-0000-0000", password_hash="x"))
+            await db.flush()
+            db.add(Caree(caree_id=1, name="피보호자", gender=Gender.female, created_by_user_id="guardian"))
+            await db.flush()
+            db.add(RegistrationCode(caree_id=1, registration_code=CODE))
+            await db.commit()
+
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=CODE)
+            identity = await watch_auth.get_caree_from_registration_code(credentials, db)
+        return identity, await cache.get(CODE)
+
+    identity, cached = run(scenario())
+    assert identity.caree_id == 1
+    assert cached is None